@@ -0,0 +1,53 @@
+"""
+조건부 GET (ETag / If-None-Match)
+라우트가 읽는 테이블의 데이터 버전으로 ETag를 만들고, 클라이언트가 보낸 ETag와 같으면
+엔드포인트의 쿼리를 실행하기 전에 304 Not Modified로 응답한다.
+
+사용 예:
+    @router.get("/nodes", response_model=BaseResponse,
+                dependencies=[Depends(conditional_get("nodes", "metrics"))])
+"""
+from fastapi import HTTPException, Request
+from typing import Callable, Optional
+import time
+
+from services.data_version_service import data_versions
+
+# 캐시는 허용하되 매번 재검증하도록 지시 (인증 응답이므로 private)
+CACHE_CONTROL = "private, no-cache"
+
+
+def _matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match 약한 비교 (여러 값, "*" 허용)"""
+    if not if_none_match:
+        return False
+    opaque = etag[2:] if etag.startswith("W/") else etag
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or (candidate[2:] if candidate.startswith("W/") else candidate) == opaque:
+            return True
+    return False
+
+
+def conditional_get(*tables: str, time_bucket: Optional[int] = None) -> Callable[[Request], None]:
+    """
+    조건부 GET 의존성 생성
+
+    Args:
+        tables: 응답이 의존하는 테이블 이름
+        time_bucket: 응답이 현재 시각에 따라 달라지는 경우(예: "오늘" 기준 요약) 구간 길이(초)
+
+    Returns:
+        Callable: 라우트 dependencies에 넣을 의존성 (일치하면 304 예외, 아니면 ETag를 request.state에 기록)
+    """
+    def dependency(request: Request) -> None:
+        parts = [request.url.path, request.url.query]
+        if time_bucket:
+            parts.append(str(int(time.time() // time_bucket)))
+        etag = data_versions.etag(tables, *parts)
+
+        if _matches(request.headers.get("if-none-match"), etag):
+            raise HTTPException(status_code=304, headers={"ETag": etag, "Cache-Control": CACHE_CONTROL})
+        request.state.etag = etag
+
+    return dependency
@@ -0,0 +1,269 @@
+"""
+ASGI 미들웨어
+요청별 응답 시간과 상태 코드를 request_metrics(대시보드 차트)와 Prometheus 레지스트리(/metrics)에 기록하고,
+조건부 GET 응답에 ETag 헤더를 추가하며, 큰 응답 본문을 gzip/brotli로 압축.
+요청마다 로그 컨텍스트(요청 ID, 라우트)를 연결해 요청 처리 중 남긴 로그에 함께 기록하고,
+샘플링된 요청은 추적 루트 스팬을 연다
+"""
+from starlette.datastructures import Headers, MutableHeaders
+from api.conditional import CACHE_CONTROL
+from api.static_assets import accepted_encodings
+from services.request_metrics_service import request_metrics
+from services.metrics_service import record_http_request
+from logs.context import bind_request, current_request, new_request_id, unbind_request
+from services.tracing_service import tracer
+import asyncio
+import gzip
+import time
+
+try:
+    import brotli
+except ImportError:
+    # brotli 미설치 시 gzip만 사용
+    brotli = None
+
+# 측정에서 제외할 경로 접두사 (정적 파일, 장시간 유지되는 스트림)
+EXCLUDED_PATH_PREFIXES = ("/static/", "/favicon.ico", "/api/live/stream")
+
+# 이보다 작은 응답은 압축하지 않음 (압축 이득보다 헤더/CPU 비용이 큼)
+COMPRESSION_MIN_SIZE = 1024
+
+# 본문 크기 상한별 (gzip 수준, brotli 품질): 클수록 낮은 수준으로 압축 시간을 제한
+# (로그 목록 JSON 기준 gzip 6은 64KB까지 0.5ms 미만, 2.8MB에서는 26ms라 큰 본문은 1로 낮춤)
+COMPRESSION_LEVELS = (
+    (64 * 1024, 6, 5),
+    (1024 * 1024, 4, 4),
+    (None, 1, 1),
+)
+
+# 이 크기 이상은 스레드에서 압축 (이벤트 루프 블로킹 방지)
+COMPRESSION_THREAD_THRESHOLD = 128 * 1024
+
+COMPRESSIBLE_CONTENT_TYPES = ("application/json", "text/", "application/javascript", "image/svg+xml")
+
+
+class RequestContextMiddleware:
+    """
+    요청 로그 컨텍스트 연결 + X-Request-ID 응답 헤더
+
+    클라이언트/프록시가 보낸 X-Request-ID가 올바른 형식이면 그대로 사용해 로그를 추적할 수 있게 한다.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = new_request_id(Headers(scope=scope).get("x-request-id"))
+        token = bind_request(request_id, scope)
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                message["headers"] = list(message.get("headers", [])) + [
+                    (b"x-request-id", request_id.encode("latin-1")),
+                ]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            unbind_request(token)
+
+
+class TracingMiddleware:
+    """
+    요청 추적 루트 스팬 (헤드 기반 샘플링, traceparent 헤더 이어받기)
+
+    스팬 이름은 응답 후 라우트 템플릿으로 정해진다 (예: GET /api/nodes/{node_name}).
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not tracer.enabled or scope["path"].startswith(EXCLUDED_PATH_PREFIXES):
+            await self.app(scope, receive, send)
+            return
+
+        headers = Headers(scope=scope)
+        context = current_request()
+        root = tracer.start_request(
+            f"{scope['method']} {scope['path']}", headers.get("traceparent"),
+            **{"http.method": scope["method"], "http.target": scope["path"],
+               "request.id": context.request_id if context else None}
+        )
+        if root is None:
+            await self.app(scope, receive, send)
+            return
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                root.attributes["http.status_code"] = message["status"]
+            await send(message)
+
+        token = tracer.activate(root)
+        error = None
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            route = getattr(scope.get("route"), "path", None)
+            if route:
+                root.name = f"{scope['method']} {route}"
+                root.attributes["http.route"] = route
+            tracer.finish(root, token, error)
+
+
+class RequestMetricsMiddleware:
+    """
+    순수 ASGI 미들웨어 (BaseHTTPMiddleware보다 오버헤드가 작고 스트리밍 응답을 버퍼링하지 않음)
+
+    응답 시간은 요청 수신부터 마지막 본문 청크 전송까지이며,
+    경로는 라우트 템플릿(예: /api/events/{event_id})으로 기록해 라벨 수를 제한한다.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"].startswith(EXCLUDED_PATH_PREFIXES):
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        status_code = 500
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            route = getattr(scope.get("route"), "path", "unmatched")
+            elapsed = time.perf_counter() - started
+            request_metrics.record(route, status_code, elapsed * 1000)
+            record_http_request(route, status_code, elapsed)
+
+
+class ETagMiddleware:
+    """
+    조건부 GET 의존성(api.conditional)이 계산한 ETag를 200 응답 헤더에 추가
+
+    엔드포인트가 Response를 직접 반환하는 고속 직렬화 경로에서도 동작하도록
+    ASGI 응답 시작 메시지에 헤더를 붙인다.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] not in ("GET", "HEAD"):
+            await self.app(scope, receive, send)
+            return
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start" and message["status"] == 200:
+                etag = scope.get("state", {}).get("etag")
+                if etag:
+                    message["headers"] = list(message.get("headers", [])) + [
+                        (b"etag", etag.encode("latin-1")),
+                        (b"cache-control", CACHE_CONTROL.encode("latin-1")),
+                    ]
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+
+class CompressionMiddleware:
+    """
+    API 응답 gzip/brotli 압축 (Accept-Encoding 협상)
+
+    - 본문을 한 번에 보내는 응답만 압축하고, 스트리밍 응답(SSE, 파일)은 그대로 통과시킨다.
+    - 압축 수준은 본문 크기에 따라 낮춰 지연 시간을 제한한다 (COMPRESSION_LEVELS).
+    - 큰 본문은 이벤트 루프를 막지 않도록 스레드에서 압축한다.
+    """
+
+    def __init__(self, app, minimum_size: int = COMPRESSION_MIN_SIZE):
+        self.app = app
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] == "HEAD" or scope["path"].startswith("/static/"):
+            await self.app(scope, receive, send)
+            return
+
+        encoding = _negotiate_encoding(Headers(scope=scope).get("accept-encoding"))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start_message = None
+        passthrough = False
+
+        async def send_wrapper(message):
+            nonlocal start_message, passthrough
+            if passthrough:
+                await send(message)
+                return
+            if message["type"] == "http.response.start":
+                start_message = message
+                return
+            if message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            headers = MutableHeaders(raw=start_message["headers"])
+            content_type = headers.get("content-type", "")
+            compressible = (
+                content_type.startswith(COMPRESSIBLE_CONTENT_TYPES)
+                and "content-encoding" not in headers
+                and start_message["status"] not in (204, 304)
+            )
+            if compressible:
+                headers.add_vary_header("Accept-Encoding")
+
+            if not compressible or message.get("more_body", False) or len(body) < self.minimum_size:
+                passthrough = True
+                await send(start_message)
+                await send(message)
+                return
+
+            if len(body) >= COMPRESSION_THREAD_THRESHOLD:
+                body = await asyncio.to_thread(_compress, body, encoding)
+            else:
+                body = _compress(body, encoding)
+            headers["Content-Encoding"] = encoding
+            headers["Content-Length"] = str(len(body))
+            passthrough = True
+            await send(start_message)
+            await send({"type": "http.response.body", "body": body, "more_body": False})
+
+        await self.app(scope, receive, send_wrapper)
+
+
+def _negotiate_encoding(accept_encoding):
+    """br(brotli 설치 시) > gzip 순으로 클라이언트가 허용한 인코딩 선택"""
+    accepted = accepted_encodings(accept_encoding)
+    if brotli is not None and "br" in accepted:
+        return "br"
+    if "gzip" in accepted:
+        return "gzip"
+    return None
+
+
+def _compress(body: bytes, encoding: str) -> bytes:
+    for max_size, gzip_level, brotli_quality in COMPRESSION_LEVELS:
+        if max_size is None or len(body) < max_size:
+            break
+    if encoding == "br":
+        return brotli.compress(body, quality=brotli_quality)
+    return gzip.compress(body, compresslevel=gzip_level, mtime=0)
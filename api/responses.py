@@ -0,0 +1,129 @@
+"""
+BaseResponse 고속 직렬화 경로
+라우트가 반환한 BaseResponse를 FastAPI의 response_model 재검증 없이 한 번에 JSON 바이트로 직렬화한다.
+
+기본 경로에서는 BaseResponse → dict 변환(_prepare_response_content) → response_model 재검증 →
+jsonable 변환 → json.dumps 순으로 같은 데이터를 네 번 훑는다. 여기서는 pydantic-core의
+Rust 직렬화기(to_json)로 모델(중첩 모델, datetime 포함)을 바로 바이트로 만든다.
+
+요청이 추적(services.tracing_service) 중이면 라우트 처리를 dependencies(파라미터 검증/의존성),
+endpoint, serialize 구간 스팬으로 나눠 기록한다.
+
+라우트 SQL 실행 시간 예산(services.query_timeout_service)을 넘으면 TIMEOUT 오류 응답(504)을 반환한다.
+"""
+from fastapi.routing import APIRoute
+from fastapi.responses import JSONResponse
+from starlette.responses import Response
+from pydantic_core import to_json
+from typing import Any, Callable
+import asyncio
+import functools
+import inspect
+
+import db.database  # noqa: F401  (models 패키지보다 먼저 로드해야 순환 임포트가 생기지 않음)
+from models.base_response import BaseResponse
+from services.query_timeout_service import QueryTimeoutError
+from services.tracing_service import current_span, span
+
+
+class FastJSONResponse(JSONResponse):
+    """pydantic-core로 직렬화하는 JSON 응답 (BaseModel, dict, list, datetime 모두 허용)"""
+
+    def render(self, content: Any) -> bytes:
+        return to_json(content)
+
+
+def fast_response(content: BaseResponse, status_code: int = 200) -> FastJSONResponse:
+    """BaseResponse를 재검증 없이 바로 응답으로 변환"""
+    return FastJSONResponse(content, status_code=status_code)
+
+
+def _record_dependencies_phase() -> None:
+    """라우트 스팬 시작부터 엔드포인트 호출 직전까지(요청 파싱/검증, 의존성 실행)를 dependencies 스팬으로 기록"""
+    route_span = current_span()
+    if route_span is not None:
+        route_span.child("dependencies", start_ns=route_span.start_ns).end()
+
+
+def _serialize(result: Any) -> Any:
+    if not isinstance(result, BaseResponse):
+        return result
+    if current_span() is None:
+        return fast_response(result)
+    with span("serialize"):
+        return fast_response(result)
+
+
+def _timeout_response(error: QueryTimeoutError) -> FastJSONResponse:
+    return fast_response(BaseResponse.error_response(
+        message="요청 처리 시간이 초과되었습니다. 조회 범위를 줄여 다시 시도해주세요.",
+        error_code="TIMEOUT",
+        details=str(error)
+    ), status_code=504)
+
+
+def _wrap_endpoint(endpoint: Callable) -> Callable:
+    """BaseResponse 반환값을 FastJSONResponse로 감싸는 엔드포인트 래퍼 (시그니처는 functools.wraps로 유지)"""
+    if asyncio.iscoroutinefunction(endpoint):
+        @functools.wraps(endpoint)
+        async def async_wrapper(*args, **kwargs):
+            _record_dependencies_phase()
+            try:
+                with span("endpoint"):
+                    result = await endpoint(*args, **kwargs)
+            except QueryTimeoutError as e:
+                return _timeout_response(e)
+            return _serialize(result)
+        async_wrapper._base_response_wrapped = True
+        return async_wrapper
+
+    # 동기 엔드포인트는 스레드풀에서 실행되므로 직렬화도 이벤트 루프 밖에서 처리됨
+    @functools.wraps(endpoint)
+    def sync_wrapper(*args, **kwargs):
+        _record_dependencies_phase()
+        try:
+            with span("endpoint"):
+                result = endpoint(*args, **kwargs)
+        except QueryTimeoutError as e:
+            return _timeout_response(e)
+        return _serialize(result)
+    sync_wrapper._base_response_wrapped = True
+    return sync_wrapper
+
+
+def _uses_sub_response(endpoint: Callable, kwargs: dict) -> bool:
+    """상태 코드/헤더를 FastAPI가 채워 넣어야 하는 라우트인지 (Response 주입 파라미터 또는 고정 status_code)"""
+    if kwargs.get("status_code") is not None:
+        return True
+    for parameter in inspect.signature(endpoint).parameters.values():
+        annotation = parameter.annotation
+        if inspect.isclass(annotation) and issubclass(annotation, Response):
+            return True
+    return False
+
+
+class BaseResponseRoute(APIRoute):
+    """
+    BaseResponse를 반환하는 라우트용 APIRoute
+
+    엔드포인트가 Response를 반환하면 FastAPI는 response_model 검증/직렬화를 건너뛰므로,
+    BaseResponse 반환값을 FastJSONResponse로 바꿔 직렬화를 한 번만 수행한다.
+    response_model은 그대로 두어 OpenAPI 문서는 유지된다.
+    """
+
+    def __init__(self, path: str, endpoint: Callable, **kwargs: Any):
+        # include_router가 라우트를 다시 만들 때 이미 감싼 엔드포인트를 또 감싸지 않음
+        if not _uses_sub_response(endpoint, kwargs) and not getattr(endpoint, "_base_response_wrapped", False):
+            endpoint = _wrap_endpoint(endpoint)
+        super().__init__(path, endpoint, **kwargs)
+
+    def get_route_handler(self) -> Callable:
+        handler = super().get_route_handler()
+
+        async def traced_handler(request):
+            if current_span() is None:
+                return await handler(request)
+            with span("route", **{"http.route": self.path}):
+                return await handler(request)
+
+        return traced_handler
@@ -4,6 +4,7 @@
 """
 from fastapi import APIRouter, HTTPException, Depends, Request
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from api.responses import BaseResponseRoute
 from sqlalchemy.orm import Session
 from argon2 import PasswordHasher
 import os
@@ -19,13 +20,14 @@ sys.path.append(project_root)
 from logs import log_manager
 from models.base_response import BaseResponse
 # Refactored imports
-from models.admin import AdminStats
+from models.admin import AdminStats, LogLevelUpdate, LogSiteLimit
 from models.user import UserCreate, UserUpdate, UserPublic, UserListPublic
 from db.database import get_db
 from services.admin_service import AdminDatabaseService
+from services.slow_query_service import slow_query_log
 
 # 라우터 생성
-router = APIRouter(prefix="/api/admin", tags=["admin"])
+router = APIRouter(prefix="/api/admin", tags=["admin"], route_class=BaseResponseRoute)
 
 # 보안 스키마
 security = HTTPBearer()
@@ -198,4 +200,52 @@ async def delete_user(
         raise
     except Exception as e:
         log_manager.logger.error(f"사용자 삭제 중 오류 발생: {e}")
-        raise HTTPException(status_code=500, detail="사용자 삭제 중 오류가 발생했습니다.")
\ No newline at end of file
+        raise HTTPException(status_code=500, detail="사용자 삭제 중 오류가 발생했습니다.")
+
+def _logging_config() -> dict:
+    return {
+        "levels": log_manager.get_levels(),
+        "json_output": log_manager.json_output,
+        "default_rate_limit": log_manager.limiter.default_rate,
+        "sites": log_manager.limiter.sites(),
+        "queue": log_manager.stats(),
+    }
+
+@router.get("/logging", response_model=BaseResponse)
+async def get_logging_config(current_user: UserPublic = Depends(verify_admin_token)):
+    """로그 레벨/호출 위치별 제한 설정과 기록 큐 상태 조회"""
+    return BaseResponse.success_response(data=_logging_config(), message="로그 설정을 조회했습니다.")
+
+@router.put("/logging/level", response_model=BaseResponse)
+async def update_log_level(update: LogLevelUpdate, current_user: UserPublic = Depends(verify_admin_token)):
+    """실행 중 로그 레벨 변경 (요청을 처리한 워커 프로세스에만 적용)"""
+    try:
+        level = log_manager.set_level(update.level, update.logger)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    log_manager.logger.warning(f"로그 레벨 변경: {update.logger or log_manager.logger.name} → {level}")
+    return BaseResponse.success_response(data=_logging_config(), message="로그 레벨을 변경했습니다.")
+
+@router.put("/logging/sites", response_model=BaseResponse)
+async def update_log_site_limit(limit: LogSiteLimit, current_user: UserPublic = Depends(verify_admin_token)):
+    """호출 위치별 속도 제한/샘플링 설정 (요청을 처리한 워커 프로세스에만 적용)"""
+    log_manager.limiter.set_site(limit.site, limit.rate, limit.sample)
+    log_manager.logger.warning(f"로그 호출 위치 제한 변경: {limit.site} rate={limit.rate} sample={limit.sample}")
+    return BaseResponse.success_response(data=_logging_config(), message="로그 호출 위치 제한을 변경했습니다.")
+
+@router.get("/slow-queries", response_model=BaseResponse)
+async def get_slow_queries(sort_by: str = "total_ms", limit: int = 20,
+                           current_user: UserPublic = Depends(verify_admin_token)):
+    """느린 쿼리 보고서 (지문별 집계, sort_by 기준 내림차순, 지문별 첫 실행의 EXPLAIN 포함, 이 워커 프로세스 기준)"""
+    try:
+        report = slow_query_log.report(sort_by, max(1, min(limit, 200)))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return BaseResponse.success_response(data=report, message="느린 쿼리 보고서를 조회했습니다.")
+
+@router.delete("/slow-queries", response_model=BaseResponse)
+async def reset_slow_queries(current_user: UserPublic = Depends(verify_admin_token)):
+    """느린 쿼리 집계 초기화 (인덱스 추가 등 조치 후 다시 측정할 때)"""
+    slow_query_log.reset()
+    log_manager.logger.info("느린 쿼리 집계 초기화")
+    return BaseResponse.success_response(message="느린 쿼리 집계를 초기화했습니다.")
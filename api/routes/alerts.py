@@ -13,23 +13,51 @@ from models import (
     AlertSummary,
     AlertRule,
     AlertRuleList,
-    AlertRuleUpdate
+    AlertRuleUpdate,
+    AlertRuleBacktestRequest,
+    AlertBacktestResult,
+    Silence,
+    SilenceCreate,
+    SilenceList
 )
+from models.alert import AlertRuleDB, SilenceDB
 from api.routes.auth import get_current_user_from_token
+from api.responses import BaseResponseRoute
+from api.conditional import conditional_get
+from services.coalescing_service import coalesce
+from services.silence_service import silence_index
+from typing import Optional
+import json
 import random
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 
 # 라우터 생성
 router = APIRouter(
     prefix="/api",
     tags=["alerts"],
-    dependencies=[Depends(get_current_user_from_token)]
+    dependencies=[Depends(get_current_user_from_token)],
+    route_class=BaseResponseRoute
 )
 
+def _alert_labels(alert: Alert) -> dict:
+    """사일런스 라벨 매칭에 사용할 알림 라벨"""
+    return {
+        "alert_type": alert.alert_type,
+        "severity": alert.severity,
+        "source": alert.source
+    }
+
+def _apply_silences(alert: Alert) -> Alert:
+    """사일런스 대상인 활성 알림을 Suppressed 상태로 변경"""
+    if alert.status == "Active" and silence_index.is_silenced(alert.target, _alert_labels(alert)):
+        alert.status = "Suppressed"
+    return alert
+
 @router.get("/alerts", response_model=BaseResponse)
-def get_alerts():
+def get_alerts(db: Session = Depends(get_db)):
     """알림 목록 조회"""
     try:
+        silence_index.ensure_loaded(db)
         alerts = []
         alert_types = ["High Memory Usage", "High CPU Usage", "Container Restart Loop", "Disk Space Low", "High Network Traffic", "Pod Scheduled"]
         severities = ["Critical", "Warning", "Info"]
@@ -49,12 +77,16 @@ def get_alerts():
                 source=random.choice(["kubelet", "deployment-controller", "service-controller"])
             ))
         
+        # 사일런스 적용 (Suppressed 알림은 심각도 집계에서 제외)
+        alerts = [_apply_silences(a) for a in alerts]
+        firing = [a for a in alerts if a.status != "Suppressed"]
+        
         alert_list = AlertList(
             alerts=alerts,
             summary=AlertSummary(
-                critical=len([a for a in alerts if a.severity == "Critical"]),
-                warning=len([a for a in alerts if a.severity == "Warning"]),
-                info=len([a for a in alerts if a.severity == "Info"]),
+                critical=len([a for a in firing if a.severity == "Critical"]),
+                warning=len([a for a in firing if a.severity == "Warning"]),
+                info=len([a for a in firing if a.severity == "Info"]),
                 resolved=len([a for a in alerts if a.status == "Resolved"]),
                 # 변화량 데이터 (화살표 방향 표시용)
                 critical_change=random.choice([f"{random.choice(['+', '-'])}{random.randint(0, 3)}%", "0%"]),
@@ -76,9 +108,10 @@ def get_alerts():
         )
 
 @router.get("/alerts/{alert_id}", response_model=BaseResponse)
-def get_alert(alert_id: str):
+def get_alert(alert_id: str, db: Session = Depends(get_db)):
     """특정 알림 기본 정보 조회"""
     try:
+        silence_index.ensure_loaded(db)
         # 실제 구현에서는 데이터베이스에서 특정 알림 정보를 가져옴
         alert = Alert(
             id=alert_id,
@@ -91,6 +124,7 @@ def get_alert(alert_id: str):
             duration=f"{random.randint(5, 60)}분",
             source=random.choice(["kubelet", "deployment-controller", "service-controller"])
         )
+        alert = _apply_silences(alert)
         
         return BaseResponse.success_response(
             data=alert.dict(),
@@ -209,7 +243,9 @@ def resolve_alert(alert_id: str):
             details=str(e)
         )
 
-@router.get("/alert-rules", response_model=BaseResponse)
+@router.get("/alert-rules", response_model=BaseResponse,
+            dependencies=[Depends(conditional_get("alert_rules"))])
+@coalesce(ttl=1.0, versions=("alert_rules",))
 def get_alert_rules(db: Session = Depends(get_db)):
     """알림 규칙 목록 조회"""
     try:
@@ -335,4 +371,222 @@ def delete_alert_rule(rule_id: str, db: Session = Depends(get_db)):
             message="Failed to delete alert rule",
             error_code="DATABASE_ERROR",
             details=str(e)
-        )
\ No newline at end of file
+        )
+
+@router.post("/alert-rules/{rule_id}/backtest", response_model=BaseResponse)
+def backtest_alert_rule(rule_id: str, request: Optional[AlertRuleBacktestRequest] = None, db: Session = Depends(get_db)):
+    """알림 규칙 백테스트 (과거 메트릭 기준 발생 횟수/시점/지속시간 계산)"""
+    # numpy를 쓰는 서비스라 워커 시작 시간에 포함되지 않도록 처음 호출할 때 로드
+    from services.alert_backtest_service import AlertBacktestService, MAX_BACKTEST_DAYS, min_step_seconds
+
+    try:
+        request = request or AlertRuleBacktestRequest()
+
+        # "RULE-001" 형식의 ID에서 숫자 부분만 추출
+        try:
+            rule_numeric_id = int(rule_id.split('-')[1])
+        except (IndexError, ValueError):
+            return BaseResponse.error_response(
+                message="Invalid rule ID format",
+                error_code="INVALID_RULE_ID",
+                details="Rule ID must be in format 'RULE-XXX'"
+            )
+
+        if not 1 <= request.days <= MAX_BACKTEST_DAYS:
+            return BaseResponse.error_response(
+                message="Invalid backtest period",
+                error_code="VALIDATION_ERROR",
+                details=f"days must be between 1 and {MAX_BACKTEST_DAYS}"
+            )
+
+        # 해상도가 너무 촘촘하면 대상마다 버킷이 수십만 개 만들어지므로 포인트 수 상한에 맞춰 제한
+        if request.step_seconds is not None:
+            min_step, max_step = min_step_seconds(request.days), request.days * 86400
+            if not min_step <= request.step_seconds <= max_step:
+                return BaseResponse.error_response(
+                    message="Invalid backtest step",
+                    error_code="VALIDATION_ERROR",
+                    details=f"step_seconds must be between {min_step} and {max_step} for {request.days} day(s)"
+                )
+
+        if request.limit < 1:
+            return BaseResponse.error_response(
+                message="Invalid backtest limit",
+                error_code="VALIDATION_ERROR",
+                details="limit must be at least 1"
+            )
+
+        rule_db = db.query(AlertRuleDB).filter(AlertRuleDB.id == rule_numeric_id).first()
+
+        if not rule_db:
+            return BaseResponse.error_response(
+                message="Alert rule not found",
+                error_code="NOT_FOUND",
+                details=f"Rule with id {rule_id} not found"
+            )
+
+        backtest_service = AlertBacktestService(db)
+        try:
+            result = backtest_service.backtest(
+                rule_db,
+                days=request.days,
+                step_seconds=request.step_seconds,
+                limit=request.limit
+            )
+        except ValueError as e:
+            return BaseResponse.error_response(
+                message="Alert rule condition cannot be backtested",
+                error_code="INVALID_CONDITION",
+                details=str(e)
+            )
+
+        return BaseResponse.success_response(
+            data=AlertBacktestResult(**result).dict(),
+            message="Alert rule backtest completed successfully"
+        )
+
+    except Exception as e:
+        return BaseResponse.error_response(
+            message="Failed to backtest alert rule",
+            error_code="DATABASE_ERROR",
+            details=str(e)
+        )
+
+def _to_utc_naive(value: datetime) -> datetime:
+    """타임존이 있는 입력을 DB 저장 형식(naive UTC)으로 변환"""
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+def _silence_to_pydantic(silence_db: SilenceDB) -> Silence:
+    now = datetime.utcnow()
+    if silence_db.ends_at <= now:
+        status = "Expired"
+    elif silence_db.starts_at > now:
+        status = "Pending"
+    else:
+        status = "Active"
+
+    return Silence(
+        id=f"SIL-{silence_db.id:03d}",
+        target=silence_db.target,
+        labels=json.loads(silence_db.labels or "{}"),
+        starts_at=silence_db.starts_at.isoformat() + "Z",
+        ends_at=silence_db.ends_at.isoformat() + "Z",
+        status=status,
+        created_by=silence_db.created_by,
+        comment=silence_db.comment,
+        created_at=silence_db.created_at.isoformat() + "Z"
+    )
+
+@router.get("/silences", response_model=BaseResponse,
+            dependencies=[Depends(conditional_get("silences", time_bucket=60))])
+def get_silences(include_expired: bool = False, db: Session = Depends(get_db)):
+    """사일런스 목록 조회 (기본값: 만료되지 않은 사일런스만)"""
+    try:
+        query = db.query(SilenceDB)
+        if not include_expired:
+            query = query.filter(SilenceDB.ends_at > datetime.utcnow())
+        silences_db = query.order_by(SilenceDB.ends_at.desc()).all()
+
+        silence_list = SilenceList(silences=[_silence_to_pydantic(s) for s in silences_db])
+
+        return BaseResponse.success_response(
+            data=silence_list.dict(),
+            message="Silences retrieved successfully"
+        )
+    except Exception as e:
+        return BaseResponse.error_response(
+            message="Failed to retrieve silences",
+            error_code="DATABASE_ERROR",
+            details=str(e)
+        )
+
+@router.post("/silences", response_model=BaseResponse)
+def create_silence(silence: SilenceCreate, db: Session = Depends(get_db), current_user=Depends(get_current_user_from_token)):
+    """사일런스 등록 (유지보수 구간 동안 대상 알림 음소거)"""
+    try:
+        if not silence.target and not silence.labels:
+            return BaseResponse.error_response(
+                message="Silence must have at least one matcher",
+                error_code="VALIDATION_ERROR",
+                details="Either 'target' or 'labels' is required"
+            )
+
+        starts_at = _to_utc_naive(silence.starts_at) if silence.starts_at else datetime.utcnow()
+        ends_at = _to_utc_naive(silence.ends_at)
+        if ends_at <= starts_at:
+            return BaseResponse.error_response(
+                message="Invalid silence period",
+                error_code="VALIDATION_ERROR",
+                details="ends_at must be later than starts_at"
+            )
+
+        silence_db = SilenceDB(
+            target=silence.target,
+            labels=json.dumps(silence.labels, ensure_ascii=False),
+            starts_at=starts_at,
+            ends_at=ends_at,
+            created_by=current_user.username,
+            comment=silence.comment
+        )
+        db.add(silence_db)
+        db.commit()
+        db.refresh(silence_db)
+
+        silence_index.ensure_loaded(db)
+        silence_index.add(silence_db.id, silence_db.target, silence.labels, starts_at, ends_at)
+
+        return BaseResponse.success_response(
+            data={"silence": _silence_to_pydantic(silence_db).dict(), "created": True},
+            message="Silence created successfully"
+        )
+    except Exception as e:
+        db.rollback()
+        return BaseResponse.error_response(
+            message="Failed to create silence",
+            error_code="DATABASE_ERROR",
+            details=str(e)
+        )
+
+@router.delete("/silences/{silence_id}", response_model=BaseResponse)
+def expire_silence(silence_id: str, db: Session = Depends(get_db)):
+    """사일런스 즉시 만료 처리"""
+    try:
+        # "SIL-001" 형식의 ID에서 숫자 부분만 추출
+        try:
+            silence_numeric_id = int(silence_id.split('-')[1])
+        except (IndexError, ValueError):
+            return BaseResponse.error_response(
+                message="Invalid silence ID format",
+                error_code="INVALID_SILENCE_ID",
+                details="Silence ID must be in format 'SIL-XXX'"
+            )
+
+        silence_db = db.query(SilenceDB).filter(SilenceDB.id == silence_numeric_id).first()
+
+        if not silence_db:
+            return BaseResponse.error_response(
+                message="Silence not found",
+                error_code="NOT_FOUND",
+                details=f"Silence with id {silence_id} not found"
+            )
+
+        # 이력 보존을 위해 삭제 대신 종료 시간을 현재로 당김
+        now = datetime.utcnow()
+        if silence_db.ends_at > now:
+            silence_db.ends_at = now
+            db.commit()
+        silence_index.remove(silence_numeric_id)
+
+        return BaseResponse.success_response(
+            data={"silence_id": silence_id, "expired": True},
+            message="Silence expired successfully"
+        )
+    except Exception as e:
+        db.rollback()
+        return BaseResponse.error_response(
+            message="Failed to expire silence",
+            error_code="DATABASE_ERROR",
+            details=str(e)
+        )
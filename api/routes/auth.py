@@ -9,11 +9,16 @@ from typing import Optional
 from sqlalchemy import text
 from sqlalchemy.orm import Session
 from db.database import get_db
+from api.responses import BaseResponseRoute
+from logs.context import bind_user
+from services.metrics_service import record_cache
+from services.shared_cache_service import session_cache
 import os
 import sys
 from argon2 import PasswordHasher
 from argon2.exceptions import VerifyMismatchError
 from datetime import datetime, timedelta
+from collections import namedtuple
 import secrets
 
 current_file = os.path.abspath(__file__) 
@@ -28,13 +33,27 @@ except Exception as e:
     print(f"임포트 실패: {e}")
 
 # 라우터 생성
-router = APIRouter(prefix="/api/auth", tags=["auth"])
+router = APIRouter(prefix="/api/auth", tags=["auth"], route_class=BaseResponseRoute)
 
 # 보안 스키마
 security = HTTPBearer()
 
-async def get_current_user_from_token(credentials: HTTPAuthorizationCredentials = Depends(security), db: Session = Depends(get_db)):
-    token = credentials.credentials
+# 인증된 세션을 워커 간 공유 캐시에 두는 시간 (초, 세션 만료 시각을 넘지 않음)
+SESSION_CACHE_TTL = float(os.getenv("SESSION_CACHE_TTL", "60"))
+
+# 캐시에서 꺼낸 사용자 (DB 행과 같은 속성으로 접근)
+CachedUser = namedtuple("CachedUser", "id username email role")
+
+def authenticate_token(token: str, db: Session):
+    """세션 토큰으로 사용자 조회 (유효하지 않으면 HTTPException 401)"""
+    # 0. 워커 간 공유 캐시 (로그아웃/사용자 변경 시 무효화)
+    cached = session_cache.get(token)
+    if cached is not None:
+        record_cache("session", 1, 0)
+        user = CachedUser(*cached)
+        bind_user(user.id)
+        return user
+    record_cache("session", 0, 1)
 
     # 1. 세션 테이블에서 토큰 조회
     session = db.execute(text(
@@ -71,8 +90,16 @@ async def get_current_user_from_token(credentials: HTTPAuthorizationCredentials
         # 세션은 있지만 해당 유저가 없는 경우 (예: 유저 삭제됨)
         raise HTTPException(status_code=401, detail="사용자를 찾을 수 없습니다.")
 
+    ttl = min(SESSION_CACHE_TTL, (session.expires_at - datetime.utcnow()).total_seconds())
+    if ttl > 0:
+        session_cache.set(token, (user.id, user.username, user.email, user.role), ttl)
+
+    bind_user(user.id)
     return user
 
+async def get_current_user_from_token(credentials: HTTPAuthorizationCredentials = Depends(security), db: Session = Depends(get_db)):
+    return authenticate_token(credentials.credentials, db)
+
 @router.post("/login")
 async def login(request: LoginRequest, db: Session = Depends(get_db)):
     """사용자 로그인"""
@@ -193,11 +220,12 @@ async def logout(credentials: HTTPAuthorizationCredentials = Depends(security),
         SELECT user_id FROM sessions WHERE session_token = :token
         """), {'token': token}).first()
 
-    # 세션 테이블에서 토큰 삭제
+    # 세션 테이블에서 토큰 삭제 (모든 워커의 공유 캐시에서도 제거)
     result = db.execute(text(
         """
         DELETE FROM sessions WHERE session_token = :token
         """), {'token': token})
+    session_cache.delete(token)
 
     if result.rowcount > 0 and session:
         # 로그아웃 성공 기록
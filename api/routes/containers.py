@@ -7,6 +7,8 @@ from sqlalchemy.orm import Session
 from sqlalchemy import text
 from db.database import get_db
 from api.routes.auth import get_current_user_from_token
+from api.responses import BaseResponseRoute
+from api.conditional import conditional_get
 
 from models import (
     BaseResponse,
@@ -23,10 +25,12 @@ from datetime import datetime, timedelta
 router = APIRouter(
     prefix="/api",
     tags=["containers"],
-    dependencies=[Depends(get_current_user_from_token)]
+    dependencies=[Depends(get_current_user_from_token)],
+    route_class=BaseResponseRoute
 )
 
-@router.get("/containers", response_model=BaseResponse)
+@router.get("/containers", response_model=BaseResponse,
+            dependencies=[Depends(conditional_get("containers"))])
 def get_containers(page: int = 1, per_page: int = 20, db: Session = Depends(get_db)):
     """컨테이너 목록 조회 (페이징 지원)"""
     try:
@@ -97,7 +101,8 @@ def get_containers(page: int = 1, per_page: int = 20, db: Session = Depends(get_
             details=str(e)
         )
 
-@router.get("/containers/{container_id}", response_model=BaseResponse)
+@router.get("/containers/{container_id}", response_model=BaseResponse,
+            dependencies=[Depends(conditional_get("containers"))])
 def get_container(container_id: str, db : Session = Depends(get_db)):
     """특정 컨테이너 상세 정보 조회"""
     try:
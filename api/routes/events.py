@@ -2,60 +2,139 @@
 이벤트 관련 API 라우트
 시스템 이벤트 및 로그 정보를 제공
 """
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+from db.database import get_db
 from models import (
     BaseResponse,
     Event,
     EventList,
-    EventSummary
+    EventSummary,
+    EventIngestRequest
 )
+from models.event import EventDB
 from api.routes.auth import get_current_user_from_token
-import random
-from datetime import datetime, timedelta
+from api.responses import BaseResponseRoute
+from api.conditional import conditional_get
+from services.event_service import EventStoreService, decode_cursor
+from typing import Optional
+from datetime import datetime, timezone
 
 # 라우터 생성
 router = APIRouter(
     prefix="/api",
     tags=["events"],
-    dependencies=[Depends(get_current_user_from_token)]
+    dependencies=[Depends(get_current_user_from_token)],
+    route_class=BaseResponseRoute
 )
 
-@router.get("/events", response_model=BaseResponse)
-def get_events():
-    """이벤트 목록 조회"""
+def _to_event(row: EventDB) -> Event:
+    """DB 행을 응답 모델로 변환"""
+    return Event(
+        id=f"EVT-{row.id:03d}",
+        time=row.last_seen.strftime("%H:%M:%S"),
+        type=row.type,
+        object=row.object,
+        namespace=row.namespace,
+        reason=row.reason,
+        message=row.message,
+        source=row.source,
+        count=row.count,
+        first_seen=row.first_seen.isoformat() + "Z",
+        last_seen=row.last_seen.isoformat() + "Z"
+    )
+
+def _to_naive_utc(value: Optional[datetime]) -> Optional[datetime]:
+    """쿼리 파라미터 시각을 DB 저장 기준(naive UTC)으로 변환"""
+    if value is not None and value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+def _list_events(db: Session, namespace: Optional[str], event_type: Optional[str],
+                 since: Optional[datetime], until: Optional[datetime],
+                 cursor: Optional[str], limit: int) -> EventList:
+    """이벤트 목록 페이지와 요약 통계 조회"""
+    service = EventStoreService(db)
+    since, until = _to_naive_utc(since), _to_naive_utc(until)
+    rows, next_cursor = service.list_events(
+        namespace=namespace, event_type=event_type,
+        since=since, until=until, cursor=cursor, limit=limit
+    )
+
+    # 요약은 기간 미지정 시 오늘(UTC 자정 이후) 기준
+    summary_since = since or datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
+    counts = service.summarize(namespace=namespace, since=summary_since, until=until)
+
+    return EventList(
+        events=[_to_event(row) for row in rows],
+        summary=EventSummary(
+            today_events=counts["total"],
+            warning_events=counts["warning"],
+            normal_events=counts["normal"],
+            system_events=counts["system"],
+            # 변화량 데이터 (추후 구현)
+            today_events_change="0%",
+            warning_events_change="0%",
+            normal_events_change="0%",
+            system_events_change="0%"
+        ),
+        next_cursor=next_cursor
+    )
+
+def _validate_cursor(cursor: Optional[str]):
+    """커서 형식 검사 (잘못된 경우 오류 응답, 정상이면 None)"""
+    if not cursor:
+        return None
     try:
-        events = []
-        event_types = ["Pod", "Node", "Service", "Deployment", "ServiceAccount", "PersistentVolumeClaim"]
-        reasons = ["Started", "Pulling", "Scheduled", "BackOff", "NodeReady", "UpdatedLoadBalancer", "FailedMount", "TokenRequested"]
-        
-        for i in range(25):
-            event_type = random.choice(event_types)
-            reason = random.choice(reasons)
-            events.append(Event(
-                time=(datetime.now() - timedelta(minutes=random.randint(1, 1440))).strftime("%H:%M:%S"),
-                type=random.choice(["Normal", "Warning"]),
-                object=f"{event_type.lower()}-{random.randint(1, 100)}",
-                namespace=random.choice(["default", "kube-system", "monitoring"]),
-                reason=reason,
-                message=f"{reason} event occurred for {event_type.lower()}",
-                source=random.choice(["kubelet", "deployment-controller", "service-controller", "node-controller"])
-            ))
-        
-        event_list = EventList(
-            events=events,
-            summary=EventSummary(
-                today_events=len(events),
-                warning_events=len([e for e in events if e.type == "Warning"]),
-                normal_events=len([e for e in events if e.type == "Normal"]),
-                system_events=len([e for e in events if e.namespace == "kube-system"]),
-                # 변화량 데이터 (화살표 방향 표시용)
-                today_events_change=random.choice([f"{random.choice(['+', '-'])}{random.randint(0, 8)}%", "0%"]),
-                warning_events_change=random.choice([f"{random.choice(['+', '-'])}{random.randint(0, 3)}%", "0%"]),
-                normal_events_change=random.choice([f"{random.choice(['+', '-'])}{random.randint(0, 5)}%", "0%"]),
-                system_events_change=random.choice([f"{random.choice(['+', '-'])}{random.randint(0, 2)}%", "0%"])
-            )
+        decode_cursor(cursor)
+    except ValueError as e:
+        return BaseResponse.error_response(
+            message="Invalid pagination cursor",
+            error_code="INVALID_CURSOR",
+            details=str(e)
         )
-        
+    return None
+
+@router.post("/events/ingest", response_model=BaseResponse)
+def ingest_events(request: EventIngestRequest, db: Session = Depends(get_db)):
+    """
+    이벤트 일괄 적재
+
+    같은 (namespace, object, reason, type, message) 이벤트는 새 행을 만들지 않고
+    기존 행의 count/first_seen/last_seen만 갱신한다.
+    """
+    try:
+        result = EventStoreService(db).ingest(request.events)
+        return BaseResponse.success_response(
+            data=result,
+            message=f"{result['received']} events ingested into {result['stored']} rows"
+        )
+    except Exception as e:
+        db.rollback()
+        return BaseResponse.error_response(
+            message="Failed to ingest events",
+            error_code="DATABASE_ERROR",
+            details=str(e)
+        )
+
+@router.get("/events", response_model=BaseResponse,
+            dependencies=[Depends(conditional_get("events", time_bucket=86400))])
+def get_events(
+    db: Session = Depends(get_db),
+    type: Optional[str] = Query(None, description="이벤트 유형 필터", enum=["Normal", "Warning"]),
+    since: Optional[datetime] = Query(None, description="조회 시작 시각 (last_seen 기준, ISO 8601)"),
+    until: Optional[datetime] = Query(None, description="조회 종료 시각 (미포함)"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor"),
+    limit: int = Query(25, ge=1, le=200, description="페이지 크기")
+):
+    """이벤트 목록 조회"""
+    try:
+        cursor_error = _validate_cursor(cursor)
+        if cursor_error:
+            return cursor_error
+
+        event_list = _list_events(db, None, type, since, until, cursor, limit)
+
         return BaseResponse.success_response(
             data=event_list.dict(),
             message="Events retrieved successfully"
@@ -67,23 +146,31 @@ def get_events():
             details=str(e)
         )
 
-@router.get("/events/{event_id}", response_model=BaseResponse)
-def get_event(event_id: str):
+@router.get("/events/{event_id}", response_model=BaseResponse,
+            dependencies=[Depends(conditional_get("events"))])
+def get_event(event_id: str, db: Session = Depends(get_db)):
     """특정 이벤트 상세 정보 조회"""
     try:
-        # 실제 구현에서는 데이터베이스에서 특정 이벤트 정보를 가져옴
-        event = Event(
-            time=datetime.now().strftime("%H:%M:%S"),
-            type=random.choice(["Normal", "Warning"]),
-            object=f"object-{event_id}",
-            namespace=random.choice(["default", "kube-system", "monitoring"]),
-            reason=random.choice(["Started", "Pulling", "Scheduled"]),
-            message=f"Event {event_id} details",
-            source=random.choice(["kubelet", "deployment-controller", "service-controller"])
-        )
-        
+        # "EVT-001" 형식의 ID에서 숫자 부분만 추출
+        try:
+            event_numeric_id = int(event_id.split('-')[1])
+        except (IndexError, ValueError):
+            return BaseResponse.error_response(
+                message="Invalid event ID format",
+                error_code="INVALID_EVENT_ID",
+                details=f"Expected format: EVT-001, got: {event_id}"
+            )
+
+        row = EventStoreService(db).get_event(event_numeric_id)
+        if not row:
+            return BaseResponse.error_response(
+                message="Event not found",
+                error_code="NOT_FOUND",
+                details=f"Event {event_id} does not exist"
+            )
+
         return BaseResponse.success_response(
-            data=event.dict(),
+            data=_to_event(row).dict(),
             message="Event retrieved successfully"
         )
     except Exception as e:
@@ -93,38 +180,25 @@ def get_event(event_id: str):
             details=str(e)
         )
 
-@router.get("/events/namespace/{namespace}", response_model=BaseResponse)
-def get_events_by_namespace(namespace: str):
+@router.get("/events/namespace/{namespace}", response_model=BaseResponse,
+            dependencies=[Depends(conditional_get("events", time_bucket=86400))])
+def get_events_by_namespace(
+    namespace: str,
+    db: Session = Depends(get_db),
+    type: Optional[str] = Query(None, description="이벤트 유형 필터", enum=["Normal", "Warning"]),
+    since: Optional[datetime] = Query(None, description="조회 시작 시각 (last_seen 기준, ISO 8601)"),
+    until: Optional[datetime] = Query(None, description="조회 종료 시각 (미포함)"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor"),
+    limit: int = Query(25, ge=1, le=200, description="페이지 크기")
+):
     """특정 네임스페이스의 이벤트 조회"""
     try:
-        # 실제 구현에서는 데이터베이스에서 특정 네임스페이스의 이벤트를 가져옴
-        events = []
-        for i in range(10):
-            events.append(Event(
-                time=(datetime.now() - timedelta(minutes=random.randint(1, 1440))).strftime("%H:%M:%S"),
-                type=random.choice(["Normal", "Warning"]),
-                object=f"object-{i+1}",
-                namespace=namespace,
-                reason=random.choice(["Started", "Pulling", "Scheduled"]),
-                message=f"Event in namespace {namespace}",
-                source=random.choice(["kubelet", "deployment-controller"])
-            ))
-        
-        event_list = EventList(
-            events=events,
-            summary=EventSummary(
-                today_events=len(events),
-                warning_events=len([e for e in events if e.type == "Warning"]),
-                normal_events=len([e for e in events if e.type == "Normal"]),
-                system_events=len([e for e in events if e.namespace == "kube-system"]),
-                # 변화량 데이터 (화살표 방향 표시용)
-                today_events_change=random.choice([f"{random.choice(['+', '-'])}{random.randint(0, 8)}%", "0%"]),
-                warning_events_change=random.choice([f"{random.choice(['+', '-'])}{random.randint(0, 3)}%", "0%"]),
-                normal_events_change=random.choice([f"{random.choice(['+', '-'])}{random.randint(0, 5)}%", "0%"]),
-                system_events_change=random.choice([f"{random.choice(['+', '-'])}{random.randint(0, 2)}%", "0%"])
-            )
-        )
-        
+        cursor_error = _validate_cursor(cursor)
+        if cursor_error:
+            return cursor_error
+
+        event_list = _list_events(db, namespace, type, since, until, cursor, limit)
+
         return BaseResponse.success_response(
             data=event_list.dict(),
             message=f"Events for namespace {namespace} retrieved successfully"
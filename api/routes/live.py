@@ -0,0 +1,181 @@
+"""
+실시간 업데이트 API 라우트
+새 알림/이벤트/노드 상태 변경/메트릭 포인트를 SSE 또는 WebSocket으로 푸시
+"""
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, WebSocket, WebSocketDisconnect
+from fastapi.responses import StreamingResponse
+from sqlalchemy import text
+from db.database import SessionLocal
+from models import BaseResponse
+from api.routes.auth import authenticate_token, get_current_user_from_token
+from api.responses import BaseResponseRoute
+from logs.context import bind_user
+from services.live_service import LIVE_CHANNELS, live_hub
+from logs import log_manager
+from typing import List, Optional
+import asyncio
+import time
+
+# 라우터 생성 (EventSource는 헤더를 설정할 수 없으므로 스트림은 token 쿼리 파라미터도 허용)
+router = APIRouter(prefix="/api/live", tags=["live"], route_class=BaseResponseRoute)
+
+# 연결 유지용 하트비트 간격 (초)
+HEARTBEAT_INTERVAL = 15.0
+
+# 세션 재검증 및 사용자 활동 시간 갱신 간격 (초, 기존 /api/auth/update-status 폴링 대체)
+SESSION_TOUCH_INTERVAL = 60.0
+
+
+def _parse_channels(channels: Optional[str]) -> List[str]:
+    """쉼표로 구분된 채널 목록 (미지정 시 전체)"""
+    if not channels:
+        return list(LIVE_CHANNELS)
+    requested = [c.strip() for c in channels.split(",") if c.strip()]
+    invalid = [c for c in requested if c not in LIVE_CHANNELS]
+    if invalid:
+        raise ValueError(f"Unknown channels: {', '.join(invalid)} (available: {', '.join(LIVE_CHANNELS)})")
+    return requested
+
+
+def _extract_token(authorization: Optional[str], token: Optional[str]) -> Optional[str]:
+    if authorization and authorization.lower().startswith("bearer "):
+        return authorization[7:].strip()
+    return token
+
+
+def _authenticate(token: str):
+    """세션 토큰 검증 (스레드에서 실행, 유효하지 않으면 HTTPException 401)"""
+    db = SessionLocal()
+    try:
+        return authenticate_token(token, db)
+    finally:
+        db.close()
+
+
+def _touch_session(token: str) -> bool:
+    """세션이 아직 유효한지 확인하고 사용자의 last_login을 갱신"""
+    db = SessionLocal()
+    try:
+        user = authenticate_token(token, db)
+        db.execute(text("UPDATE users SET last_login = NOW() WHERE id = :user_id"), {"user_id": user.id})
+        db.commit()
+        return True
+    except HTTPException:
+        return False
+    finally:
+        db.close()
+
+
+@router.get("/stream")
+async def stream(
+    request: Request,
+    channels: Optional[str] = Query(None, description="구독 채널 (쉼표 구분: alert,event,node_status,metric)"),
+    token: Optional[str] = Query(None, description="세션 토큰 (Authorization 헤더를 쓸 수 없는 EventSource용)")
+):
+    """Server-Sent Events 스트림"""
+    session_token = _extract_token(request.headers.get("authorization"), token)
+    if not session_token:
+        raise HTTPException(status_code=401, detail="인증 토큰이 필요합니다.")
+    # DB 조회가 이벤트 루프를 막지 않도록 스레드에서 인증 (요청 로그 컨텍스트의 사용자는 여기서 기록)
+    user = await asyncio.to_thread(_authenticate, session_token)
+    bind_user(user.id)
+
+    try:
+        channel_list = _parse_channels(channels)
+    except ValueError as e:
+        return BaseResponse.error_response(
+            message="Invalid channels",
+            error_code="VALIDATION_ERROR",
+            details=str(e)
+        )
+
+    subscriber = live_hub.subscribe(channel_list)
+
+    async def event_source():
+        last_touch = last_check = time.monotonic()
+        try:
+            # 재연결 대기 시간 안내
+            yield b"retry: 5000\n\n"
+            while not subscriber.closed:
+                message = await subscriber.get(timeout=HEARTBEAT_INTERVAL)
+                if message is not None:
+                    yield message.sse
+                # 연결/세션 확인은 메시지가 계속 오더라도 경과 시간 기준으로 수행
+                now = time.monotonic()
+                if now - last_check >= HEARTBEAT_INTERVAL:
+                    last_check = now
+                    if await request.is_disconnected():
+                        break
+                if now - last_touch >= SESSION_TOUCH_INTERVAL:
+                    last_touch = now
+                    if not await asyncio.to_thread(_touch_session, session_token):
+                        yield b"event: session_expired\ndata: {}\n\n"
+                        break
+                if message is None:
+                    yield b": ping\n\n"
+        finally:
+            live_hub.unsubscribe(subscriber)
+
+    return StreamingResponse(
+        event_source(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+@router.websocket("/ws")
+async def websocket_stream(websocket: WebSocket, channels: Optional[str] = None, token: Optional[str] = None):
+    """WebSocket 스트림 (메시지 형식: {"id", "type", "data"})"""
+    session_token = _extract_token(websocket.headers.get("authorization"), token)
+    if not session_token or not await asyncio.to_thread(_touch_session, session_token):
+        await websocket.close(code=1008)
+        return
+    try:
+        channel_list = _parse_channels(channels)
+    except ValueError:
+        await websocket.close(code=1003)
+        return
+
+    await websocket.accept()
+    subscriber = live_hub.subscribe(channel_list)
+
+    async def watch_disconnect():
+        # 클라이언트 메시지는 사용하지 않으며, 연결 종료 감지용으로만 읽는다
+        try:
+            while True:
+                await websocket.receive_text()
+        except WebSocketDisconnect:
+            live_hub.unsubscribe(subscriber)
+
+    reader = asyncio.create_task(watch_disconnect())
+    last_touch = time.monotonic()
+    try:
+        while not subscriber.closed:
+            message = await subscriber.get(timeout=HEARTBEAT_INTERVAL)
+            if message is not None:
+                await websocket.send_text(message.text)
+            # 세션 확인은 메시지가 계속 오더라도 경과 시간 기준으로 수행 (연결 종료는 watch_disconnect가 감지)
+            now = time.monotonic()
+            if now - last_touch >= SESSION_TOUCH_INTERVAL:
+                last_touch = now
+                if not await asyncio.to_thread(_touch_session, session_token):
+                    await websocket.close(code=1008)
+                    break
+            if message is None:
+                await websocket.send_text('{"type":"ping"}')
+    except (WebSocketDisconnect, RuntimeError):
+        pass
+    except Exception as e:
+        log_manager.logger.error(f"WebSocket 스트림 오류: {e}")
+    finally:
+        reader.cancel()
+        live_hub.unsubscribe(subscriber)
+
+
+@router.get("/stats", response_model=BaseResponse, dependencies=[Depends(get_current_user_from_token)])
+def get_live_stats():
+    """실시간 허브 지표 (구독자 수, 발행/드롭/병합 메시지 수)"""
+    return BaseResponse.success_response(
+        data=live_hub.stats(),
+        message="Live hub stats retrieved successfully"
+    )
@@ -7,13 +7,20 @@ import random
 from datetime import datetime, timedelta
 from models import LogEntry, LogStats, LogListResponse, LogStatsResponse, BaseResponse
 from api.routes.auth import get_current_user_from_token
+from api.responses import BaseResponseRoute
+from services.query_timeout_service import QueryTimeoutError, query_budget
 import collections
+import os
+
+# 로그 조회 라우트의 SQL 실행 시간 예산 (초, 넘으면 쿼리를 중단하고 TIMEOUT 응답)
+LOG_QUERY_BUDGET = float(os.getenv("LOG_QUERY_BUDGET", "5"))
 
 
 router = APIRouter(
     prefix="/api", 
     tags=["logs"],
-    dependencies=[Depends(get_current_user_from_token)]
+    dependencies=[Depends(get_current_user_from_token)],
+    route_class=BaseResponseRoute
 )
 
 # 샘플 로그 데이터 생성
@@ -89,8 +96,9 @@ def generate_sample_logs(count: int = 20) -> List[LogEntry]:
     
     return logs
 
-@router.get("/logs", response_model=LogListResponse)
-async def get_logs(
+@router.get("/logs", response_model=LogListResponse,
+            dependencies=[Depends(query_budget(LOG_QUERY_BUDGET))])
+def get_logs(
     db : Session = Depends(get_db),
     level: Optional[str] = Query(None, description="로그 레벨 필터", enum=['INFO', 'WARN', 'DEBUG', 'ERROR']),
     container_id: Optional[int] = Query(None, description="컨테이너 ID 필터"),
@@ -185,12 +193,15 @@ async def get_logs(
             }
         )
 
+    except QueryTimeoutError:
+        raise
     except Exception as e:
         print(f"Error: {e}")
         raise HTTPException(status_code=500, detail="로그 조회 중 서버 오류가 발생했습니다.")
 
-@router.get("/logs/stats", response_model=LogStatsResponse)
-async def get_log_stats(
+@router.get("/logs/stats", response_model=LogStatsResponse,
+            dependencies=[Depends(query_budget(LOG_QUERY_BUDGET))])
+def get_log_stats(
     db: Session = Depends(get_db),
     time_range: str = Query("24h", description="시간 범위")
 ):
@@ -239,6 +250,8 @@ async def get_log_stats(
             data=stats
         )
         
+    except QueryTimeoutError:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"로그 통계 조회 중 오류가 발생했습니다: {str(e)}")
 
@@ -274,7 +287,7 @@ async def get_log_by_id(log_id: str):
         raise HTTPException(status_code=500, detail=f"로그 조회 중 오류가 발생했습니다: {str(e)}")
 
 @router.delete("/logs", response_model=BaseResponse)
-async def clear_all_logs(db: Session = Depends(get_db)):
+def clear_all_logs(db: Session = Depends(get_db)):
     """모든 로그 삭제"""
     try:
         # 데이터베이스에서 모든 로그 삭제
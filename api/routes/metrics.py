@@ -0,0 +1,69 @@
+"""
+Prometheus 자체 지표 노출 라우트
+스크레이퍼가 읽을 수 있도록 /metrics 를 Prometheus 텍스트 형식으로 제공
+(멀티 워커면 모든 워커의 시계열을 worker 라벨로 구분해 합침, services/worker_metrics_service.py)
+"""
+from fastapi import APIRouter, Header, Request, Response
+from services.metrics_service import CONTENT_TYPE, registry
+from services.worker_metrics_service import worker_metrics
+from services.live_service import live_hub
+from services.notification_service import notification_dispatcher
+from services.shared_cache_service import shared_caches
+from logs import log_manager
+from typing import Optional
+import hmac
+import ipaddress
+import os
+
+# 설정된 경우 스크레이퍼가 "Authorization: Bearer <토큰>"으로 접근해야 함
+# (미설정 시 루프백 주소에서 오는 요청만 허용)
+METRICS_TOKEN = os.getenv("METRICS_TOKEN", "")
+
+router = APIRouter(tags=["metrics"])
+
+
+def _live_hub_stats():
+    stats = live_hub.stats()
+    return [((key,), value) for key, value in stats.items()]
+
+
+def _notification_stats():
+    stats = notification_dispatcher.stats()
+    return [((key,), stats[key]) for key in ("queue_depth", "in_flight", "sent", "failed", "retried")
+            if key in stats]
+
+
+def _log_queue_stats():
+    return [((key,), value) for key, value in log_manager.stats().items()]
+
+
+def _shared_cache_stats():
+    return [((name, key), value) for name, cache in shared_caches().items() for key, value in cache.stats().items()]
+
+
+registry.gauge_callback("live_hub", "Live push hub subscribers and message totals", ("stat",), _live_hub_stats)
+registry.gauge_callback("notification_dispatcher", "Notification outbox dispatcher state and totals",
+                        ("stat",), _notification_stats)
+registry.gauge_callback("log_queue", "Log writer queue depth, capacity and dropped records",
+                        ("stat",), _log_queue_stats)
+registry.gauge_callback("shared_cache", "Cross-worker shared cache slots in use and this worker's lookups",
+                        ("cache", "stat"), _shared_cache_stats)
+
+
+def _is_loopback(host: Optional[str]) -> bool:
+    try:
+        return host is not None and ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
+
+
+@router.get("/metrics", include_in_schema=False)
+def get_metrics(request: Request, authorization: Optional[str] = Header(None)):
+    """Prometheus 텍스트 형식 지표"""
+    if METRICS_TOKEN:
+        supplied = (authorization or "")[len("Bearer "):] if (authorization or "").startswith("Bearer ") else ""
+        if not hmac.compare_digest(supplied, METRICS_TOKEN):
+            return Response(status_code=401, headers={"WWW-Authenticate": "Bearer"})
+    elif not _is_loopback(request.client.host if request.client else None):
+        return Response(status_code=403)
+    return Response(content=worker_metrics.exposition(), media_type=CONTENT_TYPE)
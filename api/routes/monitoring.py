@@ -2,53 +2,102 @@
 모니터링 관련 API 라우트
 차트 데이터와 성능 메트릭을 제공
 """
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+from db.database import SessionLocal, get_db
 from models import (
     BaseResponse,
     NetworkTrafficData, DiskIoData, ResponseTimeData, RequestStatusData,
     NetworkTrafficResponse, DiskIoResponse, ResponseTimeResponse, RequestStatusResponse,
+    MonitoringMetrics, MonitoringAllResponse,
     ChartDataset
 )
 from api.routes.auth import get_current_user_from_token
-import random
-from datetime import datetime, timedelta
+from api.responses import BaseResponseRoute
+from services.request_metrics_service import request_metrics, STATUS_CLASSES
+from typing import List, Optional, Tuple
+from datetime import datetime, timezone
+import asyncio
+
+BYTES_PER_MB = 1024 * 1024
 
 # 라우터 생성 (모든 경로에 인증 적용)
 router = APIRouter(
     prefix="/api/monitoring",
     tags=["monitoring"],
-    dependencies=[Depends(get_current_user_from_token)]
+    dependencies=[Depends(get_current_user_from_token)],
+    route_class=BaseResponseRoute
 )
 
 
+def _hour_labels(hour_starts: List[datetime]) -> List[str]:
+    """UTC 시간 시작 시각을 서버 로컬 시간 라벨로 변환"""
+    return [h.replace(tzinfo=timezone.utc).astimezone().strftime("%H:%M") for h in hour_starts]
+
+
+def _to_mb_per_second(values: List[Optional[float]]) -> List[Optional[float]]:
+    return [round(v / BYTES_PER_MB, 2) if v is not None else None for v in values]
+
+
+def _io_chart_data(db: Session) -> Tuple[NetworkTrafficData, DiskIoData]:
+    """네트워크 트래픽/디스크 I/O 차트 데이터 (시간별 집계 한 번으로 둘 다 생성)"""
+    # numpy를 쓰는 서비스라 워커 시작 시간에 포함되지 않도록 처음 호출할 때 로드
+    from services.io_aggregation_service import IoAggregationService
+
+    hour_starts, series = IoAggregationService(db).hourly_series(hours=24)
+    labels = _hour_labels(hour_starts)
+    network = NetworkTrafficData(
+        labels=labels,
+        datasets=[
+            ChartDataset(label="수신 (MB/s)", data=_to_mb_per_second(series["net_rx"])),
+            ChartDataset(label="송신 (MB/s)", data=_to_mb_per_second(series["net_tx"]))
+        ]
+    )
+    disk = DiskIoData(
+        labels=labels,
+        datasets=[
+            ChartDataset(label="읽기 (MB/s)", data=_to_mb_per_second(series["disk_read"])),
+            ChartDataset(label="쓰기 (MB/s)", data=_to_mb_per_second(series["disk_write"]))
+        ]
+    )
+    return network, disk
+
+
+def _response_time_data(route: Optional[str] = None) -> ResponseTimeData:
+    """시간별 p50/p95/p99 응답 시간 차트 데이터"""
+    hours, series = request_metrics.latency_series(quantiles=(0.5, 0.95, 0.99), route=route)
+    return ResponseTimeData(
+        labels=[datetime.fromtimestamp(hour * 3600).strftime("%H:%M") for hour in hours],
+        datasets=[
+            ChartDataset(label=f"p{int(q * 100)} (ms)", data=values)
+            for q, values in series.items()
+        ]
+    )
+
+
+def _request_status_data() -> RequestStatusData:
+    """상태 클래스별 요청 수 차트 데이터"""
+    counts = request_metrics.status_distribution()
+    return RequestStatusData(
+        labels=list(STATUS_CLASSES),
+        data=[counts[status_class] for status_class in STATUS_CLASSES]
+    )
+
+
+def _io_chart_data_in_session() -> Tuple[NetworkTrafficData, DiskIoData]:
+    # 스레드에서 실행되므로 요청 세션을 공유하지 않고 별도 세션 사용
+    db = SessionLocal()
+    try:
+        return _io_chart_data(db)
+    finally:
+        db.close()
+
+
 @router.get("/network-traffic", response_model=NetworkTrafficResponse)
-async def get_network_traffic():
-    """네트워크 트래픽 데이터 조회"""
+def get_network_traffic(db: Session = Depends(get_db)):
+    """네트워크 트래픽 데이터 조회 (최근 24시간, 클러스터 전체 컨테이너 합계)"""
     try:
-        # 최근 24시간 데이터 생성
-        labels = []
-        rx_data = []
-        tx_data = []
-        
-        for i in range(24):
-            time = datetime.now() - timedelta(hours=23-i)
-            labels.append(time.strftime("%H:%M"))
-            rx_data.append(round(random.uniform(10, 100), 1))
-            tx_data.append(round(random.uniform(5, 80), 1))
-        
-        data = NetworkTrafficData(
-            labels=labels,
-            datasets=[
-                ChartDataset(
-                    label="수신 (MB/s)",
-                    data=rx_data
-                ),
-                ChartDataset(
-                    label="송신 (MB/s)",
-                    data=tx_data
-                )
-            ]
-        )
+        data, _ = _io_chart_data(db)
         
         return NetworkTrafficResponse(
             success=True,
@@ -64,33 +113,10 @@ async def get_network_traffic():
 
 
 @router.get("/disk-io", response_model=DiskIoResponse)
-async def get_disk_io():
-    """디스크 I/O 데이터 조회"""
+def get_disk_io(db: Session = Depends(get_db)):
+    """디스크 I/O 데이터 조회 (최근 24시간, 클러스터 전체 노드 합계)"""
     try:
-        # 최근 24시간 데이터 생성
-        labels = []
-        read_data = []
-        write_data = []
-        
-        for i in range(24):
-            time = datetime.now() - timedelta(hours=23-i)
-            labels.append(time.strftime("%H:%M"))
-            read_data.append(round(random.uniform(5, 50), 1))
-            write_data.append(round(random.uniform(3, 30), 1))
-        
-        data = DiskIoData(
-            labels=labels,
-            datasets=[
-                ChartDataset(
-                    label="읽기 (MB/s)",
-                    data=read_data
-                ),
-                ChartDataset(
-                    label="쓰기 (MB/s)",
-                    data=write_data
-                )
-            ]
-        )
+        _, data = _io_chart_data(db)
         
         return DiskIoResponse(
             success=True,
@@ -106,37 +132,13 @@ async def get_disk_io():
 
 
 @router.get("/response-time", response_model=ResponseTimeResponse)
-async def get_response_time():
-    """응답 시간 데이터 조회"""
+async def get_response_time(
+    route: Optional[str] = Query(None, description="라우트 템플릿 필터 (예: /api/events/{event_id}, 미지정 시 전체 API)")
+):
+    """응답 시간 데이터 조회 (최근 24시간, 시간별 p50/p95/p99)"""
     try:
-        services = ['API Gateway', 'User Service', 'Order Service', 'Payment Service', 'Notification Service']
-        labels = []
-        
-        # 시간 라벨 생성
-        for i in range(24):
-            time = datetime.now() - timedelta(hours=23-i)
-            labels.append(time.strftime("%H:%M"))
-        
-        datasets = []
-        
-        for i, service in enumerate(services):
-            data = []
-            for j in range(24):
-                # 서비스별로 다른 응답시간 패턴 생성
-                base_time = 50 + i * 20
-                variation = random.uniform(-20, 30)
-                data.append(round(max(10, base_time + variation), 1))
-            
-            datasets.append(ChartDataset(
-                label=service,
-                data=data
-            ))
-        
-        data = ResponseTimeData(
-            labels=labels,
-            datasets=datasets
-        )
-        
+        data = _response_time_data(route)
+
         return ResponseTimeResponse(
             success=True,
             data=data,
@@ -152,19 +154,10 @@ async def get_response_time():
 
 @router.get("/request-status", response_model=RequestStatusResponse)
 async def get_request_status():
-    """요청 상태 분포 데이터 조회"""
+    """요청 상태 분포 데이터 조회 (최근 24시간 요청 수)"""
     try:
-        # 실제적인 HTTP 상태 코드 분포 시뮬레이션
-        data = RequestStatusData(
-            labels=["2xx", "3xx", "4xx", "5xx"],
-            data=[
-                random.randint(70, 85),  # 2xx 성공
-                random.randint(10, 20),  # 3xx 리다이렉트
-                random.randint(5, 12),   # 4xx 클라이언트 에러
-                random.randint(1, 5)     # 5xx 서버 에러
-            ]
-        )
-        
+        data = _request_status_data()
+
         return RequestStatusResponse(
             success=True,
             data=data,
@@ -176,3 +169,36 @@ async def get_request_status():
             data=None,
             message=f"Failed to retrieve request status data: {str(e)}"
         )
+
+
+@router.get("/all", response_model=MonitoringAllResponse)
+async def get_all_monitoring():
+    """
+    모니터링 페이지 전체 데이터 조회 (네트워크/디스크/응답 시간/요청 상태)
+
+    개별 API 4회 호출 대신 한 번의 요청으로 가져오며, 각 데이터는 스레드 풀에서 동시에 계산한다.
+    네트워크와 디스크는 같은 시간별 집계에서 나오므로 한 번만 계산한다.
+    """
+    try:
+        (network, disk), response_time, request_status = await asyncio.gather(
+            asyncio.to_thread(_io_chart_data_in_session),
+            asyncio.to_thread(_response_time_data),
+            asyncio.to_thread(_request_status_data)
+        )
+
+        return MonitoringAllResponse(
+            success=True,
+            data=MonitoringMetrics(
+                networkTraffic=network,
+                diskIo=disk,
+                responseTime=response_time,
+                requestStatus=request_status
+            ),
+            message="Monitoring data retrieved successfully"
+        )
+    except Exception as e:
+        return MonitoringAllResponse(
+            success=False,
+            data=None,
+            message=f"Failed to retrieve monitoring data: {str(e)}"
+        )
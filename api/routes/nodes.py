@@ -8,6 +8,10 @@ from sqlalchemy.orm import Session
 from sqlalchemy import text
 from db.database import get_db
 from api.routes.auth import get_current_user_from_token
+from api.responses import BaseResponseRoute
+from api.conditional import conditional_get
+from services.coalescing_service import coalesce
+from services.tracing_service import span
 
 from models import (
     BaseResponse,
@@ -24,10 +28,12 @@ from datetime import datetime, timedelta
 router = APIRouter(
     prefix="/api",
     tags=["nodes"],
-    dependencies=[Depends(get_current_user_from_token)]
+    dependencies=[Depends(get_current_user_from_token)],
+    route_class=BaseResponseRoute
 )
 
-@router.get("/nodes", response_model=BaseResponse)
+@router.get("/nodes", response_model=BaseResponse,
+            dependencies=[Depends(conditional_get("nodes", "metrics"))])
 def get_nodes(page: int = 1, per_page: int = 20, db: Session = Depends(get_db)):
     """노드 목록 조회 (페이징 지원)"""
     try:
@@ -56,29 +62,30 @@ def get_nodes(page: int = 1, per_page: int = 20, db: Session = Depends(get_db)):
         total_nodes = db.execute(total_query).scalar()
 
         # 4. Pydantic 모델로 변환
-        nodes = []
-        for row in rows:
-            nodes.append(Node(
-                name=row.node_name,
-                ip=row.ip if row.ip else "N/A",
-                role=row.role,
-                status=row.status,
-                cpu=ResourceUsage(
-                    cores=row.total_cores if row.total_cores else 0,
-                    usage=row.cpu_usage if row.cpu_usage else 0.0
-                ),
-                memory=MemoryInfo(
-                    total=row.total_memory if row.total_memory else 0,
-                    usage=row.memory_usage if row.memory_usage else 0.0
-                ),
-                disk=DiskInfo(
-                    total=row.total_disk if row.total_disk else 0,
-                    usage=row.disk_usage if row.disk_usage else 0.0
-                ),
-                containers=row.containers if row.containers else 0,
-                uptime="N/A",  # 추후 구현
-                last_heartbeat=(row.collected_at.isoformat() + "Z") if row.collected_at else row.updated_at.isoformat() + "Z"
-            ))
+        with span("convert", rows=len(rows)):
+            nodes = []
+            for row in rows:
+                nodes.append(Node(
+                    name=row.node_name,
+                    ip=row.ip if row.ip else "N/A",
+                    role=row.role,
+                    status=row.status,
+                    cpu=ResourceUsage(
+                        cores=row.total_cores if row.total_cores else 0,
+                        usage=row.cpu_usage if row.cpu_usage else 0.0
+                    ),
+                    memory=MemoryInfo(
+                        total=row.total_memory if row.total_memory else 0,
+                        usage=row.memory_usage if row.memory_usage else 0.0
+                    ),
+                    disk=DiskInfo(
+                        total=row.total_disk if row.total_disk else 0,
+                        usage=row.disk_usage if row.disk_usage else 0.0
+                    ),
+                    containers=row.containers if row.containers else 0,
+                    uptime="N/A",  # 추후 구현
+                    last_heartbeat=(row.collected_at.isoformat() + "Z") if row.collected_at else row.updated_at.isoformat() + "Z"
+                ))
 
         # 5. 페이징 정보 포함해서 응답
         node_list = NodeList(
@@ -92,7 +99,7 @@ def get_nodes(page: int = 1, per_page: int = 20, db: Session = Depends(get_db)):
         )
 
         return BaseResponse.success_response(
-            data=node_list.dict(),
+            data=node_list,
             message="Nodes retrieved successfully"
         )
 
@@ -103,7 +110,9 @@ def get_nodes(page: int = 1, per_page: int = 20, db: Session = Depends(get_db)):
             details=str(e)
         )
 
-@router.get("/nodes/stats", response_model=BaseResponse)
+@router.get("/nodes/stats", response_model=BaseResponse,
+            dependencies=[Depends(conditional_get("nodes", "metrics"))])
+@coalesce(ttl=1.0, versions=("nodes", "metrics"))
 def get_node_stats(db: Session = Depends(get_db)):
     """노드 페이지 통계"""
     try:
@@ -165,7 +174,8 @@ def get_node_stats(db: Session = Depends(get_db)):
             details=str(e)
         )
 
-@router.get("/nodes/{node_name}", response_model=BaseResponse)
+@router.get("/nodes/{node_name}", response_model=BaseResponse,
+            dependencies=[Depends(conditional_get("nodes", "metrics"))])
 def get_node(node_name: str, db: Session = Depends(get_db)):
     """특정 노드 상세 정보 조회"""
     try:
@@ -0,0 +1,80 @@
+"""
+알림 전송 관련 API 라우트
+웹훅 전송 파이프라인 상태 조회 및 테스트 알림 전송 기능을 제공
+"""
+from fastapi import APIRouter, Depends
+from sqlalchemy.orm import Session
+from db.database import get_db
+from models import BaseResponse, NotificationTestRequest, NotificationStats
+from api.routes.auth import get_current_user_from_token
+from api.responses import BaseResponseRoute
+from services.notification_service import notification_dispatcher, enqueue_notifications
+from datetime import datetime
+import asyncio
+
+# 라우터 생성
+router = APIRouter(
+    prefix="/api/notifications",
+    tags=["notifications"],
+    dependencies=[Depends(get_current_user_from_token)],
+    route_class=BaseResponseRoute
+)
+
+@router.get("/stats", response_model=BaseResponse)
+async def get_notification_stats():
+    """알림 전송 지표 조회 (대기열 깊이, 전송 지연 등)"""
+    try:
+        stats = NotificationStats(**notification_dispatcher.stats())
+        return BaseResponse.success_response(
+            data=stats.dict(),
+            message="Notification stats retrieved successfully"
+        )
+    except Exception as e:
+        return BaseResponse.error_response(
+            message="Failed to retrieve notification stats",
+            error_code="INTERNAL_ERROR",
+            details=str(e)
+        )
+
+@router.post("/test", response_model=BaseResponse)
+async def send_test_notification(request: NotificationTestRequest, db: Session = Depends(get_db)):
+    """테스트 알림 적재 (디스패처가 비동기로 전송)"""
+    try:
+        if not notification_dispatcher.destinations:
+            return BaseResponse.error_response(
+                message="No notification destination configured",
+                error_code="VALIDATION_ERROR",
+                details="Set ALERT_WEBHOOK_URLS"
+            )
+        # 임의 URL로 서버가 요청을 보내지 않도록 설정된 대상(ALERT_WEBHOOK_URLS) 중 하나만 허용
+        if request.destination and request.destination not in notification_dispatcher.destinations:
+            return BaseResponse.error_response(
+                message="Destination is not a configured webhook",
+                error_code="VALIDATION_ERROR",
+                details="'destination' must be one of ALERT_WEBHOOK_URLS"
+            )
+        destinations = [request.destination] if request.destination else None
+
+        now = datetime.utcnow().isoformat() + "Z"
+        alerts = [{
+            "id": f"TEST-{i + 1:03d}",
+            "alert_type": "Test Notification",
+            "message": request.message,
+            "severity": "Info",
+            "status": "Active",
+            "created_at": now
+        } for i in range(max(1, min(request.count, 1000)))]
+
+        queued = await asyncio.to_thread(enqueue_notifications, db, alerts, destinations)
+
+        return BaseResponse.success_response(
+            data={"queued": queued},
+            message="Test notification queued successfully"
+        )
+    except Exception as e:
+        db.rollback()
+        return BaseResponse.error_response(
+            message="Failed to queue test notification",
+            error_code="DATABASE_ERROR",
+            details=str(e)
+        )
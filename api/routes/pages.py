@@ -8,6 +8,8 @@ from fastapi.templating import Jinja2Templates
 from sqlalchemy import text
 from sqlalchemy.orm import Session
 from db.database import get_db
+from api.static_assets import static_url
+from logs.context import bind_user
 from datetime import datetime
 import os
 import sys
@@ -23,14 +25,16 @@ except Exception as e:
     # log_manager가 없을 때를 위한 더미 클래스
     class DummyLogManager:
         class Logger:
-            def info(self, msg): print(f"INFO: {msg}")
-            def error(self, msg): print(f"ERROR: {msg}")
-            def warning(self, msg): print(f"WARNING: {msg}")
+            def debug(self, msg, *args, **kwargs): pass
+            def info(self, msg, *args, **kwargs): print(f"INFO: {msg}")
+            def error(self, msg, *args, **kwargs): print(f"ERROR: {msg}")
+            def warning(self, msg, *args, **kwargs): print(f"WARNING: {msg}")
         logger = Logger()
     log_manager = DummyLogManager()
 
 # 템플릿 엔진 설정
 templates = Jinja2Templates(directory="templates")
+templates.env.globals["static_url"] = static_url
 
 # 라우터 생성
 router = APIRouter()
@@ -41,8 +45,7 @@ security = HTTPBearer()
 async def verify_admin_access_with_token(token: str, db: Session = Depends(get_db)):
     """토큰으로 관리자 권한 확인"""
     try:
-        log_manager.logger.info("토큰으로 관리자 권한 확인 시작")
-        log_manager.logger.info(f"토큰: {token[:10]}...")
+        log_manager.logger.debug("토큰으로 관리자 권한 확인 시작", extra={"rate_limit": 1})
         
         # 1. 세션 테이블에서 토큰 조회
         session = db.execute(text(
@@ -58,7 +61,9 @@ async def verify_admin_access_with_token(token: str, db: Session = Depends(get_d
             log_manager.logger.warning("유효하지 않은 세션 토큰")
             raise HTTPException(status_code=401, detail="유효하지 않은 토큰입니다.")
 
-        log_manager.logger.info(f"세션 발견: user_id={session.user_id}, expires_at={session.expires_at}")
+        bind_user(session.user_id)
+        log_manager.logger.debug(f"세션 발견: user_id={session.user_id}, expires_at={session.expires_at}",
+                                 extra={"rate_limit": 1})
 
         # 2. 세션 만료 여부 확인
         if datetime.utcnow() > session.expires_at:
@@ -82,14 +87,15 @@ async def verify_admin_access_with_token(token: str, db: Session = Depends(get_d
             log_manager.logger.warning(f"사용자를 찾을 수 없음: user_id={session.user_id}")
             raise HTTPException(status_code=401, detail="사용자를 찾을 수 없습니다.")
         
-        log_manager.logger.info(f"사용자 정보: id={user.id}, username={user.username}, role={user.role}")
+        log_manager.logger.debug(f"사용자 정보: id={user.id}, username={user.username}, role={user.role}",
+                                 extra={"rate_limit": 1})
         
         # 4. 관리자 권한 확인
         if user.role != "admin":
             log_manager.logger.warning(f"관리자 권한 없음: role={user.role}")
             raise HTTPException(status_code=403, detail="관리자 권한이 필요합니다.")
         
-        log_manager.logger.info("관리자 권한 확인 완료")
+        log_manager.logger.info("관리자 권한 확인 완료", extra={"rate_limit": 1})
         return user
         
     except HTTPException:
@@ -128,7 +134,9 @@ async def verify_admin_access(request: Request, db: Session = Depends(get_db)):
             log_manager.logger.warning("유효하지 않은 세션 토큰")
             raise HTTPException(status_code=401, detail="유효하지 않은 토큰입니다.")
 
-        log_manager.logger.info(f"세션 발견: user_id={session.user_id}, expires_at={session.expires_at}")
+        bind_user(session.user_id)
+        log_manager.logger.debug(f"세션 발견: user_id={session.user_id}, expires_at={session.expires_at}",
+                                 extra={"rate_limit": 1})
 
         # 2. 세션 만료 여부 확인
         if datetime.utcnow() > session.expires_at:
@@ -153,14 +161,15 @@ async def verify_admin_access(request: Request, db: Session = Depends(get_db)):
             log_manager.logger.warning(f"사용자를 찾을 수 없음: user_id={session.user_id}")
             raise HTTPException(status_code=401, detail="사용자를 찾을 수 없습니다.")
         
-        log_manager.logger.info(f"사용자 정보: id={user.id}, username={user.username}, role={user.role}")
+        log_manager.logger.debug(f"사용자 정보: id={user.id}, username={user.username}, role={user.role}",
+                                 extra={"rate_limit": 1})
         
         # 4. 관리자 권한 확인
         if user.role != "admin":
             log_manager.logger.warning(f"관리자 권한 없음: role={user.role}")
             raise HTTPException(status_code=403, detail="관리자 권한이 필요합니다.")
         
-        log_manager.logger.info("관리자 권한 확인 완료")
+        log_manager.logger.info("관리자 권한 확인 완료", extra={"rate_limit": 1})
         return user
         
     except HTTPException:
@@ -0,0 +1,57 @@
+"""
+프로파일링 관련 API 라우트
+재시작 없이 실행 중인 워커 프로세스를 통계적 스택 샘플링으로 프로파일링 (관리자 전용)
+"""
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import PlainTextResponse
+from starlette.concurrency import run_in_threadpool
+from api.responses import BaseResponseRoute
+from api.routes.admin import verify_admin_token
+from logs import log_manager
+from models.base_response import BaseResponse
+from models.user import UserPublic
+from services.profiler_service import PROFILE_MAX_SECONDS, ProfilerBusyError, profiler
+
+# 라우터 생성
+router = APIRouter(prefix="/api/admin", tags=["admin"], route_class=BaseResponseRoute)
+
+
+@router.post("/profile", response_model=BaseResponse)
+async def run_profile(
+    seconds: float = 10.0,
+    interval_ms: float = 10.0,
+    by_thread: bool = False,
+    include_idle: bool = False,
+    format: str = "json",
+    current_user: UserPublic = Depends(verify_admin_token)
+):
+    """
+    이 워커 프로세스를 seconds초 동안 샘플링 (한 번에 하나만 실행, 최대 PROFILE_MAX_SECONDS초)
+
+    format=collapsed이면 flamegraph.pl / speedscope에 바로 넣을 수 있는 collapsed-stack 텍스트를,
+    json이면 같은 텍스트와 샘플 수/간격/측정된 오버헤드를 BaseResponse로 반환한다.
+    """
+    if format not in ("json", "collapsed"):
+        raise HTTPException(status_code=400, detail="format은 json 또는 collapsed여야 합니다.")
+    if not 0 < seconds <= PROFILE_MAX_SECONDS:
+        raise HTTPException(status_code=400, detail=f"seconds는 0초 초과 {PROFILE_MAX_SECONDS}초 이하여야 합니다.")
+    if profiler.busy:
+        raise HTTPException(status_code=409, detail="다른 프로파일이 실행 중입니다.")
+
+    log_manager.logger.info(f"프로파일 시작: {seconds}s, interval={interval_ms}ms, 요청자={current_user.username}")
+    try:
+        # 샘플러는 스레드풀에서 실행 (이벤트 루프 스레드도 샘플링 대상)
+        result = await run_in_threadpool(profiler.profile, seconds, interval_ms / 1000, by_thread, include_idle)
+    except ProfilerBusyError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    log_manager.logger.info(
+        f"프로파일 완료: samples={result['samples']}, overhead={result['overhead_ratio'] * 100:.2f}%"
+    )
+
+    if format == "collapsed":
+        return PlainTextResponse(result["collapsed"] + "\n", headers={
+            "X-Profile-Samples": str(result["samples"]),
+            "X-Profile-Interval-Ms": str(result["final_interval_ms"]),
+            "X-Profile-Overhead": str(result["overhead_ratio"]),
+        })
+    return BaseResponse.success_response(data=result, message="프로파일을 완료했습니다.")
@@ -0,0 +1,123 @@
+"""
+정적 파일 서빙 (콘텐츠 해시 파일명 + 사전 압축)
+scripts/build_static.py가 static/js, static/css를 static/dist/ 아래에 해시가 붙은 이름으로 복사하고
+.gz/.br 사전 압축본과 manifest.json을 만든다.
+
+- 템플릿은 static_url("js/app.js")로 경로를 얻는다. 빌드 결과가 있고 원본이 바뀌지 않았으면
+  해시 파일(/static/dist/js/app.<해시>.js)을, 아니면 원본 경로를 돌려준다.
+- 해시 파일은 내용이 바뀌면 이름도 바뀌므로 1년 immutable 캐시로 응답하고,
+  Accept-Encoding에 맞는 사전 압축본을 그대로 보낸다 (요청 시 압축 비용 없음).
+- 원본 경로는 no-cache로 응답해 브라우저가 ETag로 재검증하게 한다.
+"""
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import StaticFiles
+from typing import Dict, List, Optional, Tuple
+import hashlib
+import json
+import mimetypes
+import os
+
+STATIC_DIR = "static"
+DIST_DIRNAME = "dist"
+MANIFEST_NAME = "manifest.json"
+
+# 사전 압축 대상 디렉터리 (static 기준)
+ASSET_DIRS = ("js", "css")
+
+# 해시 파일 캐시 정책 (내용이 바뀌면 파일명이 바뀌므로 재검증 불필요)
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+REVALIDATE_CACHE_CONTROL = "no-cache"
+
+# 선호 순서 (인코딩, 사전 압축 파일 확장자)
+PRECOMPRESSED_VARIANTS = (("br", ".br"), ("gzip", ".gz"))
+
+
+def content_hash(data: bytes) -> str:
+    """파일명에 넣을 콘텐츠 해시 (SHA-256 앞 10자리)"""
+    return hashlib.sha256(data).hexdigest()[:10]
+
+
+def accepted_encodings(accept_encoding: Optional[str]) -> List[str]:
+    """Accept-Encoding에서 허용된(q>0) 인코딩 목록"""
+    encodings = []
+    for item in (accept_encoding or "").split(","):
+        name, _, params = item.strip().partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        if q > 0:
+            encodings.append(name)
+    return encodings
+
+
+def load_manifest(static_dir: str = STATIC_DIR) -> Dict[str, str]:
+    """
+    빌드 매니페스트 로드 (원본 경로 → 해시 파일 경로)
+
+    원본이 빌드 이후 수정된 항목은 제외해, 빌드를 다시 하지 않아도 수정 내용이 바로 반영되게 한다.
+    """
+    path = os.path.join(static_dir, DIST_DIRNAME, MANIFEST_NAME)
+    try:
+        with open(path, encoding="utf-8") as f:
+            entries = json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+    manifest = {}
+    for source, entry in entries.items():
+        try:
+            with open(os.path.join(static_dir, source), "rb") as f:
+                current = content_hash(f.read())
+        except OSError:
+            continue
+        if current == entry["hash"] and os.path.isfile(os.path.join(static_dir, entry["file"])):
+            manifest[source] = entry["file"]
+    return manifest
+
+
+_manifest = load_manifest()
+
+
+def static_url(path: str) -> str:
+    """템플릿용 정적 파일 URL (예: static_url("js/app.js") → "/static/dist/js/app.1a2b3c4d5e.js")"""
+    return f"/{STATIC_DIR}/{_manifest.get(path, path)}"
+
+
+class PrecompressedStaticFiles(StaticFiles):
+    """해시 파일은 사전 압축본 + immutable 캐시, 그 외 파일은 재검증 캐시로 응답하는 StaticFiles"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._dist_prefix = os.path.join(os.path.realpath(str(self.directory)), DIST_DIRNAME) + os.sep
+
+    def _precompressed(self, full_path: str, scope) -> Optional[Tuple[str, str]]:
+        accepted = accepted_encodings(Headers(scope=scope).get("accept-encoding"))
+        for encoding, suffix in PRECOMPRESSED_VARIANTS:
+            if encoding in accepted and os.path.isfile(full_path + suffix):
+                return encoding, full_path + suffix
+        return None
+
+    def file_response(self, full_path, stat_result: os.stat_result, scope, status_code: int = 200) -> Response:
+        full_path = str(full_path)
+        if not os.path.realpath(full_path).startswith(self._dist_prefix):
+            response = super().file_response(full_path, stat_result, scope, status_code)
+            response.headers["Cache-Control"] = REVALIDATE_CACHE_CONTROL
+            return response
+
+        headers = {"Cache-Control": IMMUTABLE_CACHE_CONTROL, "Vary": "Accept-Encoding"}
+        variant = self._precompressed(full_path, scope)
+        if variant is None:
+            return FileResponse(full_path, status_code=status_code, stat_result=stat_result, headers=headers)
+
+        encoding, variant_path = variant
+        headers["Content-Encoding"] = encoding
+        media_type = mimetypes.guess_type(full_path)[0] or "application/octet-stream"
+        return FileResponse(variant_path, status_code=status_code, headers=headers, media_type=media_type)
@@ -1,7 +1,10 @@
 from sqlalchemy import create_engine, text
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session, sessionmaker
 from sqlalchemy.ext.declarative import declarative_base
+from typing import Callable, List, Optional
 import os
+import threading
 from dotenv import load_dotenv
 
 # .env 파일 로드
@@ -17,16 +20,64 @@ DB_NAME = os.getenv("DB_NAME")
 # DB URL 생성 (pymysql 드라이버 사용)
 DATABASE_URL = f"mysql+pymysql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
 
-# 엔진 & 세션 생성
-engine = create_engine(DATABASE_URL, pool_pre_ping=True)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# 엔진은 처음 사용할 때 생성 (임포트만으로는 드라이버 로드/DB 접속이 일어나지 않음)
+_engine: Optional[Engine] = None
+_engine_lock = threading.Lock()
+_engine_hooks: List[Callable[[Engine], None]] = []
+
+
+def get_engine() -> Engine:
+    """DB 엔진 (첫 호출 시 생성하고 on_engine_created로 등록된 훅 실행)"""
+    global _engine
+    if _engine is None:
+        with _engine_lock:
+            if _engine is None:
+                engine = create_engine(DATABASE_URL, pool_pre_ping=True)
+                for hook in _engine_hooks:
+                    hook(engine)
+                _engine = engine
+    return _engine
+
+
+def on_engine_created(hook: Callable[[Engine], None]) -> None:
+    """엔진 생성 시 실행할 훅 등록 (이벤트 연결 등, 이미 생성된 경우 바로 실행)"""
+    with _engine_lock:
+        _engine_hooks.append(hook)
+        engine = _engine
+    if engine is not None:
+        hook(engine)
+
+
+def __getattr__(name: str):
+    # 기존 코드 호환: "from db.database import engine"은 그 시점에 엔진을 생성
+    if name == "engine":
+        return get_engine()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+class LazyBindSession(Session):
+    """bind가 지정되지 않은 세션은 첫 쿼리 시점에 기본 엔진에 연결"""
+
+    def get_bind(self, *args, **kwargs):
+        if self.bind is None and not getattr(self, "_Session__binds", None):
+            self.bind = get_engine()
+        return super().get_bind(*args, **kwargs)
+
+
+# 세션 생성
+SessionLocal = sessionmaker(class_=LazyBindSession, autocommit=False, autoflush=False)
 
 Base = declarative_base()
 
 # 모델 임포트 (Base에 등록)
-from models.alert import AlertRuleDB
+from models.alert import AlertRuleDB, SilenceDB
 from models.log import LogDB
 from models.user import UserDB
+from models.metric import ContainerMetricDB, NodeDiskIoDB, IoHourlyStatDB
+from models.overview import StatsSnapshotDB
+from models.notification import NotificationOutboxDB
+from models.event import EventDB
+from models.data_version import DataVersionDB
 
 # FastAPI에서 의존성 주입용
 def get_db():
@@ -39,7 +90,7 @@ def get_db():
 # 단독 실행 시 연결 테스트
 if __name__ == "__main__":
     try:
-        with engine.connect() as conn:
+        with get_engine().connect() as conn:
             result = conn.execute(text("SELECT NOW()"))
             print("✅ DB 연결 성공:", result.fetchone())
     except Exception as e:
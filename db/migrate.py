@@ -0,0 +1,115 @@
+"""
+스키마 마이그레이션 실행기
+배포 시 워커를 띄우기 전에 별도 단계로 실행한다 (워커는 시작할 때 스키마를 만들거나 바꾸지 않음).
+
+    python -m db.migrate            # 적용되지 않은 마이그레이션 적용
+    python -m db.migrate status     # 적용 상태 출력
+
+적용 기록은 schema_migrations 테이블에 남고, MySQL에서는 GET_LOCK으로 동시 실행을 막는다.
+"""
+from sqlalchemy import Column, DateTime, Integer, MetaData, String, Table, select
+from sqlalchemy.engine import Engine
+from types import ModuleType
+from typing import List, Optional
+from datetime import datetime
+import importlib
+import pkgutil
+import sys
+
+import db.migrations
+
+# 동시 실행 방지 락 이름/대기 시간 (MySQL)
+MIGRATION_LOCK_NAME = "schema_migrations"
+MIGRATION_LOCK_TIMEOUT = 60
+
+_metadata = MetaData()
+schema_migrations = Table(
+    "schema_migrations", _metadata,
+    Column("version", Integer, primary_key=True),
+    Column("description", String(200), nullable=False),
+    Column("applied_at", DateTime, nullable=False),
+)
+
+
+def load_migrations() -> List[ModuleType]:
+    """db/migrations의 mNNNN_*.py 모듈을 버전 순으로 로드"""
+    modules = []
+    for info in pkgutil.iter_modules(db.migrations.__path__):
+        if info.name.startswith("m") and info.name[1:5].isdigit():
+            modules.append(importlib.import_module(f"db.migrations.{info.name}"))
+    modules.sort(key=lambda module: module.VERSION)
+    versions = [module.VERSION for module in modules]
+    if len(versions) != len(set(versions)):
+        raise RuntimeError(f"마이그레이션 버전 중복: {versions}")
+    return modules
+
+
+def applied_versions(engine: Engine) -> set:
+    schema_migrations.create(bind=engine, checkfirst=True)
+    with engine.connect() as conn:
+        return set(conn.execute(select(schema_migrations.c.version)).scalars())
+
+
+def pending_migrations(engine: Engine) -> List[ModuleType]:
+    applied = applied_versions(engine)
+    return [module for module in load_migrations() if module.VERSION not in applied]
+
+
+def upgrade(engine: Optional[Engine] = None) -> List[int]:
+    """
+    적용되지 않은 마이그레이션을 버전 순으로 적용
+
+    Returns:
+        List[int]: 이번에 적용한 버전
+    """
+    if engine is None:
+        from db.database import get_engine
+
+        engine = get_engine()
+
+    applied = []
+    with engine.connect() as lock_conn:
+        if engine.dialect.name == "mysql":
+            acquired = lock_conn.exec_driver_sql(
+                f"SELECT GET_LOCK('{MIGRATION_LOCK_NAME}', {MIGRATION_LOCK_TIMEOUT})"
+            ).scalar()
+            if not acquired:
+                raise RuntimeError("다른 마이그레이션이 실행 중입니다.")
+        try:
+            for module in pending_migrations(engine):
+                print(f"마이그레이션 적용: {module.VERSION:04d} {module.DESCRIPTION}")
+                module.upgrade(engine)
+                with engine.begin() as conn:
+                    conn.execute(schema_migrations.insert().values(
+                        version=module.VERSION, description=module.DESCRIPTION, applied_at=datetime.utcnow()
+                    ))
+                applied.append(module.VERSION)
+        finally:
+            if engine.dialect.name == "mysql":
+                lock_conn.exec_driver_sql(f"SELECT RELEASE_LOCK('{MIGRATION_LOCK_NAME}')")
+    return applied
+
+
+def status(engine: Optional[Engine] = None) -> List[dict]:
+    if engine is None:
+        from db.database import get_engine
+
+        engine = get_engine()
+    applied = applied_versions(engine)
+    return [
+        {"version": module.VERSION, "description": module.DESCRIPTION, "applied": module.VERSION in applied}
+        for module in load_migrations()
+    ]
+
+
+if __name__ == "__main__":
+    command = sys.argv[1] if len(sys.argv) > 1 else "upgrade"
+    if command == "status":
+        for entry in status():
+            print(f"{entry['version']:04d} {'적용됨' if entry['applied'] else '대기'}  {entry['description']}")
+    elif command == "upgrade":
+        versions = upgrade()
+        print(f"적용한 마이그레이션: {versions}" if versions else "적용할 마이그레이션이 없습니다.")
+    else:
+        print("사용법: python -m db.migrate [upgrade|status]")
+        sys.exit(2)
@@ -0,0 +1,7 @@
+"""
+스키마 마이그레이션
+버전 순서대로 적용되는 모듈 목록. 각 모듈은 VERSION(정수), DESCRIPTION, upgrade(engine)를 정의한다.
+
+새 마이그레이션은 mNNNN_설명.py 파일로 추가한다 (적용 여부는 schema_migrations 테이블에 기록).
+실행: python -m db.migrate
+"""
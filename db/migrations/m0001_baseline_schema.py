@@ -0,0 +1,22 @@
+"""
+기준 스키마: 마이그레이션 도입 전 시작 시 create_all로 만들던 테이블
+(에이전트가 관리하는 nodes, metrics, containers, sessions는 대상이 아님)
+
+이미 있는 테이블은 건너뛰므로 기존 DB에도 안전하게 적용된다.
+"""
+from sqlalchemy.engine import Engine
+
+VERSION = 1
+DESCRIPTION = "baseline schema"
+
+BASELINE_TABLES = (
+    "users", "logs", "alert_rules", "silences", "events",
+    "container_metrics", "node_disk_io", "io_hourly_stats",
+    "stats_snapshots", "notification_outbox", "data_versions",
+)
+
+
+def upgrade(engine: Engine) -> None:
+    from db.database import Base
+
+    Base.metadata.create_all(bind=engine, tables=[Base.metadata.tables[name] for name in BASELINE_TABLES])
@@ -0,0 +1,15 @@
+"""
+데이터 버전 카운터 행 생성 + 에이전트가 쓰는 테이블의 버전 증가 트리거 설치 (MySQL)
+(이전에는 워커가 시작할 때마다 실행)
+"""
+from sqlalchemy.engine import Engine
+
+VERSION = 2
+DESCRIPTION = "data version rows and triggers"
+
+
+def upgrade(engine: Engine) -> None:
+    from services.data_version_service import data_versions
+
+    data_versions.ensure_rows(engine)
+    data_versions.install_triggers(engine)
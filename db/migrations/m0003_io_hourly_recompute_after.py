@@ -0,0 +1,18 @@
+"""
+io_hourly_stats.recompute_after: 데이터가 없던 시간의 재계산 시각
+(에이전트 데이터가 늦게 들어오면 빈 시간도 다시 집계)
+
+m0001이 현재 모델로 테이블을 만든 새 DB에는 이미 컬럼이 있으므로 없을 때만 추가한다.
+"""
+from sqlalchemy import inspect, text
+from sqlalchemy.engine import Engine
+
+VERSION = 3
+DESCRIPTION = "io_hourly_stats recompute_after"
+
+
+def upgrade(engine: Engine) -> None:
+    columns = {column["name"] for column in inspect(engine).get_columns("io_hourly_stats")}
+    if "recompute_after" not in columns:
+        with engine.begin() as conn:
+            conn.execute(text("ALTER TABLE io_hourly_stats ADD COLUMN recompute_after DATETIME NULL"))
@@ -0,0 +1,21 @@
+"""
+에이전트가 쓰는 테이블(nodes, metrics, containers)의 데이터 버전 트리거 제거 (MySQL)
+행마다 data_versions의 같은 행을 갱신해 적재 트랜잭션끼리 경합하므로,
+이제 이 테이블들의 버전은 조회할 때 테이블 집계값(또는 행 전체 체크섬)으로 계산한다 (services/data_version_service.py).
+"""
+from sqlalchemy.engine import Engine
+
+VERSION = 4
+DESCRIPTION = "drop data version triggers"
+
+_TABLES = ("nodes", "metrics", "containers")
+_OPERATIONS = ("insert", "update", "delete")
+
+
+def upgrade(engine: Engine) -> None:
+    if engine.dialect.name != "mysql":
+        return
+    with engine.begin() as conn:
+        for table in _TABLES:
+            for operation in _OPERATIONS:
+                conn.exec_driver_sql(f"DROP TRIGGER IF EXISTS trg_{table}_{operation}_version")
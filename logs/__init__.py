@@ -1,5 +1,31 @@
-from .logger import LogManager
+"""
+로그 패키지
+log_manager는 처음 사용할 때(속성 접근 시) LogManager를 생성한다.
+임포트만으로는 로그 디렉토리 생성, 파일 정리, 기록 스레드 시작이 일어나지 않는다.
+"""
+import threading
 
-log_manager = LogManager()
 
-__all__ = ['log_manager']
\ No newline at end of file
+class _LazyLogManager:
+    """첫 속성 접근 시 LogManager를 생성해 위임하는 프록시"""
+
+    def __init__(self):
+        self._manager = None
+        self._lock = threading.Lock()
+
+    def _get(self):
+        if self._manager is None:
+            with self._lock:
+                if self._manager is None:
+                    from .logger import LogManager
+
+                    self._manager = LogManager()
+        return self._manager
+
+    def __getattr__(self, name):
+        return getattr(self._get(), name)
+
+
+log_manager = _LazyLogManager()
+
+__all__ = ['log_manager']
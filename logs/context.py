@@ -0,0 +1,68 @@
+"""
+요청 로그 컨텍스트
+미들웨어가 요청마다 컨텍스트(요청 ID, 라우트, 시작 시각)를 contextvars에 묶어 두면,
+요청 처리 중 남긴 모든 로그 레코드에 요청 ID/라우트/경과 시간/사용자 ID가 붙는다.
+
+컨텍스트 객체는 변경 가능한 객체라서 의존성(인증 등)에서 사용자 ID를 채우면
+같은 요청의 이후 로그(스레드풀에서 실행되는 동기 엔드포인트 포함)에 바로 반영된다.
+"""
+from contextvars import ContextVar, Token
+from typing import Any, Optional
+import re
+import time
+import uuid
+
+# 클라이언트/프록시가 보낸 요청 ID를 그대로 쓸 수 있는 형식
+_REQUEST_ID_PATTERN = re.compile(r"^[A-Za-z0-9._-]{1,64}$")
+
+
+class RequestContext:
+    """요청 하나의 로그 컨텍스트"""
+    __slots__ = ("request_id", "scope", "user_id", "started")
+
+    def __init__(self, request_id: str, scope: Optional[dict] = None):
+        self.request_id = request_id
+        self.scope = scope
+        self.user_id: Optional[Any] = None
+        self.started = time.perf_counter()
+
+    @property
+    def route(self) -> Optional[str]:
+        """라우트 템플릿 (라우팅 이후 scope에 기록된 값, 라우팅 전에는 요청 경로)"""
+        if self.scope is None:
+            return None
+        route = self.scope.get("route")
+        return getattr(route, "path", None) or self.scope.get("path")
+
+    def elapsed_ms(self) -> float:
+        return (time.perf_counter() - self.started) * 1000
+
+
+_current: ContextVar[Optional[RequestContext]] = ContextVar("request_log_context", default=None)
+
+
+def new_request_id(supplied: Optional[str] = None) -> str:
+    """요청 ID 결정 (형식이 올바른 X-Request-ID는 그대로 사용)"""
+    if supplied and _REQUEST_ID_PATTERN.match(supplied):
+        return supplied
+    return uuid.uuid4().hex[:16]
+
+
+def bind_request(request_id: str, scope: Optional[dict] = None) -> Token:
+    """현재 실행 컨텍스트에 요청 컨텍스트 연결 (반환된 토큰으로 unbind_request 호출)"""
+    return _current.set(RequestContext(request_id, scope))
+
+
+def unbind_request(token: Token) -> None:
+    _current.reset(token)
+
+
+def bind_user(user_id: Any) -> None:
+    """인증된 사용자 ID를 현재 요청 컨텍스트에 기록 (요청 밖에서는 무시)"""
+    context = _current.get()
+    if context is not None:
+        context.user_id = user_id
+
+
+def current_request() -> Optional[RequestContext]:
+    return _current.get()
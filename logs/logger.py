@@ -3,8 +3,14 @@ LogManager Module
 
 싱글톤 패턴으로 설계되어 로그 설정을 중앙에서 관리하며, 다음과 같은 주요 기능을 포함합니다:
 - 로그 파일 생성 및 관리
-- 컬러 로그 포맷 지원
-- 오래된 로그 파일 자동 정리
+- 컬러 로그 포맷 지원 (TTY 출력에만 적용)
+- 크기/시간 기준 로그 회전, 회전된 세그먼트 백그라운드 압축, 개수/용량 기준 보존 (logs.rotation)
+- 큐 기반 비동기 기록: 호출 스레드(요청 처리 중인 이벤트 루프/워커 스레드)는 레코드를 큐에 넣기만 하고,
+  포맷팅과 콘솔/파일 쓰기는 전용 기록 스레드(QueueListener)가 처리한다.
+  큐가 가득 차면 설정한 정책(LOG_DROP_POLICY)에 따라 버리거나 기다린다.
+- 구조화(JSON) 로그: 요청 ID, 라우트, 경과 시간, 사용자 ID 포함 (LOG_JSON=1)
+- 호출 위치별 샘플링/속도 제한 (logs.structured.CallSiteLimiter)
+- 재시작 없이 로그 레벨 변경 (set_level)
 
 사용 예시:
     log_manager = LogManager()
@@ -13,12 +19,115 @@ LogManager Module
 
 import sys
 import os
+import atexit
 import logging
+import logging.handlers
+import queue
+import threading
 from pathlib import Path
 from datetime import datetime
-import glob
 import colorlog
 
+from logs.structured import CallSiteLimiter, JsonFormatter, RequestContextFilter
+from logs.rotation import LogArchiver, RotatingLogFileHandler, resolve_compression
+
+LOG_FORMAT = '[%(asctime)s.%(msecs)03d][%(levelname).1s][%(filename)s(%(funcName)s):%(lineno)d] %(message)s'
+COLOR_LOG_FORMAT = '[%(log_color)s%(asctime)s.%(msecs)03d][%(levelname).1s][%(filename)s(%(funcName)s):%(lineno)d] %(message)s'
+DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+# 기록 대기 큐 크기 (초과분은 드롭 정책에 따라 처리)
+LOG_QUEUE_SIZE = int(os.getenv("LOG_QUEUE_SIZE", "10000"))
+
+# 큐가 가득 찼을 때의 정책
+#   drop_new    : 새 레코드를 버림 (ERROR 이상은 가장 오래된 레코드를 밀어내고 넣음)
+#   drop_oldest : 가장 오래된 레코드를 밀어내고 새 레코드를 넣음
+#   block       : 자리가 날 때까지 최대 LOG_BLOCK_TIMEOUT초 기다린 뒤 버림
+DROP_POLICIES = ("drop_new", "drop_oldest", "block")
+LOG_DROP_POLICY = os.getenv("LOG_DROP_POLICY", "drop_new")
+LOG_BLOCK_TIMEOUT = 1.0
+
+# 회전 기준: 파일 크기(바이트)와 시간(초), 0이면 해당 기준 회전 안 함
+LOG_MAX_BYTES = int(os.getenv("LOG_MAX_BYTES", str(50 * 1024 * 1024)))
+LOG_ROTATE_INTERVAL = int(os.getenv("LOG_ROTATE_INTERVAL", str(24 * 60 * 60)))
+
+# 회전된 세그먼트 압축 방식 (gzip, zstd(zstandard 설치 시), none)
+LOG_COMPRESSION = os.getenv("LOG_COMPRESSION", "gzip")
+
+# 보존 기준: 파일 개수와 전체 용량(바이트), 0이면 해당 기준 제한 없음
+LOG_MAX_FILES = int(os.getenv("LOG_MAX_FILES", "10"))
+LOG_MAX_TOTAL_BYTES = int(os.getenv("LOG_MAX_TOTAL_BYTES", str(1024 * 1024 * 1024)))
+
+# 시작 로그 레벨
+LOG_LEVEL = os.getenv("LOG_LEVEL", "DEBUG").upper()
+
+# 파일(및 TTY가 아닌 콘솔) 출력을 JSON 한 줄 형식으로
+LOG_JSON = os.getenv("LOG_JSON", "").lower() in ("1", "true", "yes")
+
+# 호출 위치별 기본 속도 제한 (WARNING 미만 레코드, 초당 건수, 0이면 제한 없음)
+LOG_RATE_LIMIT = float(os.getenv("LOG_RATE_LIMIT", "0"))
+
+
+class BoundedQueueHandler(logging.handlers.QueueHandler):
+    """
+    크기 제한 큐에 레코드를 넣는 핸들러
+
+    호출 스레드에서는 메시지 인자 병합(prepare)만 하고 포맷팅/쓰기는 QueueListener 스레드가 한다.
+    큐가 가득 차면 drop_policy에 따라 처리하고, 버린 개수를 dropped에 누적한다.
+    """
+
+    def __init__(self, log_queue: queue.Queue, drop_policy: str = "drop_new"):
+        if drop_policy not in DROP_POLICIES:
+            raise ValueError(f"알 수 없는 드롭 정책: {drop_policy} (가능한 값: {', '.join(DROP_POLICIES)})")
+        super().__init__(log_queue)
+        self.drop_policy = drop_policy
+        self.dropped = 0
+        self._drop_lock = threading.Lock()
+
+    def prepare(self, record):
+        """메시지 인자 병합 + 예외 정보를 문자열로 고정 (포맷터 적용은 기록 스레드에서)"""
+        record.message = record.getMessage()
+        if record.exc_info and not record.exc_text:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+        record.msg = record.message
+        record.args = None
+        record.exc_info = None
+        return record
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+            return
+        except queue.Full:
+            pass
+
+        if self.drop_policy == "block":
+            try:
+                self.queue.put(record, timeout=LOG_BLOCK_TIMEOUT)
+                return
+            except queue.Full:
+                self._count_drop()
+                return
+
+        if self.drop_policy == "drop_new" and record.levelno < logging.ERROR:
+            self._count_drop()
+            return
+
+        # 가장 오래된 레코드를 밀어내고 넣기 (기록 스레드와 경쟁할 수 있으므로 한 번만 재시도)
+        try:
+            self.queue.get_nowait()
+            self._count_drop()
+        except queue.Empty:
+            pass
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self._count_drop()
+
+    def _count_drop(self):
+        with self._drop_lock:
+            self.dropped += 1
+
+
 class LogManager:
     """
     로그 관리 클래스
@@ -32,18 +141,38 @@ class LogManager:
             cls._instance = super(LogManager, cls).__new__(cls, *args, **kwargs)
         return cls._instance
     
-    def __init__(self, directory=r'D:\Python\WindowAutomation\logs\log', max_files=10):
+    def __init__(self, directory=r'D:\Python\WindowAutomation\logs\log', max_files=LOG_MAX_FILES,
+                 queue_size=LOG_QUEUE_SIZE, drop_policy=LOG_DROP_POLICY,
+                 json_output=LOG_JSON, rate_limit=LOG_RATE_LIMIT,
+                 max_bytes=LOG_MAX_BYTES, rotate_interval=LOG_ROTATE_INTERVAL,
+                 max_total_bytes=LOG_MAX_TOTAL_BYTES, compression=LOG_COMPRESSION):
         """
         LogManager 초기화
 
         Args:
             directory (str): 로그 파일을 저장할 디렉토리
             max_files (int): 유지할 최대 로그 파일 개수
+            queue_size (int): 기록 대기 큐 크기
+            drop_policy (str): 큐가 가득 찼을 때의 정책 (DROP_POLICIES 중 하나)
+            json_output (bool): 파일/비 TTY 콘솔을 JSON 한 줄 형식으로 기록할지 여부
+            rate_limit (float): 호출 위치별 기본 속도 제한 (초당 건수, 0이면 제한 없음)
+            max_bytes (int): 이 크기 이상이면 로그 파일 회전 (0이면 크기 기준 회전 안 함)
+            rotate_interval (int): 이 시간(초)마다 로그 파일 회전 (0이면 시간 기준 회전 안 함)
+            max_total_bytes (int): 유지할 로그 파일 전체 용량 (0이면 제한 없음)
+            compression (str): 회전된 세그먼트 압축 방식 (gzip, zstd, none)
         """
         if not hasattr(self, 'initialized'):  # 이 인스턴스가 초기화되었는지 확인
             self.directory = os.path.join(os.path.dirname(__file__), "log") or directory
             print(self.directory)
             self.max_files = max_files
+            self.queue_size = queue_size
+            self.drop_policy = drop_policy
+            self.json_output = json_output
+            self.limiter = CallSiteLimiter(default_rate=rate_limit)
+            self.max_bytes = max_bytes
+            self.rotate_interval = rotate_interval
+            self.archiver = LogArchiver(self.directory, resolve_compression(compression),
+                                        max_files, max_total_bytes)
             self._timestamp = self._init_timestamp()
             self.logger = self._init_logger()
             self._bind_hr_to_logger()
@@ -56,51 +185,132 @@ class LogManager:
 
 
     def _init_logger(self):
-        """ 로거 초기화 """
-        logger = logging.getLogger('Automation')
-
-        log_colors_config = {
-            'DEBUG': 'cyan',
-            'INFO': 'green',
-            'WARNING': 'yellow',
-            'ERROR': 'red', 
-            'CRITICAL': 'red,bg_white'
-        }
-
-        formatter = colorlog.ColoredFormatter(
-            '[%(log_color)s%(asctime)s.%(msecs)03d][%(levelname).1s][%(filename)s(%(funcName)s):%(lineno)d] %(message)s',
-            log_colors=log_colors_config,
-            datefmt='%Y-%m-%d %H:%M:%S',
-            reset=True,
-            secondary_log_colors={}
-        )
+        """
+        로거 초기화
 
-        stream_handler = logging.StreamHandler()
-        stream_handler.setFormatter(formatter)
-        logger.addHandler(stream_handler)
+        로거에는 큐 핸들러만 붙이고, 실제 콘솔/파일 핸들러는 전용 기록 스레드(QueueListener)에서 실행한다.
+        """
+        logger = logging.getLogger('Automation')
 
         print(f'실행한 파일명: {os.path.basename(sys.argv[0])}')
 
         # 로그 저장 주소
-        logfile = f"{self._timestamp}_{os.path.basename(sys.argv[0])}.log"
+        # 멀티 워커(serve.py)에서는 워커마다 별도 파일에 기록
+        worker_id = os.getenv("SERVER_WORKER_ID")
+        worker_suffix = f"_w{worker_id}" if worker_id else ""
+        logfile = f"{self._timestamp}_{os.path.basename(sys.argv[0])}{worker_suffix}.log"
         logpath = Path(self.directory)
 
         if not logpath.exists():
             os.makedirs(logpath)
 
-        file_handler = logging.FileHandler(logpath / logfile, encoding='utf-8')
-        file_handler.setFormatter(formatter)
-        file_handler.setLevel(logging.DEBUG)
+        self._log_queue = queue.Queue(maxsize=self.queue_size)
+        self._queue_handler = BoundedQueueHandler(self._log_queue, self.drop_policy)
+        # 호출 스레드에서 실행: 제한에 걸린 레코드는 컨텍스트 수집/큐 적재 전에 버림
+        self._queue_handler.addFilter(self.limiter)
+        self._queue_handler.addFilter(RequestContextFilter())
+        self._listener = logging.handlers.QueueListener(
+            self._log_queue, *self._create_handlers(logpath / logfile, self.json_output),
+            respect_handler_level=True
+        )
+        self._listener.start()
+        atexit.register(self.stop)
 
-        logger.addHandler(file_handler)
+        logger.addHandler(self._queue_handler)
 
         logger.propagate = False
-        logger.setLevel(logging.DEBUG)
+        logger.setLevel(LOG_LEVEL)
 
         logger.debug('Logger initialized')
 
         return logger
 
+    def _create_handlers(self, logfile, json_output=False):
+        """기록 스레드에서 실행할 콘솔/파일 핸들러 생성 (컬러 포맷은 콘솔이 TTY일 때만)"""
+        if json_output:
+            plain_formatter = JsonFormatter(datefmt=DATE_FORMAT)
+        else:
+            plain_formatter = logging.Formatter(LOG_FORMAT, datefmt=DATE_FORMAT)
+
+        stream_handler = logging.StreamHandler()
+        if stream_handler.stream is not None and stream_handler.stream.isatty():
+            stream_handler.setFormatter(colorlog.ColoredFormatter(
+                COLOR_LOG_FORMAT,
+                log_colors={
+                    'DEBUG': 'cyan',
+                    'INFO': 'green',
+                    'WARNING': 'yellow',
+                    'ERROR': 'red',
+                    'CRITICAL': 'red,bg_white'
+                },
+                datefmt=DATE_FORMAT,
+                reset=True,
+                secondary_log_colors={}
+            ))
+        else:
+            stream_handler.setFormatter(plain_formatter)
+
+        # 회전 판단/수행은 기록 스레드에서, 압축/보존 정리는 archiver 스레드에서 실행
+        file_handler = RotatingLogFileHandler(
+            logfile, self.archiver, max_bytes=self.max_bytes, interval=self.rotate_interval
+        )
+        self._file_handler = file_handler
+        file_handler.setFormatter(plain_formatter)
+        file_handler.setLevel(logging.DEBUG)
+
+        return stream_handler, file_handler
+
+    def stop(self):
+        """남은 레코드를 모두 기록하고 기록 스레드 종료 (프로세스 종료 시 자동 호출)"""
+        listener = getattr(self, '_listener', None)
+        if listener is not None and listener._thread is not None:
+            listener.stop()
+            for handler in listener.handlers:
+                handler.close()
+        archiver = getattr(self, 'archiver', None)
+        if archiver is not None:
+            archiver.stop()
+
+    def stats(self) -> dict:
+        """큐 상태 (대기 중인 레코드 수, 큐 크기, 버린 레코드 수, 속도 제한/샘플링으로 거른 레코드 수)"""
+        return {
+            "queued": self._log_queue.qsize(),
+            "capacity": self.queue_size,
+            "dropped": self._queue_handler.dropped,
+            "suppressed": self.limiter.suppressed_total,
+            "sampled_out": self.limiter.sampled_out_total,
+            "rotations": self._file_handler.rotations,
+            "compressed": self.archiver.compressed,
+            "removed": self.archiver.removed,
+        }
+
+    def set_level(self, level, logger_name=None):
+        """
+        실행 중 로그 레벨 변경 (재시작 불필요, 이 프로세스에만 적용)
+
+        Args:
+            level (str | int): 로그 레벨 (예: "INFO", logging.DEBUG)
+            logger_name (str): 대상 로거 이름 (기본값: 이 LogManager의 로거, 예: "sqlalchemy.engine")
+
+        Returns:
+            str: 적용된 레벨 이름
+        """
+        if isinstance(level, str):
+            level = level.upper()
+            if not isinstance(logging.getLevelName(level), int):
+                raise ValueError(f"알 수 없는 로그 레벨: {level}")
+        target = logging.getLogger(logger_name) if logger_name else self.logger
+        target.setLevel(level)
+        return logging.getLevelName(target.level)
+
+    def get_levels(self) -> dict:
+        """이 로거와 명시적으로 레벨이 설정된 다른 로거의 레벨"""
+        levels = {self.logger.name: logging.getLevelName(self.logger.level)}
+        for name, logger in logging.Logger.manager.loggerDict.items():
+            if isinstance(logger, logging.Logger) and logger.level != logging.NOTSET:
+                levels.setdefault(name, logging.getLevelName(logger.level))
+        return levels
+
     def hr(self, message="", level=1):
         """
         구분선을 출력하는 메서드.
@@ -129,19 +339,11 @@ class LogManager:
         """
         오래된 로그 파일 정리
 
-        설정된 디렉토리에서 최대 파일 개수를 초과하는 오래된 로그 파일을 삭제합니다.
+        설정된 디렉토리에서 최대 파일 개수 또는 전체 용량을 초과하는 오래된 로그 파일(압축본 포함)을 삭제합니다.
+        실행 중에는 로그 파일이 회전될 때마다 archiver 스레드에서 같은 정리가 실행됩니다.
         """
-        # 디렉토리 내의 특정 패턴의 파일 목록을 가져옵니다.
-        files = glob.glob(os.path.join(self.directory, '*.log'))
-
-        # 파일을 생성 시간에 따라 정렬합니다.
-        files.sort(key=os.path.getmtime)
-
         self.logger.info('clean_up_logs')
-
-        # 지정된 개수를 초과하는 파일이 있다면, 가장 오래된 파일부터 삭제합니다.
-        while len(files) > self.max_files:
-            os.remove(files.pop(0))  # 가장 오래된 파일을 삭제하고 목록에서 제거합니다.
+        self.archiver.apply_retention()
 
 if __name__ == "__main__":
     log_manager = LogManager()
@@ -151,4 +353,4 @@ if __name__ == "__main__":
     log_manager.logger.error("This is an error message for testing purposes.")
     log_manager.logger.hr("Section Start", level=2)
 
-    print(f"Timestamp: {log_manager.get_timestamp()}")
\ No newline at end of file
+    print(f"Timestamp: {log_manager.get_timestamp()}")
@@ -0,0 +1,243 @@
+"""
+로그 파일 회전/압축/보존
+
+- RotatingLogFileHandler: 크기(max_bytes) 또는 시간(interval초)이 넘으면 현재 파일을 세그먼트로 이름을 바꾸고
+  새 파일로 이어서 기록한다. QueueListener 기록 스레드에서 실행되므로 회전 판단/수행이 요청 스레드를 막지 않는다.
+- LogArchiver: 회전된 세그먼트를 별도 스레드에서 gzip(또는 zstandard 설치 시 zstd)으로 압축한 뒤 보존 정책을 적용한다.
+- enforce_retention: 파일 개수(max_files)와 전체 용량(max_total_bytes) 기준으로 오래된 로그부터 삭제한다.
+  회전 시각이 붙지 않은 파일은 어느 프로세스(serve.py 워커별 *_w<N>.log 포함)의 활성 파일일 수 있으므로
+  보존 정책 대상에서 빠진다 (이전 실행이 남긴 활성 파일은 회전 크기 이하이며 직접 정리).
+
+파일 이름:
+    활성 파일   20250101-120000_main.py.log
+    세그먼트    20250101-120000_main.py.20250102-000000.log  →  ...20250102-000000.log.gz
+"""
+from typing import Iterable, List, Optional
+import glob
+import gzip
+import logging
+import os
+import queue
+import re
+import shutil
+import sys
+import threading
+import time
+from datetime import datetime
+
+try:
+    import zstandard
+except ImportError:
+    # zstandard 미설치 시 gzip으로 압축
+    zstandard = None
+
+# 보존/정리 대상 로그 파일 패턴 (활성 파일, 회전된 세그먼트, 압축본)
+LOG_FILE_PATTERNS = ("*.log", "*.log.gz", "*.log.zst")
+
+# 회전된 세그먼트 이름 (활성 파일 이름 뒤에 회전 시각과 같은 초 순번이 붙음, 압축본 포함)
+_SEGMENT_NAME = re.compile(r"\.\d{8}-\d{6}(?:-\d+)?\.log(?:\.gz|\.zst)?$")
+
+COMPRESSION_SUFFIXES = {"gzip": ".gz", "zstd": ".zst"}
+
+
+def resolve_compression(name: str) -> Optional[str]:
+    """압축 방식 결정 ("none"이면 None, zstd를 요청했지만 미설치면 gzip)"""
+    name = (name or "none").lower()
+    if name in ("none", "off", ""):
+        return None
+    if name == "zstd" and zstandard is None:
+        return "gzip"
+    if name not in COMPRESSION_SUFFIXES:
+        raise ValueError(f"알 수 없는 로그 압축 방식: {name} (가능한 값: gzip, zstd, none)")
+    return name
+
+
+def compress_file(path: str, method: str) -> str:
+    """파일을 압축하고 원본을 삭제 (임시 파일에 쓴 뒤 이름을 바꿔 중간 상태가 남지 않게 함)"""
+    target = path + COMPRESSION_SUFFIXES[method]
+    partial = target + ".tmp"
+    with open(path, "rb") as source:
+        if method == "zstd":
+            with open(partial, "wb") as raw:
+                zstandard.ZstdCompressor(level=10).copy_stream(source, raw)
+        else:
+            # mtime=0: 같은 내용이면 같은 압축본
+            with gzip.GzipFile(partial, "wb", compresslevel=6, mtime=0) as dest:
+                shutil.copyfileobj(source, dest, 1024 * 1024)
+    shutil.copystat(path, partial)
+    os.replace(partial, target)
+    os.remove(path)
+    return target
+
+
+def list_log_files(directory: str) -> List[str]:
+    files = []
+    for pattern in LOG_FILE_PATTERNS:
+        files.extend(glob.glob(os.path.join(directory, pattern)))
+    return files
+
+
+def is_segment(path: str) -> bool:
+    """회전된 세그먼트인지 (아니면 어떤 프로세스의 활성 파일)"""
+    return _SEGMENT_NAME.search(os.path.basename(path)) is not None
+
+
+def enforce_retention(directory: str, max_files: int, max_total_bytes: int,
+                      keep: Iterable[str] = ()) -> List[str]:
+    """
+    보존 정책 적용 (오래된 파일부터 삭제)
+
+    Args:
+        directory: 로그 디렉토리
+        max_files: 유지할 최대 파일 개수 (0이면 제한 없음)
+        max_total_bytes: 유지할 최대 전체 용량 (0이면 제한 없음)
+        keep: 삭제하지 않을 파일 (회전된 세그먼트만 삭제하므로 활성 파일은 지정하지 않아도 됨)
+
+    Returns:
+        List[str]: 삭제한 파일 경로
+    """
+    keep = {os.path.abspath(path) for path in keep}
+    entries = []
+    for path in list_log_files(directory):
+        # 활성 파일은 다른 워커가 쓰는 중일 수 있으므로 개수/용량 계산에서도 제외
+        if not is_segment(path):
+            continue
+        try:
+            stat = os.stat(path)
+        except OSError:
+            continue
+        entries.append((stat.st_mtime, stat.st_size, path))
+    entries.sort()
+
+    count = len(entries)
+    total = sum(size for _, size, _ in entries)
+    removed = []
+    for _, size, path in entries:
+        over_count = max_files and count > max_files
+        over_bytes = max_total_bytes and total > max_total_bytes
+        if not (over_count or over_bytes):
+            break
+        if os.path.abspath(path) in keep:
+            continue
+        try:
+            os.remove(path)
+        except OSError:
+            continue
+        removed.append(path)
+        count -= 1
+        total -= size
+    return removed
+
+
+class LogArchiver:
+    """회전된 세그먼트 압축 + 보존 정책 적용 스레드"""
+
+    def __init__(self, directory: str, compression: Optional[str], max_files: int, max_total_bytes: int):
+        self.directory = directory
+        self.compression = compression
+        self.max_files = max_files
+        self.max_total_bytes = max_total_bytes
+        self.active_file: Optional[str] = None
+        self.compressed = 0
+        self.removed = 0
+        self._queue: "queue.Queue[Optional[str]]" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+
+    def submit(self, segment: str) -> None:
+        """회전된 세그먼트 처리 요청 (처음 호출 시 스레드 시작)"""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="log-archiver", daemon=True)
+            self._thread.start()
+        self._queue.put(segment)
+
+    def stop(self, timeout: float = 10.0) -> None:
+        """대기 중인 압축을 마치고 종료"""
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join(timeout)
+            self._thread = None
+
+    def apply_retention(self) -> None:
+        removed = enforce_retention(
+            self.directory, self.max_files, self.max_total_bytes,
+            keep=[self.active_file] if self.active_file else ()
+        )
+        self.removed += len(removed)
+
+    def _run(self) -> None:
+        while True:
+            segment = self._queue.get()
+            if segment is None:
+                return
+            try:
+                if self.compression:
+                    compress_file(segment, self.compression)
+                    self.compressed += 1
+                self.apply_retention()
+            except Exception as e:
+                # 로거 자신의 기록 경로이므로 로거 대신 stderr로 알림
+                print(f"로그 세그먼트 압축/정리 실패 ({segment}): {e}", file=sys.stderr)
+
+
+class RotatingLogFileHandler(logging.FileHandler):
+    """
+    크기/시간 기준 회전 파일 핸들러
+
+    Args:
+        filename: 활성 로그 파일 경로
+        archiver: 회전된 세그먼트를 넘길 LogArchiver
+        max_bytes: 이 크기 이상이면 회전 (0이면 크기 기준 회전 안 함)
+        interval: 이 시간(초)이 지나면 회전 (0이면 시간 기준 회전 안 함)
+    """
+
+    def __init__(self, filename, archiver: LogArchiver, max_bytes: int = 0, interval: float = 0,
+                 encoding: str = "utf-8"):
+        super().__init__(filename, encoding=encoding)
+        self.archiver = archiver
+        self.archiver.active_file = self.baseFilename
+        self.max_bytes = max_bytes
+        self.interval = interval
+        self.rotations = 0
+        self._last_stamp = ""
+        self._sequence = 0
+        self._next_rollover = time.time() + interval if interval else None
+
+    def should_rollover(self, record: logging.LogRecord) -> bool:
+        if self._next_rollover is not None and record.created >= self._next_rollover:
+            return True
+        if self.max_bytes and self.stream is not None:
+            return self.stream.tell() >= self.max_bytes
+        return False
+
+    def do_rollover(self) -> None:
+        if self.stream is not None:
+            self.stream.close()
+            self.stream = None
+
+        root, ext = os.path.splitext(self.baseFilename)
+        stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+        # 같은 초에 여러 번 회전하면 순번을 붙임 (보존 정책으로 삭제된 이름을 다시 쓰지 않도록 순번은 계속 증가)
+        self._sequence = self._sequence + 1 if stamp == self._last_stamp else 0
+        self._last_stamp = stamp
+        suffix = self._sequence
+        segment = f"{root}.{stamp}-{suffix}{ext}" if suffix else f"{root}.{stamp}{ext}"
+        while os.path.exists(segment) or any(os.path.exists(segment + s) for s in COMPRESSION_SUFFIXES.values()):
+            suffix += 1
+            self._sequence = suffix
+            segment = f"{root}.{stamp}-{suffix}{ext}"
+        if os.path.exists(self.baseFilename) and os.path.getsize(self.baseFilename) > 0:
+            os.replace(self.baseFilename, segment)
+            self.archiver.submit(segment)
+
+        self.rotations += 1
+        if self.interval:
+            self._next_rollover = time.time() + self.interval
+        self.stream = self._open()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            if self.should_rollover(record):
+                self.do_rollover()
+        except Exception:
+            self.handleError(record)
+        super().emit(record)
@@ -0,0 +1,153 @@
+"""
+구조화 로그 필터/포맷터
+
+- RequestContextFilter: 호출 스레드에서 요청 컨텍스트(요청 ID, 라우트, 경과 시간, 사용자 ID)를 레코드에 기록
+- CallSiteLimiter: 호출 위치(파일:줄)별 샘플링 + 토큰 버킷 속도 제한.
+  제한으로 버린 레코드 수는 같은 위치에서 다음으로 기록되는 레코드에 "suppressed K"로 붙는다.
+- JsonFormatter: 한 줄짜리 JSON 로그 (기록 스레드에서 실행)
+
+호출 위치별 제한은 호출 시 extra로 지정한다.
+    log_manager.logger.info("📊 통계 요청", extra={"rate_limit": 1})    # 초당 1건
+    log_manager.logger.debug("상세 정보", extra={"sample": 0.01})       # 1%만 기록
+"""
+from typing import Dict, Optional, Tuple
+import json
+import logging
+import random
+import threading
+import time
+
+from logs.context import current_request
+
+# 레코드 extra 키
+RATE_LIMIT_KEY = "rate_limit"
+SAMPLE_KEY = "sample"
+
+# JSON 출력에서 제외할 LogRecord 기본 속성 (나머지 extra 값은 그대로 출력)
+_RECORD_ATTRS = frozenset(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {
+    "message", "asctime", "request_id", "route", "user_id", "latency_ms", "suppressed",
+    RATE_LIMIT_KEY, SAMPLE_KEY,
+}
+
+
+class RequestContextFilter(logging.Filter):
+    """요청 컨텍스트를 레코드 속성으로 복사 (기록 스레드에서는 contextvars를 볼 수 없으므로 호출 스레드에서 실행)"""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        context = current_request()
+        if context is None:
+            record.request_id = record.route = record.user_id = record.latency_ms = None
+        else:
+            record.request_id = context.request_id
+            record.route = context.route
+            record.user_id = context.user_id
+            record.latency_ms = round(context.elapsed_ms(), 2)
+        return True
+
+
+class _Bucket:
+    __slots__ = ("tokens", "updated", "suppressed")
+
+    def __init__(self, burst: float):
+        self.tokens = burst
+        self.updated = time.monotonic()
+        self.suppressed = 0
+
+
+class CallSiteLimiter(logging.Filter):
+    """
+    호출 위치별 샘플링/속도 제한 필터
+
+    적용 순서: 런타임 설정(set_site) > 호출 시 extra > 기본 제한(default_rate, level 미만 레코드만).
+    속도 제한은 초당 rate건, 최대 rate건까지 몰아서 허용하는 토큰 버킷이다.
+    """
+
+    def __init__(self, default_rate: float = 0.0, default_below: int = logging.WARNING):
+        super().__init__()
+        self.default_rate = default_rate
+        self.default_below = default_below
+        self._sites: Dict[str, Tuple[Optional[float], Optional[float]]] = {}
+        self._buckets: Dict[str, _Bucket] = {}
+        self._lock = threading.Lock()
+        self.suppressed_total = 0
+        self.sampled_out_total = 0
+
+    def set_site(self, site: str, rate: Optional[float] = None, sample: Optional[float] = None) -> None:
+        """런타임 호출 위치 설정 ("파일명:줄", rate/sample이 모두 None이면 설정 해제)"""
+        with self._lock:
+            if rate is None and sample is None:
+                self._sites.pop(site, None)
+            else:
+                self._sites[site] = (rate, sample)
+            self._buckets.pop(site, None)
+
+    def sites(self) -> Dict[str, dict]:
+        with self._lock:
+            return {site: {"rate": rate, "sample": sample} for site, (rate, sample) in self._sites.items()}
+
+    def _limits(self, site: str, record: logging.LogRecord) -> Tuple[Optional[float], Optional[float]]:
+        override = self._sites.get(site)
+        if override is not None:
+            return override
+        rate = getattr(record, RATE_LIMIT_KEY, None)
+        sample = getattr(record, SAMPLE_KEY, None)
+        if rate is None and self.default_rate > 0 and record.levelno < self.default_below:
+            rate = self.default_rate
+        return rate, sample
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        site = f"{record.filename}:{record.lineno}"
+        rate, sample = self._limits(site, record)
+        if sample is not None and sample < 1.0 and random.random() >= sample:
+            self.sampled_out_total += 1
+            return False
+        if rate is None:
+            return True
+
+        with self._lock:
+            bucket = self._buckets.get(site)
+            if bucket is None:
+                bucket = self._buckets[site] = _Bucket(max(rate, 1.0))
+            now = time.monotonic()
+            bucket.tokens = min(max(rate, 1.0), bucket.tokens + (now - bucket.updated) * rate)
+            bucket.updated = now
+            if bucket.tokens < 1.0:
+                bucket.suppressed += 1
+                self.suppressed_total += 1
+                return False
+            bucket.tokens -= 1.0
+            suppressed, bucket.suppressed = bucket.suppressed, 0
+
+        if suppressed:
+            record.suppressed = suppressed
+            if isinstance(record.msg, str):
+                record.msg = f"{record.msg} (suppressed {suppressed})"
+        return True
+
+
+class JsonFormatter(logging.Formatter):
+    """한 줄 JSON 포맷터 (요청 컨텍스트 필드와 extra 값 포함)"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": self.formatTime(record, self.datefmt) + f".{int(record.msecs):03d}",
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "site": f"{record.filename}:{record.lineno}",
+            "func": record.funcName,
+        }
+        for key in ("request_id", "route", "user_id", "latency_ms", "suppressed"):
+            value = getattr(record, key, None)
+            if value is not None:
+                entry[key] = value
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRS and not key.startswith("_"):
+                entry[key] = value
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry["exc"] = record.exc_text
+        if record.stack_info:
+            entry["stack"] = self.formatStack(record.stack_info)
+        return json.dumps(entry, ensure_ascii=False, default=str)
@@ -1,16 +1,23 @@
 from fastapi import FastAPI
-from fastapi.staticfiles import StaticFiles
 from fastapi.responses import FileResponse
 
-# DB 테이블 생성을 위한 임포트
-from db.database import engine, Base
-from models import alert # alert.py의 모델들을 로드하기 위해 임포트
-
-# 데이터베이스 테이블 생성
-Base.metadata.create_all(bind=engine)
+# DB 엔진은 처음 쿼리할 때 생성되고, 스키마 생성/변경은 배포 시 별도 단계로 실행
+#   python -m db.migrate
+from db.database import on_engine_created
 
 # API 라우터들 import
-from api.routes import pages, stats, containers, nodes, alerts, events, logs, monitoring, auth, admin
+from api.routes import pages, stats, containers, nodes, alerts, events, logs, monitoring, auth, admin, notifications, live, metrics, profiling
+from services.notification_service import notification_dispatcher
+from services.live_service import live_hub, live_change_feed
+from services.stats_service import stats_refresher
+from services.worker_metrics_service import worker_metrics
+from api.middleware import RequestContextMiddleware, TracingMiddleware, RequestMetricsMiddleware, ETagMiddleware, CompressionMiddleware
+from api.static_assets import PrecompressedStaticFiles
+from services.data_version_service import data_versions
+from services.metrics_service import instrument_engine
+from services.tracing_service import tracer
+from services.slow_query_service import slow_query_log
+from services.query_timeout_service import query_timeouts
 
 # uvicorn main:app --reload --port 8000
 
@@ -20,8 +27,39 @@ app = FastAPI(
     version="1.0.0"
 )
 
-# Static 파일 서빙 설정
-app.mount("/static", StaticFiles(directory="static"), name="static")
+# 엔진 생성 시 연결할 이벤트
+# SQL 실행 시간/커넥션 풀 상태 수집 (/metrics)
+on_engine_created(instrument_engine)
+
+# 추적 중인 요청의 SQL 문장별 실행 시간 스팬 기록
+on_engine_created(tracer.instrument)
+
+# 기준(SLOW_QUERY_THRESHOLD_MS)을 넘은 SQL 집계 + 실행 계획 수집 (/api/admin/slow-queries)
+on_engine_created(slow_query_log.instrument)
+
+# 테이블별 데이터 버전 추적 (조건부 GET의 ETag, 버전 행은 마이그레이션에서 생성)
+on_engine_created(data_versions.instrument)
+
+# 라우트별 SQL 실행 시간 예산 (query_budget 의존성, 초과 시 쿼리 중단 + TIMEOUT 응답)
+on_engine_created(query_timeouts.instrument)
+
+# 응답 본문 gzip/brotli 압축 (가장 안쪽에서 실행되어 응답 시간 측정에 압축 시간이 포함됨)
+app.add_middleware(CompressionMiddleware)
+
+# 요청 응답 시간/상태 코드 수집 (/api/monitoring/response-time, request-status)
+app.add_middleware(RequestMetricsMiddleware)
+
+# 조건부 GET 응답에 ETag 헤더 추가
+app.add_middleware(ETagMiddleware)
+
+# 요청 추적 루트 스팬 (TRACE_EXPORT_FILE/TRACE_EXPORT_URL이 설정된 경우, TRACE_SAMPLE_RATE 비율로 샘플링)
+app.add_middleware(TracingMiddleware)
+
+# 요청 로그 컨텍스트(요청 ID, 라우트, 사용자 ID) 연결 (가장 바깥에서 실행되어 모든 로그에 적용)
+app.add_middleware(RequestContextMiddleware)
+
+# Static 파일 서빙 설정 (빌드된 해시 파일은 사전 압축본 + immutable 캐시, scripts/build_static.py)
+app.mount("/static", PrecompressedStaticFiles(directory="static"), name="static")
 
 # 파비콘 설정
 @app.get("/favicon.ico")
@@ -41,6 +79,33 @@ app.include_router(events.router)     # /api/events/*
 app.include_router(logs.router)       # /api/logs/*
 app.include_router(monitoring.router) # /api/monitoring/*
 app.include_router(admin.router)      # /api/admin/*
+app.include_router(profiling.router)  # /api/admin/profile
+app.include_router(notifications.router) # /api/notifications/*
+app.include_router(live.router)       # /api/live/*
+app.include_router(metrics.router)    # /metrics (Prometheus)
+
+
+@app.on_event("startup")
+async def start_background_workers():
+    """백그라운드 작업 시작 (웹훅 대상이 설정된 경우 알림 디스패처, 실시간 변경 감지기, 통계 스냅샷 갱신기 실행,
+    멀티 워커면 실시간 메시지 중계와 워커 지표 스냅샷 기록도 실행)"""
+    if notification_dispatcher.destinations:
+        await notification_dispatcher.start()
+    await live_change_feed.start()
+    await live_hub.start_relay()
+    await stats_refresher.start()
+    await worker_metrics.start()
+
+@app.on_event("shutdown")
+async def stop_background_workers():
+    """백그라운드 작업 종료"""
+    await notification_dispatcher.stop()
+    await live_change_feed.stop()
+    await live_hub.stop_relay()
+    await stats_refresher.stop()
+    await worker_metrics.stop()
+    live_hub.close_all()
+    tracer.exporter.stop()
 
 
 @app.get("/")
@@ -51,5 +116,6 @@ async def root():
     return FileResponse("templates/home.html")
 
 if __name__ == "__main__":
+    # 개발용 단일 프로세스 실행 (프로덕션은 serve.py)
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8000)
\ No newline at end of file
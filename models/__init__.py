@@ -4,17 +4,23 @@ from .overview import OverviewStats, NodePageStats
 from .dashboard import DashboardStats, ContainerStats, NodeStats, ResourceStats
 from .container import Container, ContainerList, Pagination, MemoryInfo, NetworkInfo
 from .node import Node, NodeList
-from .alert import Alert, AlertDetail, AlertList, AlertSummary, AlertRule, AlertRuleList, AlertRuleUpdate
-from .event import Event, EventList, EventSummary
+from .alert import (
+    Alert, AlertDetail, AlertList, AlertSummary, AlertRule, AlertRuleList, AlertRuleUpdate,
+    AlertRuleBacktestRequest, AlertBacktestFiring, AlertBacktestResult,
+    Silence, SilenceCreate, SilenceList
+)
+from .event import Event, EventList, EventSummary, EventIngest, EventIngestRequest
 from .log import LogEntry, LogStats, LogResponse, LogListResponse, LogStatsResponse
 from .auth import LoginRequest, LoginResponse, LogoutResponse, UserInfoResponse, AuthError
 from .monitoring import (
     ChartDataset, LineChartData, DoughnutChartData,
     NetworkTrafficData, DiskIoData, ResponseTimeData, RequestStatusData,
     MonitoringMetrics, MonitoringResponse,
-    NetworkTrafficResponse, DiskIoResponse, ResponseTimeResponse, RequestStatusResponse
+    NetworkTrafficResponse, DiskIoResponse, ResponseTimeResponse, RequestStatusResponse,
+    MonitoringAllResponse
 )
-from .admin import AdminStats
+from .admin import AdminStats, LogLevelUpdate, LogSiteLimit
+from .notification import NotificationTestRequest, NotificationStats
 from .user import User, UserCreate, UserUpdate, UserPublic as UserResponse, UserListPublic as UserList
 
 __all__ = [
@@ -39,9 +45,17 @@ __all__ = [
     'AlertRule',
     'AlertRuleList',
     'AlertRuleUpdate',
+    'AlertRuleBacktestRequest',
+    'AlertBacktestFiring',
+    'AlertBacktestResult',
+    'Silence',
+    'SilenceCreate',
+    'SilenceList',
     'Event',
     'EventList',
     'EventSummary',
+    'EventIngest',
+    'EventIngestRequest',
     'LogEntry',
     'LogStats',
     'LogResponse',
@@ -65,10 +79,15 @@ __all__ = [
     'DiskIoResponse',
     'ResponseTimeResponse',
     'RequestStatusResponse',
+    'MonitoringAllResponse',
     'UserCreate',
     'UserUpdate',
     'User',
     'UserList',
     'UserResponse',
-    'AdminStats'
+    'AdminStats',
+    'LogLevelUpdate',
+    'LogSiteLimit',
+    'NotificationTestRequest',
+    'NotificationStats'
 ]
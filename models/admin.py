@@ -1,7 +1,7 @@
 """
 관리자 페이지 관련 모델 정의
 """
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from typing import List, Optional
 from datetime import datetime
 
@@ -12,4 +12,16 @@ class AdminStats(BaseModel):
     active_users: int
     admin_users: int
     recent_logins: int
-    new_users_today: int
\ No newline at end of file
+    new_users_today: int
+
+class LogLevelUpdate(BaseModel):
+    """실행 중 로그 레벨 변경 요청"""
+    level: str = Field(..., description="DEBUG, INFO, WARNING, ERROR, CRITICAL")
+    logger: Optional[str] = Field(None, description="대상 로거 이름 (기본값: 애플리케이션 로거)")
+
+
+class LogSiteLimit(BaseModel):
+    """호출 위치별 로그 속도 제한/샘플링 설정 (rate, sample이 모두 없으면 설정 해제)"""
+    site: str = Field(..., description="호출 위치 (파일명:줄, 예: stats.py:58)")
+    rate: Optional[float] = Field(None, gt=0, description="초당 최대 기록 건수")
+    sample: Optional[float] = Field(None, gt=0, le=1, description="기록 비율 (0~1)")
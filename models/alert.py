@@ -1,9 +1,9 @@
 """
 알림 관련 데이터 모델
 """
-from typing import List, Optional
+from typing import Dict, List, Optional
 from pydantic import BaseModel
-from sqlalchemy import Column, Integer, String, DateTime
+from sqlalchemy import Column, Integer, String, DateTime, Text, Index
 from db.database import Base
 import datetime
 
@@ -191,6 +191,23 @@ class AlertRuleDB(Base):
     created_at = Column(DateTime, default=datetime.datetime.utcnow)
 
 
+class SilenceDB(Base):
+    __tablename__ = "silences"
+
+    id = Column(Integer, primary_key=True, index=True)
+    target = Column(String(255), nullable=True)  # 대상 이름 또는 와일드카드 (예: "k8s-worker-*")
+    labels = Column(Text, nullable=True)  # 라벨 매처 JSON (예: {"severity": "Critical"})
+    starts_at = Column(DateTime, nullable=False)
+    ends_at = Column(DateTime, nullable=False)
+    created_by = Column(String(50), nullable=True)
+    comment = Column(String(255), nullable=True)
+    created_at = Column(DateTime, default=datetime.datetime.utcnow)
+
+    __table_args__ = (
+        Index("ix_silences_ends_at", "ends_at"),
+    )
+
+
 class AlertRuleUpdate(BaseModel):
     """알림 규칙 수정을 위한 모델"""
     name: str
@@ -198,3 +215,62 @@ class AlertRuleUpdate(BaseModel):
     condition: str
     severity: str
     status: str
+
+
+class AlertRuleBacktestRequest(BaseModel):
+    """알림 규칙 백테스트 요청 모델"""
+    days: int = 7  # 평가할 과거 기간 (일 단위, 1-30)
+    step_seconds: Optional[int] = None  # 평가 해상도 (초 단위, 60 이상이며 기간에 따라 하한이 커짐, 미지정 시 자동 선택)
+    limit: int = 200  # 응답에 포함할 발생 이력 최대 개수 (최신순, 1 이상)
+
+
+class AlertBacktestFiring(BaseModel):
+    """백테스트 중 규칙이 발생했을 구간"""
+    target: str  # 발생 대상 (노드/컨테이너 이름)
+    fired_at: str  # 발생 시각 (ISO 8601 형식)
+    resolved_at: Optional[str]  # 해소 시각 (평가 구간 끝까지 지속되면 null)
+    duration_seconds: int  # 발생 지속 시간 (초)
+    peak_value: float  # 구간 내 최대(또는 최소) 메트릭 값
+
+
+class AlertBacktestResult(BaseModel):
+    """알림 규칙 백테스트 결과 모델"""
+    rule_id: str  # 규칙 식별자 (예: "RULE-001")
+    condition: str  # 평가한 조건식 (예: "CPU > 85% for 5min")
+    target_type: str  # 평가 대상 종류 ("node", "container")
+    evaluated_targets: int  # 평가한 대상 수
+    evaluated_points: int  # 평가한 시계열 포인트 수
+    window_start: str  # 평가 구간 시작 (ISO 8601 형식)
+    window_end: str  # 평가 구간 끝 (ISO 8601 형식)
+    step_seconds: int  # 평가 해상도 (초)
+    fire_count: int  # 총 발생 횟수
+    total_firing_seconds: int  # 총 발생 지속 시간 (초)
+    firings: List[AlertBacktestFiring]  # 발생 이력 (최신순, limit 개수까지)
+    elapsed_ms: float  # 백테스트 계산 소요 시간 (ms)
+
+
+class Silence(BaseModel):
+    """알림 사일런스(유지보수 구간) 모델"""
+    id: str  # 사일런스 고유 식별자 (예: "SIL-001")
+    target: Optional[str]  # 대상 이름 또는 와일드카드 (예: "k8s-worker-*", null이면 라벨로만 매칭)
+    labels: Dict[str, str]  # 라벨 매처 (예: {"severity": "Critical", "source": "kubelet"})
+    starts_at: str  # 시작 시간 (ISO 8601 형식)
+    ends_at: str  # 종료 시간 (ISO 8601 형식)
+    status: str  # 상태 ("Pending"=대기, "Active"=적용중, "Expired"=만료)
+    created_by: Optional[str]  # 등록한 사용자
+    comment: Optional[str]  # 사유 (예: "정기 점검")
+    created_at: str  # 등록 시간 (ISO 8601 형식)
+
+
+class SilenceCreate(BaseModel):
+    """사일런스 등록 요청 모델 (target 또는 labels 중 하나 이상 필요)"""
+    target: Optional[str] = None
+    labels: Dict[str, str] = {}
+    starts_at: Optional[datetime.datetime] = None  # 미지정 시 즉시 시작 (UTC)
+    ends_at: datetime.datetime  # 종료 시간 (UTC)
+    comment: Optional[str] = None
+
+
+class SilenceList(BaseModel):
+    """사일런스 목록 응답 모델"""
+    silences: List[Silence]  # 사일런스 객체들의 배열 (종료 시간 역순)
@@ -0,0 +1,16 @@
+"""
+데이터 버전 관련 데이터 모델
+테이블별 변경 카운터 (쓰기가 커밋될 때마다 증가, 조건부 GET의 ETag 계산에 사용)
+"""
+from sqlalchemy import Column, BigInteger, String, DateTime
+from db.database import Base
+from datetime import datetime
+
+
+class DataVersionDB(Base):
+    """테이블별 변경 카운터"""
+    __tablename__ = "data_versions"
+
+    table_name = Column(String(64), primary_key=True)  # 대상 테이블 이름 (예: "nodes", "events")
+    version = Column(BigInteger, nullable=False, default=0)  # 쓰기 트랜잭션이 커밋될 때마다 1 증가
+    updated_at = Column(DateTime, nullable=False, default=datetime.utcnow)
@@ -1,8 +1,11 @@
 """
 이벤트 관련 데이터 모델
 """
-from typing import List
+from typing import List, Optional
 from pydantic import BaseModel
+from sqlalchemy import Column, Integer, String, DateTime, Text, Index
+from db.database import Base
+from datetime import datetime
 
 
 class Event(BaseModel):
@@ -14,6 +17,10 @@ class Event(BaseModel):
     reason: str  # 이벤트 발생 원인 (예: "Started", "Pulled", "Failed", "Created", "Updated")
     message: str  # 이벤트 상세 메시지 (예: "Started event occurred for pod", "Successfully pulled image")
     source: str  # 이벤트 발생 소스 (예: "kubelet", "deployment-controller", "scheduler")
+    id: Optional[str] = None  # 이벤트 고유 식별자 (예: "EVT-001")
+    count: int = 1  # 압축된 동일 이벤트 발생 횟수 (예: CrashLoopBackOff 반복 시 증가)
+    first_seen: Optional[str] = None  # 최초 발생 시간 (ISO 8601 형식)
+    last_seen: Optional[str] = None  # 마지막 발생 시간 (ISO 8601 형식)
 
     class Config:
         json_schema_extra = {
@@ -24,7 +31,11 @@ class Event(BaseModel):
                 "namespace": "default",
                 "reason": "Started",
                 "message": "Started event occurred for pod",
-                "source": "kubelet"
+                "source": "kubelet",
+                "id": "EVT-001",
+                "count": 1,
+                "first_seen": "2024-01-15T10:30:15Z",
+                "last_seen": "2024-01-15T10:30:15Z"
             }
         }
 
@@ -46,6 +57,7 @@ class EventList(BaseModel):
     """이벤트 목록과 요약 통계를 포함한 응답 모델"""
     events: List[Event]  # 개별 이벤트 객체들의 배열 (최신순 정렬)
     summary: EventSummary  # 이벤트 요약 통계 정보 (대시보드 표시용)
+    next_cursor: Optional[str] = None  # 다음 페이지 조회용 커서 (마지막 페이지면 None)
 
     class Config:
         json_schema_extra = {
@@ -69,3 +81,50 @@ class EventList(BaseModel):
                 }
             }
         }
+
+
+class EventIngest(BaseModel):
+    """이벤트 적재 요청 항목 (에이전트가 수집한 Kubernetes 이벤트)"""
+    type: str  # 이벤트 유형 ("Normal", "Warning")
+    object: str  # 이벤트 대상 객체 (예: "pod/nginx-001")
+    namespace: str = "default"  # Kubernetes 네임스페이스
+    reason: str  # 이벤트 발생 원인 (예: "BackOff")
+    message: str  # 이벤트 상세 메시지
+    source: str = "unknown"  # 이벤트 발생 소스 (예: "kubelet")
+    timestamp: Optional[datetime] = None  # 발생 시간 (UTC, 미지정 시 수신 시각)
+    count: int = 1  # 에이전트 측에서 이미 합산한 발생 횟수
+
+
+class EventIngestRequest(BaseModel):
+    """이벤트 일괄 적재 요청 모델"""
+    events: List[EventIngest]  # 적재할 이벤트 배열
+
+
+class EventDB(Base):
+    """
+    Kubernetes 이벤트 저장 테이블
+
+    (namespace, object, reason, type, message)가 같은 이벤트는 한 행으로 압축되어
+    count/first_seen/last_seen만 갱신된다.
+    """
+    __tablename__ = "events"
+
+    id = Column(Integer, primary_key=True, index=True)
+    fingerprint = Column(String(40), nullable=False, unique=True)  # 압축 키 SHA-1
+    namespace = Column(String(253), nullable=False)
+    object = Column(String(255), nullable=False)
+    reason = Column(String(128), nullable=False)
+    type = Column(String(20), nullable=False)
+    message = Column(Text, nullable=False)
+    source = Column(String(128), nullable=False)
+    count = Column(Integer, nullable=False, default=1)
+    first_seen = Column(DateTime, nullable=False, default=datetime.utcnow)
+    last_seen = Column(DateTime, nullable=False, default=datetime.utcnow)
+
+    __table_args__ = (
+        # 최신순 목록/키셋 페이지네이션용 (InnoDB 보조 인덱스는 PK(id)를 포함하므로
+        # (last_seen, id) 순서로 정렬된 범위 스캔이 된다)
+        Index("ix_events_last_seen", "last_seen"),
+        Index("ix_events_namespace_last_seen", "namespace", "last_seen"),
+        Index("ix_events_type_last_seen", "type", "last_seen"),
+    )
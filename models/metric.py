@@ -0,0 +1,58 @@
+"""
+메트릭 시계열 관련 데이터 모델
+노드 메트릭은 기존 metrics 테이블(에이전트가 적재)을 그대로 사용하고,
+컨테이너 메트릭 이력은 container_metrics, 노드 디스크 I/O 카운터는 node_disk_io 테이블에 적재한다.
+"""
+from sqlalchemy import Column, BigInteger, Integer, Float, String, DateTime, Index
+from db.database import Base
+from datetime import datetime
+
+
+class ContainerMetricDB(Base):
+    """컨테이너 메트릭 이력 (containers 테이블은 최신 스냅샷만 보관)"""
+    __tablename__ = "container_metrics"
+
+    id = Column(BigInteger().with_variant(Integer, "sqlite"), primary_key=True, autoincrement=True)
+    container_id = Column(Integer, nullable=False)  # containers.id
+    cpu_percentage = Column(Float, nullable=True)  # CPU 사용률 (%)
+    memory_percent = Column(Float, nullable=True)  # 메모리 사용률 (%)
+    network_rx_bps = Column(BigInteger, nullable=True)  # 수신 속도 (bytes/s)
+    network_tx_bps = Column(BigInteger, nullable=True)  # 송신 속도 (bytes/s)
+    collected_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+
+    __table_args__ = (
+        # 컨테이너별 시계열 조회 및 기간 스캔용
+        Index("ix_container_metrics_container_collected", "container_id", "collected_at"),
+        Index("ix_container_metrics_collected", "collected_at"),
+    )
+
+
+class NodeDiskIoDB(Base):
+    """노드 디스크 I/O 누적 카운터 (에이전트가 /proc/diskstats 값을 그대로 적재)"""
+    __tablename__ = "node_disk_io"
+
+    id = Column(BigInteger().with_variant(Integer, "sqlite"), primary_key=True, autoincrement=True)
+    node_id = Column(Integer, nullable=False)  # nodes.id
+    read_bytes = Column(BigInteger, nullable=False)  # 부팅 이후 누적 읽기 바이트 (재부팅 시 0부터 다시 증가)
+    write_bytes = Column(BigInteger, nullable=False)  # 부팅 이후 누적 쓰기 바이트
+    collected_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+
+    __table_args__ = (
+        Index("ix_node_disk_io_node_collected", "node_id", "collected_at"),
+        Index("ix_node_disk_io_collected", "collected_at"),
+    )
+
+
+class IoHourlyStatDB(Base):
+    """클러스터 전체 네트워크/디스크 I/O 시간별 집계 (끝난 시간을 계산해 보관, 빈 시간은 나중에 재계산)"""
+    __tablename__ = "io_hourly_stats"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    series = Column(String(20), nullable=False)  # net_rx, net_tx, disk_read, disk_write
+    hour_start = Column(DateTime, nullable=False)  # 시간 시작 시각 (UTC)
+    value = Column(Float, nullable=True)  # 평균 처리량 (bytes/s, 데이터가 없으면 NULL)
+    recompute_after = Column(DateTime, nullable=True)  # 데이터가 없던 시간의 재계산 시각 (NULL이면 확정)
+
+    __table_args__ = (
+        Index("ux_io_hourly_stats_series_hour", "series", "hour_start", unique=True),
+    )
@@ -9,7 +9,7 @@ from pydantic import BaseModel
 class ChartDataset(BaseModel):
     """Chart.js 라인 차트 데이터셋 모델 (순수 데이터만)"""
     label: str  # 데이터셋의 이름 (예: "수신 (MB/s)", "송신 (MB/s)")
-    data: List[float]  # 실제 데이터 값들의 배열 (예: [10.5, 20.3, 15.7, ...])
+    data: List[Optional[float]]  # 실제 데이터 값들의 배열 (예: [10.5, 20.3, 15.7, ...], 데이터가 없는 구간은 null)
 
 
 class LineChartData(BaseModel):
@@ -94,3 +94,11 @@ class RequestStatusResponse(BaseModel):
     data: Optional[RequestStatusData] = None  # 요청 상태 분포 차트 데이터 (실패 시 null)
     message: str  # 응답 메시지 (예: "Request status data retrieved successfully")
     error: Optional[str] = None  # 에러 상세 정보 (성공 시 null)
+
+
+class MonitoringAllResponse(BaseModel):
+    """모니터링 전체 데이터 API 응답 모델"""
+    success: bool  # API 호출 성공 여부 (true/false)
+    data: Optional[MonitoringMetrics] = None  # 네트워크/디스크/응답 시간/요청 상태 차트 데이터 (실패 시 null)
+    message: str  # 응답 메시지 (예: "Monitoring data retrieved successfully")
+    error: Optional[str] = None  # 에러 상세 정보 (성공 시 null)
@@ -0,0 +1,50 @@
+"""
+알림 전송(웹훅) 관련 데이터 모델
+"""
+from typing import List, Optional
+from pydantic import BaseModel
+from sqlalchemy import Column, BigInteger, Integer, String, DateTime, Text, Index
+from db.database import Base
+from datetime import datetime
+
+
+class NotificationOutboxDB(Base):
+    """알림 전송 아웃박스 (전송 전 알림을 먼저 DB에 적재하여 유실 방지)"""
+    __tablename__ = "notification_outbox"
+
+    id = Column(BigInteger().with_variant(Integer, "sqlite"), primary_key=True, autoincrement=True)
+    destination = Column(String(500), nullable=False)  # 웹훅 URL
+    payload = Column(Text, nullable=False)  # 알림 JSON
+    status = Column(String(20), nullable=False, default="pending")  # pending, sending, sent, failed
+    attempts = Column(Integer, nullable=False, default=0)  # 전송 시도 횟수
+    next_attempt_at = Column(DateTime, nullable=False, default=datetime.utcnow)  # 다음 전송 가능 시각
+    last_error = Column(String(500), nullable=True)
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    sent_at = Column(DateTime, nullable=True)
+
+    __table_args__ = (
+        # 전송 대상 조회 (status + 시각) 용
+        Index("ix_notification_outbox_status_next", "status", "next_attempt_at"),
+    )
+
+
+class NotificationTestRequest(BaseModel):
+    """테스트 알림 전송 요청 모델"""
+    message: str = "Test notification"  # 테스트 메시지
+    count: int = 1  # 생성할 알림 개수 (다이제스트 병합 확인용)
+    destination: Optional[str] = None  # 설정된 웹훅 URL 중 하나 (미지정 시 설정된 전체 대상)
+
+
+class NotificationStats(BaseModel):
+    """알림 전송 파이프라인 지표"""
+    running: bool  # 디스패처 실행 여부
+    destinations: List[str]  # 설정된 웹훅 대상 목록
+    queue_depth: int  # 아웃박스에서 전송 대기 중인 알림 수
+    in_flight: int  # 현재 전송 중인 다이제스트 수
+    sent: int  # 전송 완료 알림 수 (프로세스 시작 이후)
+    failed: int  # 최대 재시도 초과로 실패한 알림 수
+    retried: int  # 재시도 예약된 알림 수
+    digests_sent: int  # 전송한 다이제스트 메시지 수
+    latency_p50_ms: float  # 적재부터 전송 완료까지 지연 (p50)
+    latency_p95_ms: float  # 적재부터 전송 완료까지 지연 (p95)
+    latency_max_ms: float  # 적재부터 전송 완료까지 지연 (최대)
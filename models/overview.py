@@ -3,6 +3,9 @@
 """
 from pydantic import BaseModel
 from typing import Optional
+from sqlalchemy import Column, Integer, Text, DateTime, Index
+from db.database import Base
+from datetime import datetime
 
 
 class OverviewStats(BaseModel):
@@ -83,3 +86,20 @@ class NodePageStats(BaseModel):
                 "avg_memory_usage_change": "+1.3%"
             }
         }
+
+
+class StatsSnapshotDB(Base):
+    """
+    개요/대시보드 통계 스냅샷 (백그라운드 갱신기가 주기적으로 적재)
+
+    변화량(*_change)은 현재 스냅샷과 한 시간 전 스냅샷을 비교해 계산한다.
+    """
+    __tablename__ = "stats_snapshots"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    payload = Column(Text, nullable=False)  # 집계 값 JSON (변화량 제외 원본 수치)
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+
+    __table_args__ = (
+        Index("ix_stats_snapshots_created", "created_at"),
+    )
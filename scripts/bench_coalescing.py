@@ -0,0 +1,38 @@
+"""
+동시 요청 200개의 실행 횟수 측정
+
+실행: python scripts/bench_coalescing.py
+"""
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from services.coalescing_service import SingleFlight  # noqa: E402
+
+
+if __name__ == "__main__":
+    from concurrent.futures import ThreadPoolExecutor
+
+    executions = 0
+
+    def slow_query():
+        global executions
+        executions += 1
+        time.sleep(0.05)
+        return {"healthy_nodes": 11}
+
+    flight = SingleFlight()
+    barrier = threading.Barrier(200)
+
+    def dashboard_refresh(_):
+        barrier.wait()
+        return flight.do("bench", ("get_node_stats",), slow_query, ttl=1.0)
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=200) as pool:
+        results = list(pool.map(dashboard_refresh, range(200)))
+    elapsed = time.perf_counter() - started
+    print(f"200 concurrent calls: {executions} execution(s), {200 - executions} saved, {elapsed * 1000:.0f} ms")
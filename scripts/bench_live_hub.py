@@ -0,0 +1,39 @@
+"""
+팬아웃 성능 측정 (구독자 1000명, 그중 일부는 읽지 않는 느린 구독자)
+
+실행: python scripts/bench_live_hub.py
+"""
+from typing import List
+import asyncio
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from services.live_service import LiveHub, LiveSubscriber, SUBSCRIBER_QUEUE_SIZE  # noqa: E402
+
+
+if __name__ == "__main__":
+    import time
+
+    async def _bench() -> None:
+        hub = LiveHub()
+        subscribers: List[LiveSubscriber] = [hub.subscribe() for _ in range(1000)]
+        messages = 2000
+        started = time.perf_counter()
+        for i in range(messages):
+            hub.publish("metric", {"node_id": i % 20, "cpu_usage": i % 100}, key=f"metric:{i % 20}")
+            hub.publish("event", {"seq": i})
+        elapsed = time.perf_counter() - started
+
+        drained = 0
+        for subscriber in subscribers[:10]:
+            while await subscriber.get(timeout=0) is not None:
+                drained += 1
+        stats = hub.stats()
+        print(f"{len(subscribers)} subscribers, {hub.published} messages: "
+              f"{elapsed / hub.published * 1e6:.1f} us/publish, "
+              f"queue<= {SUBSCRIBER_QUEUE_SIZE}, dropped={stats['dropped']}, coalesced={stats['coalesced']}, "
+              f"drained(10 subs)={drained}")
+
+    asyncio.run(_bench())
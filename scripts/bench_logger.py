@@ -0,0 +1,57 @@
+"""
+호출 스레드 기준 로그 1회당 비용 비교: 동기 핸들러(컬러 포맷 + 파일 쓰기) vs 큐 핸들러
+
+실행: python scripts/bench_logger.py
+"""
+import logging
+import logging.handlers
+import os
+import queue
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import colorlog  # noqa: E402
+from logs.logger import BoundedQueueHandler, COLOR_LOG_FORMAT, DATE_FORMAT, LOG_FORMAT  # noqa: E402
+
+
+if __name__ == "__main__":
+    iterations = 20000
+    with tempfile.TemporaryDirectory() as tmp, open(os.devnull, "w") as devnull:
+        def measure(logger):
+            started = time.perf_counter()
+            for i in range(iterations):
+                logger.info("📊 통계 조회 요청 node=%s healthy=%d", "node-01", i)
+            return (time.perf_counter() - started) / iterations * 1e6
+
+        sync_logger = logging.getLogger("bench.sync")
+        sync_logger.propagate = False
+        sync_logger.setLevel(logging.DEBUG)
+        color_handler = logging.StreamHandler(devnull)
+        color_handler.setFormatter(colorlog.ColoredFormatter(COLOR_LOG_FORMAT, datefmt=DATE_FORMAT))
+        sync_file = logging.FileHandler(os.path.join(tmp, "sync.log"), encoding="utf-8")
+        sync_file.setFormatter(colorlog.ColoredFormatter(COLOR_LOG_FORMAT, datefmt=DATE_FORMAT))
+        sync_logger.addHandler(color_handler)
+        sync_logger.addHandler(sync_file)
+        sync_us = measure(sync_logger)
+
+        queued_logger = logging.getLogger("bench.queued")
+        queued_logger.propagate = False
+        queued_logger.setLevel(logging.DEBUG)
+        bench_queue = queue.Queue(maxsize=iterations + 1)
+        queue_handler = BoundedQueueHandler(bench_queue)
+        queued_file = logging.FileHandler(os.path.join(tmp, "queued.log"), encoding="utf-8")
+        queued_file.setFormatter(logging.Formatter(LOG_FORMAT, datefmt=DATE_FORMAT))
+        listener = logging.handlers.QueueListener(bench_queue, queued_file)
+        listener.start()
+        queued_logger.addHandler(queue_handler)
+        queued_us = measure(queued_logger)
+        listener.stop()
+
+        sync_file.close()
+        queued_file.close()
+
+    print(f"sync handlers : {sync_us:6.1f} us/call")
+    print(f"queue handler : {queued_us:6.1f} us/call (dropped={queue_handler.dropped})")
@@ -0,0 +1,27 @@
+"""
+요청 기록 오버헤드 측정
+
+실행: python scripts/bench_metrics.py
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from services.metrics_service import record_http_request, registry  # noqa: E402
+
+
+if __name__ == "__main__":
+    routes = [f"/api/route-{i}" for i in range(20)]
+    count = 200000
+
+    started = time.perf_counter()
+    for i in range(count):
+        record_http_request(routes[i % 20], 200 if i % 50 else 500, 0.012)
+    elapsed = time.perf_counter() - started
+
+    started = time.perf_counter()
+    body = registry.exposition()
+    scrape = time.perf_counter() - started
+    print(f"record: {elapsed / count * 1e9:.0f} ns/request, scrape: {scrape * 1000:.1f} ms ({len(body)} bytes)")
@@ -0,0 +1,108 @@
+"""
+모니터링 페이지 로딩 비교 (개별 API 4회 순차/병렬 vs 통합 API 1회)
+sqlite 임시 DB에 24시간 분량(컨테이너 50개, 노드 20개, 1분 간격)을 적재해 실제 서버로 측정
+
+실행: python scripts/bench_monitoring_page.py
+"""
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+import math
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+
+import httpx
+import uvicorn
+from fastapi import FastAPI
+from sqlalchemy import create_engine, event
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from db.database import Base, SessionLocal, get_db  # noqa: E402
+from models.metric import ContainerMetricDB, NodeDiskIoDB, IoHourlyStatDB  # noqa: E402
+from api.middleware import RequestMetricsMiddleware  # noqa: E402
+from api.routes.auth import get_current_user_from_token  # noqa: E402
+from api.routes.monitoring import router  # noqa: E402
+
+
+def main() -> None:
+    db_path = os.path.join(tempfile.mkdtemp(), "monitoring_bench.db")
+    engine = create_engine(f"sqlite:///{db_path}", connect_args={"check_same_thread": False})
+
+    @event.listens_for(engine, "connect")
+    def _register_mysql_functions(conn, _):
+        conn.create_function("FLOOR", 1, lambda x: math.floor(x) if x is not None else None)
+        conn.create_function(
+            "UNIX_TIMESTAMP", 1,
+            lambda x: datetime.fromisoformat(x).replace(tzinfo=timezone.utc).timestamp() if x else None
+        )
+
+    Base.metadata.create_all(engine, tables=[
+        ContainerMetricDB.__table__, NodeDiskIoDB.__table__, IoHourlyStatDB.__table__
+    ])
+    SessionLocal.configure(bind=engine)
+
+    now = datetime.utcnow()
+    with engine.begin() as conn:
+        minutes = 24 * 60
+        conn.execute(ContainerMetricDB.__table__.insert(), [
+            {"container_id": c, "network_rx_bps": 1_000_000 + c, "network_tx_bps": 500_000 + c,
+             "collected_at": now - timedelta(minutes=m)}
+            for c in range(50) for m in range(minutes)
+        ])
+        conn.execute(NodeDiskIoDB.__table__.insert(), [
+            {"node_id": n, "read_bytes": (minutes - m) * 60_000_000, "write_bytes": (minutes - m) * 30_000_000,
+             "collected_at": now - timedelta(minutes=m)}
+            for n in range(20) for m in range(minutes)
+        ])
+
+    app = FastAPI()
+    app.add_middleware(RequestMetricsMiddleware)
+    app.include_router(router)
+    app.dependency_overrides[get_current_user_from_token] = lambda: None
+
+    def _get_db_override():
+        db = SessionLocal()
+        try:
+            yield db
+        finally:
+            db.close()
+    app.dependency_overrides[get_db] = _get_db_override
+
+    server = uvicorn.Server(uvicorn.Config(app, port=8799, log_level="error"))
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.05)
+
+    base = "http://127.0.0.1:8799/api/monitoring"
+    paths = ["/network-traffic", "/disk-io", "/response-time", "/request-status"]
+    rounds = 30
+
+    with httpx.Client(base_url=base) as client, ThreadPoolExecutor(4) as pool:
+        started = time.perf_counter()
+        client.get("/all")
+        print(f"first load (cold rollup): {(time.perf_counter() - started) * 1000:.1f} ms")
+
+        def measure(load) -> float:
+            samples = []
+            for _ in range(rounds):
+                started = time.perf_counter()
+                load()
+                samples.append((time.perf_counter() - started) * 1000)
+            return statistics.median(samples)
+
+        sequential = measure(lambda: [client.get(p).raise_for_status() for p in paths])
+        parallel = measure(lambda: list(pool.map(lambda p: client.get(p).raise_for_status(), paths)))
+        combined = measure(lambda: client.get("/all").raise_for_status())
+
+    print(f"4 sequential calls: {sequential:.1f} ms")
+    print(f"4 parallel calls:   {parallel:.1f} ms")
+    print(f"1 combined call:    {combined:.1f} ms")
+    server.should_exit = True
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+로컬 HTTP 스텁 수신기로 전송/병합/재시도 확인
+
+실행: python scripts/bench_notifications.py
+"""
+import asyncio
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from services import notification_service  # noqa: E402
+from services.notification_service import NotificationDispatcher, enqueue_notifications  # noqa: E402
+from models.notification import NotificationOutboxDB  # noqa: E402
+
+
+if __name__ == "__main__":
+    import threading
+    from http.server import BaseHTTPRequestHandler, HTTPServer
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+    import tempfile
+
+    received = []
+
+    class StubReceiver(BaseHTTPRequestHandler):
+        """처음 두 요청은 503으로 실패시키고 이후 요청은 받아서 기록"""
+        def do_POST(self):
+            body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+            if len(received) < 2:
+                received.append(None)
+                self.send_response(503)
+            else:
+                received.append(body)
+                self.send_response(200)
+            self.end_headers()
+
+        def log_message(self, *args):
+            pass
+
+    server = HTTPServer(("127.0.0.1", 0), StubReceiver)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    stub_url = f"http://127.0.0.1:{server.server_port}/hook"
+
+    db_path = os.path.join(tempfile.mkdtemp(), "outbox.db")
+    engine = create_engine(f"sqlite:///{db_path}", connect_args={"check_same_thread": False})
+    NotificationOutboxDB.__table__.create(engine)
+    TestSession = sessionmaker(bind=engine)
+
+    async def run_demo():
+        dispatcher = NotificationDispatcher(
+            session_factory=TestSession, destinations=[stub_url],
+            poll_interval=0.2, coalesce_window=0.1, backoff_base=0.2
+        )
+        notification_service.notification_dispatcher = dispatcher
+        await dispatcher.start()
+
+        db = TestSession()
+        started = time.perf_counter()
+        await asyncio.to_thread(
+            enqueue_notifications, db,
+            [{"id": f"ALT-{i:03d}", "alert_type": "High CPU Usage"} for i in range(120)]
+        )
+        while dispatcher.stats()["sent"] < 120 and time.perf_counter() - started < 10:
+            await asyncio.sleep(0.05)
+        await dispatcher.stop()
+
+        digests = [body for body in received if body]
+        print(f"stub received {len(received)} requests ({len(digests)} digests, sizes {[d['count'] for d in digests]})")
+        print(dispatcher.stats())
+
+    asyncio.run(run_demo())
@@ -0,0 +1,26 @@
+"""
+바쁜 스레드 하나를 2초 동안 샘플링해 결과와 오버헤드 출력
+
+실행: python scripts/bench_profiler.py
+"""
+import os
+import sys
+import threading
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from services.profiler_service import profiler  # noqa: E402
+
+
+if __name__ == "__main__":
+    def busy_loop(stop: threading.Event):
+        while not stop.is_set():
+            sum(i * i for i in range(10000))
+
+    stop = threading.Event()
+    worker = threading.Thread(target=busy_loop, args=(stop,), name="busy", daemon=True)
+    worker.start()
+    result = profiler.profile(2.0, by_thread=True)
+    stop.set()
+    print(result["collapsed"][:500])
+    print({key: value for key, value in result.items() if key != "collapsed"})
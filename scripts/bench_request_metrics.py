@@ -0,0 +1,33 @@
+"""
+기록 오버헤드와 분위수 정확도 측정
+
+실행: python scripts/bench_request_metrics.py
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from services.request_metrics_service import RequestMetrics  # noqa: E402
+
+
+if __name__ == "__main__":
+    import random
+
+    metrics = RequestMetrics()
+    samples = [random.lognormvariate(3, 0.8) for _ in range(200000)]
+    routes = [f"/api/route-{i}" for i in range(20)]
+
+    started = time.perf_counter()
+    for i, value in enumerate(samples):
+        metrics.record(routes[i % 20], 200 if i % 50 else 500, value)
+    elapsed = time.perf_counter() - started
+
+    _, series = metrics.latency_series()
+    exact = sorted(samples)
+    for q in (0.5, 0.95, 0.99):
+        estimate = series[q][-1]
+        actual = exact[int(q * (len(exact) - 1))]
+        print(f"p{int(q * 100)}: sketch={estimate:.2f}ms exact={actual:.2f}ms error={abs(estimate - actual) / actual * 100:.2f}%")
+    print(f"record: {elapsed / len(samples) * 1e9:.0f} ns/request, status={metrics.status_distribution()}")
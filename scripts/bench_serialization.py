@@ -0,0 +1,68 @@
+"""
+1000개 노드 목록 페이지의 직렬화 CPU 시간 비교 (기존 경로 vs 고속 경로)
+
+실행: python scripts/bench_serialization.py
+"""
+from typing import Callable
+import asyncio
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from fastapi.responses import JSONResponse  # noqa: E402
+from api.responses import fast_response  # noqa: E402
+from models.base_response import BaseResponse  # noqa: E402
+
+
+if __name__ == "__main__":
+    from fastapi.routing import serialize_response
+    from fastapi.utils import create_model_field
+    from models import Node, NodeList, Pagination
+    from models.node import ResourceUsage, MemoryInfo, DiskInfo
+    import json
+    import time
+    import warnings
+
+    warnings.simplefilter("ignore", DeprecationWarning)  # 기존 경로의 .dict() 경고
+    loop = asyncio.new_event_loop()
+
+    nodes = [
+        Node(
+            name=f"worker-{i:04d}",
+            ip=f"10.0.{i // 256}.{i % 256}",
+            role="worker",
+            status="Ready",
+            cpu=ResourceUsage(cores=16, usage=37.5),
+            memory=MemoryInfo(total=64, usage=61.2),
+            disk=DiskInfo(total=512, usage=44.0),
+            containers=23,
+            uptime="N/A",
+            last_heartbeat="2026-10-19T09:30:00Z"
+        )
+        for i in range(1000)
+    ]
+    node_list = NodeList(nodes=nodes, pagination=Pagination(page=1, per_page=1000, total=1000, total_pages=1))
+    field = create_model_field(name="Response_get_nodes", type_=BaseResponse, mode="serialization")
+
+    def legacy() -> bytes:
+        # 기존: .dict() 후 BaseResponse 생성 → FastAPI 재검증/직렬화 → json.dumps
+        content = BaseResponse.success_response(data=node_list.dict(), message="Nodes retrieved successfully")
+        serialized = loop.run_until_complete(serialize_response(field=field, response_content=content))
+        return JSONResponse(serialized).body
+
+    def fast() -> bytes:
+        content = BaseResponse.success_response(data=node_list, message="Nodes retrieved successfully")
+        return fast_response(content).body
+
+    def measure(fn: Callable[[], bytes], rounds: int = 50) -> float:
+        fn()
+        started = time.process_time()
+        for _ in range(rounds):
+            fn()
+        return (time.process_time() - started) / rounds * 1000
+
+    assert json.loads(legacy())["data"] == json.loads(fast())["data"]
+    legacy_ms, fast_ms = measure(legacy), measure(fast)
+    print(f"1000 nodes: legacy {legacy_ms:.2f} ms CPU, fast {fast_ms:.2f} ms CPU "
+          f"({(1 - fast_ms / legacy_ms) * 100:.0f}% saved, {len(fast())} bytes)")
@@ -0,0 +1,51 @@
+"""
+읽기 지연 시간을 프로세스 내 dict와 비교하고 워커 간 무효화 확인
+
+실행: python scripts/bench_shared_cache.py
+"""
+from typing import Any, Dict
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from services.shared_cache_service import SharedMemoryCache  # noqa: E402
+
+
+if __name__ == "__main__":
+
+    keys = [f"token-{i}" for i in range(1000)]
+    user = (1, "admin", "admin@example.com", "admin")
+
+    local: Dict[str, Any] = {}
+    cache = SharedMemoryCache("bench", slots=4096, slot_size=256)
+    for key in keys:
+        local[key] = (time.time() + 60, user)
+        cache.set(key, user, ttl=60)
+
+    def bench(label: str, fn, rounds: int = 200) -> None:
+        started = time.perf_counter()
+        for _ in range(rounds):
+            for key in keys:
+                fn(key)
+        per_op = (time.perf_counter() - started) / (rounds * len(keys))
+        print(f"{label:<28} {per_op * 1e9:8.0f} ns/get")
+
+    def dict_get(key):
+        entry = local.get(key)
+        return entry[1] if entry is not None and entry[0] > time.time() else None
+
+    bench("in-process dict (TTL)", dict_get)
+    bench("shared memory (seqlock)", cache.get)
+
+    # 자식 프로세스(워커)가 채운 값/무효화가 부모에서 보이는지 확인
+    pid = os.fork()
+    if pid == 0:
+        cache.set("from-child", "hello", ttl=60)
+        cache.delete("token-0")
+        os._exit(0)
+    os.waitpid(pid, 0)
+    print(f"child write visible: {cache.get('from-child')!r}, child delete visible: {cache.get('token-0') is None}")
+    cache.clear()
+    print(f"after clear: {cache.get('token-1')!r}, stats: {cache.stats()}")
@@ -0,0 +1,38 @@
+"""
+조회 성능 측정 (사일런스 5000개)
+
+실행: python scripts/bench_silences.py
+"""
+from datetime import datetime
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from services.silence_service import SilenceIndex  # noqa: E402
+
+
+if __name__ == "__main__":
+    import time
+    from datetime import timedelta
+
+    index = SilenceIndex()
+    now = datetime.utcnow()
+    for i in range(5000):
+        start = now + timedelta(minutes=random.randint(-600, 600))
+        if i % 3 == 0:
+            index.add(i, f"k8s-worker-{i}", {}, start, start + timedelta(hours=2))
+        elif i % 3 == 1:
+            index.add(i, None, {"namespace": f"ns-{i % 50}"}, start, start + timedelta(hours=2))
+        else:
+            index.add(i, f"app-{i % 40}-*", {}, start, start + timedelta(hours=2))
+
+    lookups = 100000
+    started = time.perf_counter()
+    hits = sum(
+        index.is_silenced(f"app-{i % 40}-pod-{i}", {"namespace": f"ns-{i % 70}"})
+        for i in range(lookups)
+    )
+    elapsed = time.perf_counter() - started
+    print(f"{len(index)} silences, {lookups} lookups ({hits} silenced): {elapsed / lookups * 1e6:.1f} us/lookup")
@@ -0,0 +1,83 @@
+"""
+정적 파일 빌드 스크립트
+static/js, static/css 파일을 콘텐츠 해시가 붙은 이름으로 static/dist/ 에 복사하고
+gzip(.gz)/brotli(.br) 사전 압축본과 manifest.json을 만든다.
+
+실행: python scripts/build_static.py  (배포 전 또는 정적 파일 수정 후)
+brotli 패키지가 없으면 .br 파일은 건너뛴다.
+"""
+import gzip
+import json
+import os
+import shutil
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from api.static_assets import ASSET_DIRS, DIST_DIRNAME, MANIFEST_NAME, STATIC_DIR, content_hash
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# 빌드 시 한 번만 압축하므로 최고 압축률 사용
+GZIP_LEVEL = 9
+BROTLI_QUALITY = 11
+
+# 이보다 작은 파일은 압축본을 만들지 않음 (헤더 오버헤드가 더 큼)
+MIN_COMPRESS_SIZE = 512
+
+
+def build(static_dir: str = STATIC_DIR) -> dict:
+    dist_dir = os.path.join(static_dir, DIST_DIRNAME)
+    shutil.rmtree(dist_dir, ignore_errors=True)
+
+    manifest = {}
+    totals = {"files": 0, "raw": 0, "gzip": 0, "br": 0}
+    for asset_dir in ASSET_DIRS:
+        for root, _, files in os.walk(os.path.join(static_dir, asset_dir)):
+            for name in sorted(files):
+                source_path = os.path.join(root, name)
+                source = os.path.relpath(source_path, static_dir).replace(os.sep, "/")
+                with open(source_path, "rb") as f:
+                    data = f.read()
+
+                digest = content_hash(data)
+                stem, ext = os.path.splitext(source)
+                target = f"{DIST_DIRNAME}/{stem}.{digest}{ext}"
+                target_path = os.path.join(static_dir, *target.split("/"))
+                os.makedirs(os.path.dirname(target_path), exist_ok=True)
+                with open(target_path, "wb") as f:
+                    f.write(data)
+
+                totals["files"] += 1
+                totals["raw"] += len(data)
+                if len(data) >= MIN_COMPRESS_SIZE:
+                    # mtime=0으로 고정해 같은 입력이면 같은 압축 결과가 나오게 함
+                    compressed = gzip.compress(data, compresslevel=GZIP_LEVEL, mtime=0)
+                    with open(target_path + ".gz", "wb") as f:
+                        f.write(compressed)
+                    totals["gzip"] += len(compressed)
+                    if brotli is not None:
+                        compressed = brotli.compress(data, quality=BROTLI_QUALITY)
+                        with open(target_path + ".br", "wb") as f:
+                            f.write(compressed)
+                        totals["br"] += len(compressed)
+                else:
+                    totals["gzip"] += len(data)
+                    totals["br"] += len(data)
+
+                manifest[source] = {"file": target, "hash": digest}
+
+    with open(os.path.join(dist_dir, MANIFEST_NAME), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    return totals
+
+
+if __name__ == "__main__":
+    totals = build()
+    line = f"{totals['files']} files, {totals['raw'] / 1024:.1f} KB -> gzip {totals['gzip'] / 1024:.1f} KB"
+    if brotli is not None:
+        line += f", br {totals['br'] / 1024:.1f} KB"
+    print(line)
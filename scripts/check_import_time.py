@@ -0,0 +1,83 @@
+"""
+워커 콜드 스타트 임포트 시간 점검 스크립트
+새 프로세스에서 python -X importtime -c "import main"을 여러 번 실행해 main 모듈의 누적 임포트 시간(최솟값)을 재고,
+예산(IMPORT_TIME_BUDGET_MS)을 넘으면 가장 오래 걸린 모듈 목록과 함께 실패(종료 코드 1)한다.
+
+또한 임포트만으로 DB 드라이버(pymysql), numpy, colorlog가 로드되거나 소켓 연결이 일어나면 실패한다.
+(DB 엔진, 로거, numpy를 쓰는 서비스는 처음 사용할 때 초기화되어야 함)
+
+실행: python scripts/check_import_time.py [반복 횟수]  (CI 또는 의존성 추가 후)
+"""
+import os
+import subprocess
+import sys
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+# main 임포트 시간 예산 (밀리초, 측정 환경에 맞게 환경변수로 조정)
+IMPORT_TIME_BUDGET_MS = float(os.getenv("IMPORT_TIME_BUDGET_MS", "2000"))
+
+# 임포트 시점에 로드되면 안 되는 모듈 (처음 사용할 때 로드)
+LAZY_MODULES = ("pymysql", "numpy", "colorlog")
+
+# 임포트 중 소켓 연결/로그 파일 생성을 감지하는 코드
+_PROBE = """
+import os, socket, sys
+def _deny(*args, **kwargs):
+    raise SystemExit("import-time network connection: %r" % (args[1:],))
+socket.socket.connect = _deny
+log_dir = os.path.join("logs", "log")
+before = set(os.listdir(log_dir)) if os.path.isdir(log_dir) else set()
+import main
+after = set(os.listdir(log_dir)) if os.path.isdir(log_dir) else set()
+loaded = [name for name in __LAZY_MODULES__ if name in sys.modules]
+if loaded:
+    raise SystemExit("loaded at import time: %s" % ", ".join(loaded))
+if after - before:
+    raise SystemExit("log files created at import time: %s" % ", ".join(sorted(after - before)))
+"""
+
+
+def _parse(stderr: str):
+    """-X importtime 출력 → [(누적 마이크로초, 자체 마이크로초, 모듈 이름)]"""
+    entries = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        entries.append((int(cumulative_us), int(self_us), name.rstrip()))
+    return entries
+
+
+def measure():
+    """새 인터프리터에서 main 임포트 1회 측정 (누적 ms, 자체 시간 상위 모듈)"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _PROBE.replace("__LAZY_MODULES__", repr(LAZY_MODULES))],
+        cwd=PROJECT_ROOT, capture_output=True, text=True,
+    )
+    if result.returncode != 0:
+        message = [line for line in result.stderr.splitlines() if not line.startswith("import time:")]
+        raise RuntimeError("\n".join(message[-5:]))
+    entries = _parse(result.stderr)
+    total = next(cumulative for cumulative, _, name in entries if name.strip() == "main")
+    slowest = sorted(entries, key=lambda entry: entry[1], reverse=True)[:15]
+    return total / 1000, slowest
+
+
+if __name__ == "__main__":
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 3
+    try:
+        results = [measure() for _ in range(runs)]
+    except RuntimeError as e:
+        print(f"FAIL: {e}")
+        sys.exit(1)
+
+    best_ms, slowest = min(results, key=lambda result: result[0])
+    print(f"import main: {best_ms:.0f} ms (best of {runs}, budget {IMPORT_TIME_BUDGET_MS:.0f} ms)")
+    if best_ms > IMPORT_TIME_BUDGET_MS:
+        print("slowest modules (self time):")
+        for cumulative, self_us, name in slowest:
+            print(f"  {self_us / 1000:8.1f} ms  (cumulative {cumulative / 1000:8.1f} ms)  {name.strip()}")
+        print("FAIL: import time over budget")
+        sys.exit(1)
+    print("OK")
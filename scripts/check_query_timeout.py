@@ -0,0 +1,30 @@
+"""
+SQLite에서 긴 쿼리가 예산 안에 중단되는지 확인
+
+실행: python scripts/check_query_timeout.py
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from services.query_timeout_service import QueryTimeoutError, query_timeouts  # noqa: E402
+
+
+if __name__ == "__main__":
+    from sqlalchemy import create_engine, text
+
+    engine = create_engine("sqlite://")
+    query_timeouts.instrument(engine)
+    slow = text("WITH RECURSIVE n(i) AS (SELECT 1 UNION ALL SELECT i + 1 FROM n) SELECT count(*) FROM n")
+
+    with engine.connect() as conn:
+        query_timeouts.start(0.2)
+        started = time.perf_counter()
+        try:
+            conn.execute(slow)
+        except QueryTimeoutError as e:
+            print(f"cancelled after {(time.perf_counter() - started) * 1000:.0f} ms: {e}")
+        query_timeouts.start(1.0)
+        print("connection still usable:", conn.execute(text("SELECT 1")).scalar())
@@ -0,0 +1,177 @@
+"""
+단일 프로세스 vs 멀티 워커 부하 비교 스크립트
+서버를 모드별로 띄우고(single: uvicorn main:app, multi: serve.py) 같은 부하를 걸어
+처리량(req/s)과 지연 시간(p50/p99)을 비교한다.
+
+부하 생성기는 별도 프로세스 여러 개에서 keep-alive 연결로 GET 요청을 반복한다
+(클라이언트가 서버와 같은 CPU를 쓰므로 결과는 상대 비교용).
+
+실행: python scripts/load_test.py [--path /] [--duration 10] [--connections 64] [--workers N] [--mode both]
+"""
+import argparse
+import asyncio
+import multiprocessing
+import os
+import signal
+import socket
+import subprocess
+import sys
+import time
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+
+async def _connection(host: str, port: int, request: bytes, deadline: float, latencies: list, errors: list) -> None:
+    """keep-alive 연결 하나로 deadline까지 요청 반복"""
+    reader = writer = None
+    while time.monotonic() < deadline:
+        try:
+            if writer is None:
+                reader, writer = await asyncio.open_connection(host, port)
+            started = time.perf_counter()
+            writer.write(request)
+            status_line = await reader.readline()
+            length, close = 0, False
+            while True:
+                line = await reader.readline()
+                if line in (b"\r\n", b""):
+                    break
+                name, _, value = line.decode("latin-1").partition(":")
+                name = name.strip().lower()
+                if name == "content-length":
+                    length = int(value)
+                elif name == "connection" and value.strip().lower() == "close":
+                    close = True
+            await reader.readexactly(length)
+            latencies.append(time.perf_counter() - started)
+            if not status_line.startswith(b"HTTP/1.1 2") and not status_line.startswith(b"HTTP/1.1 3"):
+                errors.append(status_line.decode("latin-1").strip())
+            if close:
+                writer.close()
+                writer = None
+        except (OSError, asyncio.IncompleteReadError, ValueError) as e:
+            errors.append(type(e).__name__)
+            if writer is not None:
+                writer.close()
+            writer = None
+            await asyncio.sleep(0.01)
+    if writer is not None:
+        writer.close()
+
+
+def _client(host: str, port: int, path: str, connections: int, duration: float, headers: dict, queue) -> None:
+    request = f"GET {path} HTTP/1.1\r\nHost: {host}:{port}\r\n"
+    request += "".join(f"{name}: {value}\r\n" for name, value in headers.items())
+    request = (request + "\r\n").encode()
+    latencies, errors = [], []
+
+    async def run():
+        deadline = time.monotonic() + duration
+        await asyncio.gather(*(
+            _connection(host, port, request, deadline, latencies, errors) for _ in range(connections)
+        ))
+
+    asyncio.run(run())
+    queue.put((latencies, errors))
+
+
+def run_load(host: str, port: int, path: str, connections: int, duration: float,
+             clients: int, headers: dict) -> dict:
+    """부하 실행 → {"requests", "rps", "p50_ms", "p99_ms", "errors"}"""
+    queue = multiprocessing.Queue()
+    per_client = max(1, connections // clients)
+    processes = [
+        multiprocessing.Process(target=_client, args=(host, port, path, per_client, duration, headers, queue))
+        for _ in range(clients)
+    ]
+    for process in processes:
+        process.start()
+    latencies, errors = [], []
+    for _ in processes:
+        client_latencies, client_errors = queue.get()
+        latencies.extend(client_latencies)
+        errors.extend(client_errors)
+    for process in processes:
+        process.join()
+
+    latencies.sort()
+
+    def percentile(p):
+        return latencies[min(len(latencies) - 1, int(len(latencies) * p))] * 1000 if latencies else 0.0
+
+    return {
+        "requests": len(latencies),
+        "rps": len(latencies) / duration,
+        "p50_ms": percentile(0.50),
+        "p99_ms": percentile(0.99),
+        "errors": len(errors),
+    }
+
+
+def _wait_for_port(host: str, port: int, timeout: float = 30) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with socket.create_connection((host, port), timeout=1):
+                return
+        except OSError:
+            time.sleep(0.2)
+    raise RuntimeError(f"서버가 {timeout}s 안에 시작되지 않았습니다 ({host}:{port})")
+
+
+def start_server(mode: str, host: str, port: int, workers: int) -> subprocess.Popen:
+    if mode == "single":
+        command = [sys.executable, "-m", "uvicorn", "main:app", "--host", host, "--port", str(port),
+                   "--no-access-log"]
+    else:
+        command = [sys.executable, "serve.py", "--host", host, "--port", str(port), "--workers", str(workers)]
+    process = subprocess.Popen(command, cwd=PROJECT_ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        _wait_for_port(host, port)
+    except RuntimeError:
+        process.kill()
+        raise
+    return process
+
+
+def stop_server(process: subprocess.Popen) -> None:
+    process.send_signal(signal.SIGTERM)
+    try:
+        process.wait(timeout=40)
+    except subprocess.TimeoutExpired:
+        process.kill()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="단일 프로세스 vs 멀티 워커 부하 비교")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--path", default="/")
+    parser.add_argument("--duration", type=float, default=10)
+    parser.add_argument("--connections", type=int, default=64)
+    parser.add_argument("--clients", type=int, default=max(1, min(4, os.cpu_count() or 1)),
+                        help="부하 생성 프로세스 수")
+    parser.add_argument("--workers", type=int, default=int(os.getenv("WEB_CONCURRENCY", "0")) or os.cpu_count() or 1)
+    parser.add_argument("--mode", choices=("single", "multi", "both"), default="both")
+    parser.add_argument("--token", default=os.getenv("LOAD_TEST_TOKEN"), help="Authorization: Bearer 토큰")
+    args = parser.parse_args()
+
+    headers = {"Authorization": f"Bearer {args.token}"} if args.token else {}
+    modes = ("single", "multi") if args.mode == "both" else (args.mode,)
+    print(f"GET {args.path}  duration={args.duration}s connections={args.connections} "
+          f"clients={args.clients} workers={args.workers} cpus={os.cpu_count()}")
+    results = {}
+    for mode in modes:
+        server = start_server(mode, args.host, args.port, args.workers)
+        try:
+            # 워밍업 (워커별 지연 초기화)
+            run_load(args.host, args.port, args.path, args.connections, 1, args.clients, headers)
+            results[mode] = run_load(args.host, args.port, args.path, args.connections,
+                                     args.duration, args.clients, headers)
+        finally:
+            stop_server(server)
+        result = results[mode]
+        print(f"{mode:>6}: {result['rps']:8.0f} req/s  p50 {result['p50_ms']:7.1f} ms  "
+              f"p99 {result['p99_ms']:7.1f} ms  requests {result['requests']}  errors {result['errors']}")
+    if len(results) == 2 and results["single"]["rps"]:
+        print(f"multi/single: {results['multi']['rps'] / results['single']['rps']:.2f}x")
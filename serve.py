@@ -0,0 +1,211 @@
+"""
+프로덕션 실행 진입점 (멀티 워커)
+부모 프로세스가 앱을 미리 임포트(preload)하고 리스닝 소켓을 연 뒤 워커 N개를 fork한다.
+워커는 부모가 임포트한 모듈을 copy-on-write로 공유하므로 워커별 임포트 비용과 메모리가 줄어든다.
+
+- 워커 수: --workers 또는 WEB_CONCURRENCY, 기본값은 사용 가능한 CPU 수
+- 이벤트 루프/HTTP 파서: uvloop, httptools가 설치되어 있으면 사용 (없으면 asyncio, h11)
+- SIGTERM/SIGINT: 모든 워커에 전달 → 워커는 새 연결을 받지 않고 처리 중인 요청을 최대
+  --graceful-timeout초 동안 마친 뒤 종료 (그 후에도 남은 워커는 강제 종료)
+- 비정상 종료한 워커는 다시 띄운다 (연속 실패 시 간격을 늘림)
+
+실행: python serve.py --host 0.0.0.0 --port 8000
+(개발용 단일 프로세스 실행은 python -m uvicorn main:app --reload)
+
+fork 방식이므로 Linux/macOS 전용이다. 부모는 앱을 임포트만 하고 DB 엔진, 로거, 백그라운드 작업은
+각 워커에서 처음 사용할 때(또는 startup 이벤트에서) 초기화된다.
+
+워커별 메모리 상태와 워커 간 공유 방식:
+- 세션/통계 캐시: fork 전에 만든 공유 메모리 캐시 (services/shared_cache_service.py)
+- 실시간 푸시: 알림/이벤트는 공유 메모리 링으로 다른 워커의 구독자에게 중계 (최대 0.1초 지연),
+  노드 상태/메트릭은 워커마다 DB를 조회
+- 사일런스 인덱스: silences 데이터 버전이 바뀌면 워커마다 DB에서 다시 구성 (최대 1초 지연)
+- /metrics, 모니터링 API의 요청 지표: 워커별 스냅샷을 공유 메모리에 5초마다 기록하고 조회 시 합산
+  (/metrics는 worker 라벨로 구분)
+- 그 밖의 프로세스 내 상태(프로파일러, 느린 쿼리 집계, 로그 큐 등)는 요청을 받은 워커의 값이다.
+공유 매핑은 부모가 임포트할 때 만들어지므로, uvicorn --workers처럼 워커마다 따로 임포트하는 방식에서는
+중계/합산이 되지 않고 워커별 값만 보인다.
+"""
+import argparse
+import importlib.util
+import os
+import signal
+import sys
+import threading
+import time
+
+import uvicorn
+
+# 워커 재시작 간격 (연속 실패 시 두 배씩, 최대값까지)
+RESTART_BACKOFF_INITIAL = 0.5
+RESTART_BACKOFF_MAX = 30.0
+
+# 이 시간(초) 이상 살아 있던 워커가 종료되면 연속 실패로 보지 않음
+HEALTHY_UPTIME = 10.0
+
+
+def default_workers() -> int:
+    """기본 워커 수 (WEB_CONCURRENCY 또는 이 프로세스가 쓸 수 있는 CPU 수)"""
+    if os.getenv("WEB_CONCURRENCY"):
+        return max(1, int(os.environ["WEB_CONCURRENCY"]))
+    try:
+        return max(1, len(os.sched_getaffinity(0)))
+    except AttributeError:
+        return max(1, os.cpu_count() or 1)
+
+
+def event_loop_setup() -> str:
+    return "uvloop" if importlib.util.find_spec("uvloop") else "asyncio"
+
+
+def http_protocol() -> str:
+    return "httptools" if importlib.util.find_spec("httptools") else "h11"
+
+
+def _log(message: str) -> None:
+    # 부모 프로세스는 log_manager를 쓰지 않음 (기록 스레드가 fork 후 워커에 없게 되므로)
+    print(f"[serve {os.getpid()}] {message}", file=sys.stderr, flush=True)
+
+
+class Supervisor:
+    """워커 fork/감시/종료"""
+
+    def __init__(self, config: uvicorn.Config, workers: int, graceful_timeout: float):
+        self.config = config
+        self.workers = workers
+        self.graceful_timeout = graceful_timeout
+        self.children = {}  # pid → (워커 번호, 시작 시각)
+        self.stopping = False
+        self._backoff = {}  # 워커 번호 → 다음 재시작 대기 시간
+
+    def _spawn(self, worker_id: int, sockets) -> None:
+        pid = os.fork()
+        if pid == 0:
+            # 워커: 부모의 시그널 처리기를 해제하고 uvicorn이 SIGTERM/SIGINT를 처리하게 함
+            signal.signal(signal.SIGTERM, signal.SIG_DFL)
+            signal.signal(signal.SIGINT, signal.SIG_DFL)
+            os.environ["SERVER_WORKER_ID"] = str(worker_id)
+            code = 0
+            try:
+                server = uvicorn.Server(self.config)
+                server.run(sockets=sockets)
+            except BaseException as e:
+                print(f"[worker {os.getpid()}] {type(e).__name__}: {e}", file=sys.stderr, flush=True)
+                code = 1
+            finally:
+                sys.stdout.flush()
+                sys.stderr.flush()
+                os._exit(code)
+        self.children[pid] = (worker_id, time.monotonic())
+
+    def _signal(self, signum, frame) -> None:
+        if not self.stopping:
+            _log(f"{signal.Signals(signum).name} 수신: 워커 {len(self.children)}개 종료 대기 (최대 {self.graceful_timeout}s)")
+        self.stopping = True
+        for pid in list(self.children):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    def _reap(self) -> list:
+        """종료한 워커 회수 → [(워커 번호, 종료 상태, 가동 시간)]"""
+        exited = []
+        while self.children:
+            try:
+                pid, status = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                self.children.clear()
+                break
+            if pid == 0:
+                break
+            worker_id, started = self.children.pop(pid, (None, time.monotonic()))
+            if worker_id is not None:
+                exited.append((worker_id, status, time.monotonic() - started))
+        return exited
+
+    def run(self) -> int:
+        sockets = [self.config.bind_socket()]
+        signal.signal(signal.SIGTERM, self._signal)
+        signal.signal(signal.SIGINT, self._signal)
+
+        _log(f"워커 {self.workers}개 시작: http://{self.config.host}:{self.config.port} "
+             f"(loop={self.config.loop}, http={self.config.http})")
+        for worker_id in range(self.workers):
+            self._spawn(worker_id, sockets)
+
+        pending_restarts = {}  # 워커 번호 → 재시작 시각
+        while not self.stopping:
+            for worker_id, status, uptime in self._reap():
+                backoff = RESTART_BACKOFF_INITIAL if uptime >= HEALTHY_UPTIME else \
+                    min(self._backoff.get(worker_id, RESTART_BACKOFF_INITIAL / 2) * 2, RESTART_BACKOFF_MAX)
+                self._backoff[worker_id] = backoff
+                _log(f"워커 {worker_id} 종료 (status={status}, 가동 {uptime:.1f}s), {backoff:.1f}s 후 재시작")
+                pending_restarts[worker_id] = time.monotonic() + backoff
+            now = time.monotonic()
+            for worker_id, due in list(pending_restarts.items()):
+                if due <= now and not self.stopping:
+                    del pending_restarts[worker_id]
+                    self._spawn(worker_id, sockets)
+            time.sleep(0.2)
+
+        # 종료: 워커가 처리 중인 요청을 마칠 때까지 대기 후 남은 워커 강제 종료
+        deadline = time.monotonic() + self.graceful_timeout + 5
+        while self.children and time.monotonic() < deadline:
+            self._reap()
+            time.sleep(0.1)
+        for pid in list(self.children):
+            _log(f"워커 {pid} 강제 종료")
+            try:
+                os.kill(pid, signal.SIGKILL)
+            except ProcessLookupError:
+                pass
+        self._reap()
+        for sock in sockets:
+            sock.close()
+        _log("종료")
+        return 0
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="멀티 워커 프로덕션 서버")
+    parser.add_argument("--host", default=os.getenv("HOST", "0.0.0.0"))
+    parser.add_argument("--port", type=int, default=int(os.getenv("PORT", "8000")))
+    parser.add_argument("--workers", type=int, default=default_workers())
+    parser.add_argument("--graceful-timeout", type=float, default=float(os.getenv("GRACEFUL_TIMEOUT", "30")),
+                        help="SIGTERM 후 처리 중인 요청을 기다리는 최대 시간(초)")
+    parser.add_argument("--backlog", type=int, default=2048)
+    parser.add_argument("--keep-alive", type=int, default=5)
+    parser.add_argument("--access-log", action="store_true", help="uvicorn 접근 로그 출력 (기본: 끔)")
+    args = parser.parse_args(argv)
+
+    # 공유 메모리 영역(워커별 지표 스냅샷 등)을 실제 워커 수에 맞게 만들도록 임포트 전에 넘김
+    os.environ["WEB_CONCURRENCY"] = str(args.workers)
+    # 앱 미리 임포트 (워커가 copy-on-write로 공유)
+    from main import app
+
+    if threading.active_count() > 1:
+        _log(f"경고: 앱 임포트 중 스레드 {threading.active_count() - 1}개가 시작됨 (fork 후 워커에는 없음)")
+
+    config = uvicorn.Config(
+        app,
+        host=args.host,
+        port=args.port,
+        loop=event_loop_setup(),
+        http=http_protocol(),
+        backlog=args.backlog,
+        timeout_keep_alive=args.keep_alive,
+        timeout_graceful_shutdown=args.graceful_timeout,
+        access_log=args.access_log,
+        proxy_headers=True,
+    )
+    if args.workers == 1:
+        # 워커가 하나면 fork 없이 현재 프로세스에서 실행
+        _log(f"단일 워커: http://{args.host}:{args.port} (loop={config.loop}, http={config.http})")
+        uvicorn.Server(config).run()
+        return 0
+    return Supervisor(config, args.workers, args.graceful_timeout).run()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -8,6 +8,8 @@ from typing import List, Dict, Any, Optional
 from datetime import datetime, timedelta
 import json
 
+from services.shared_cache_service import session_cache
+
 class AdminDatabaseService:
     """관리자 페이지용 데이터베이스 서비스"""
     
@@ -241,6 +243,9 @@ class AdminDatabaseService:
             result = self.db.execute(text(query), params)
             
             self.db.commit()
+            if result.rowcount > 0:
+                # 캐시된 세션의 사용자 정보(역할 등)를 모든 워커에서 무효화
+                session_cache.clear()
             return result.rowcount > 0
             
         except Exception as e:
@@ -265,6 +270,8 @@ class AdminDatabaseService:
             ), {"user_id": user_id})
             
             self.db.commit()
+            if result.rowcount > 0:
+                session_cache.clear()
             return result.rowcount > 0
             
         except Exception as e:
@@ -0,0 +1,320 @@
+"""
+알림 규칙 백테스트 서비스
+저장된 노드/컨테이너 메트릭 이력에 규칙 조건을 NumPy 벡터 연산으로 적용하여
+규칙이 과거에 몇 번, 언제, 얼마나 오래 발생했을지 계산한다.
+"""
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+from pydantic import BaseModel
+from typing import Dict, Any, Optional, Tuple
+from datetime import datetime, timedelta, timezone
+import math
+import re
+import time
+
+import numpy as np
+
+# 규칙 조건식 (예: "CPU > 85% for 5min", "Memory >= 90%", "Disk < 10%")
+CONDITION_PATTERN = re.compile(
+    r"^\s*(?P<metric>[A-Za-z가-힣]+)\s*(?P<operator>>=|<=|>|<)\s*(?P<threshold>\d+(?:\.\d+)?)\s*%?"
+    r"\s*(?:for\s+(?P<for_value>\d+)\s*(?P<for_unit>sec|min|hour|s|m|h)s?)?\s*$",
+    re.IGNORECASE
+)
+
+METRIC_ALIASES = {
+    "cpu": "cpu",
+    "memory": "memory",
+    "mem": "memory",
+    "메모리": "memory",
+    "disk": "disk",
+    "디스크": "disk",
+}
+
+UNIT_SECONDS = {"s": 1, "sec": 1, "m": 60, "min": 60, "h": 3600, "hour": 3600}
+
+OPERATORS = {
+    ">": np.greater,
+    ">=": np.greater_equal,
+    "<": np.less,
+    "<=": np.less_equal,
+}
+
+# 메트릭 종류별 실제 컬럼명
+NODE_METRIC_COLUMNS = {"cpu": "cpu_usage", "memory": "memory_usage", "disk": "disk_usage"}
+CONTAINER_METRIC_COLUMNS = {"cpu": "cpu_percentage", "memory": "memory_percent"}
+
+# 대상별 최대 평가 포인트 수 (기간이 길면 해상도를 낮춰 조회량을 제한)
+MAX_POINTS_PER_TARGET = 8640
+MAX_BACKTEST_DAYS = 30
+
+# 평가 해상도 하한 (초, 에이전트 수집 주기보다 촘촘한 버킷은 의미가 없음)
+MIN_STEP_SECONDS = 60
+
+
+class RuleCondition(BaseModel):
+    """파싱된 알림 규칙 조건"""
+    metric: str  # 메트릭 종류 ("cpu", "memory", "disk")
+    operator: str  # 비교 연산자 (">", ">=", "<", "<=")
+    threshold: float  # 임계값
+    for_seconds: int = 0  # 조건이 연속으로 유지되어야 하는 시간 (초)
+
+
+def parse_rule_condition(condition: str) -> RuleCondition:
+    """규칙 조건식 문자열을 RuleCondition으로 변환 (형식이 잘못되면 ValueError)"""
+    match = CONDITION_PATTERN.match(condition or "")
+    if not match:
+        raise ValueError(f"Unsupported condition format: '{condition}'")
+
+    metric = METRIC_ALIASES.get(match.group("metric").lower())
+    if not metric:
+        raise ValueError(f"Unsupported metric: '{match.group('metric')}'")
+
+    for_seconds = 0
+    if match.group("for_value"):
+        for_seconds = int(match.group("for_value")) * UNIT_SECONDS[match.group("for_unit").lower()]
+
+    return RuleCondition(
+        metric=metric,
+        operator=match.group("operator"),
+        threshold=float(match.group("threshold")),
+        for_seconds=for_seconds
+    )
+
+
+def evaluate_rule_windows(
+    entity_ids: np.ndarray,
+    timestamps: np.ndarray,
+    values: np.ndarray,
+    operator: str,
+    threshold: float,
+    for_seconds: int = 0
+) -> Dict[str, np.ndarray]:
+    """
+    (대상, 시간) 순으로 정렬된 시계열에 규칙을 적용하여 발생 구간을 계산
+
+    조건이 연속으로 만족되는 구간(run)을 찾고, 구간 시작 후 for_seconds 이상 지난
+    첫 포인트를 발생 시각으로, 조건이 처음 깨진 포인트를 해소 시각으로 본다.
+    모든 계산은 반복문 없이 배열 연산으로 수행된다.
+
+    Returns:
+        dict: entity_index, fired_at, resolved_at(-1이면 구간 끝까지 지속), peak 배열
+    """
+    n = len(values)
+    empty = {
+        "entity_index": np.empty(0, dtype=np.int64),
+        "fired_at": np.empty(0, dtype=np.int64),
+        "resolved_at": np.empty(0, dtype=np.int64),
+        "peak": np.empty(0, dtype=np.float64),
+    }
+    if n == 0:
+        return empty
+
+    # 1. 포인트별 조건 만족 여부 (NaN은 비교 결과가 False)
+    breach = OPERATORS[operator](values, threshold)
+
+    # 2. 같은 대상 내 이전/다음 포인트와 비교하여 연속 구간의 시작/끝 표시
+    same_as_prev = np.zeros(n, dtype=bool)
+    same_as_prev[1:] = entity_ids[1:] == entity_ids[:-1]
+    same_as_next = np.zeros(n, dtype=bool)
+    same_as_next[:-1] = same_as_prev[1:]
+
+    prev_breach = np.zeros(n, dtype=bool)
+    prev_breach[1:] = breach[:-1]
+    next_breach = np.zeros(n, dtype=bool)
+    next_breach[:-1] = breach[1:]
+
+    starts = np.flatnonzero(breach & ~(prev_breach & same_as_prev))
+    ends = np.flatnonzero(breach & ~(next_breach & same_as_next))
+    if len(starts) == 0:
+        return empty
+
+    # 3. 대상 순번과 시간을 하나의 정렬 키로 합쳐 구간별 "for" 경과 지점을 이진 탐색
+    entity_rank = np.cumsum(~same_as_prev) - 1
+    base = timestamps.min()
+    span = int(timestamps.max() - base) + for_seconds + 1
+    sort_key = entity_rank.astype(np.int64) * span + (timestamps - base).astype(np.int64)
+    fire_idx = np.searchsorted(sort_key, sort_key[starts] + for_seconds, side="left")
+
+    fired = fire_idx <= ends
+    fire_idx = fire_idx[fired]
+    ends = ends[fired]
+    if len(fire_idx) == 0:
+        return empty
+
+    # 4. 해소 시각: 같은 대상의 다음 포인트가 있으면 그 시각, 없으면 아직 지속 중(-1)
+    has_next = same_as_next[ends]
+    resolved_idx = np.minimum(ends + 1, n - 1)
+    resolved_at = np.where(has_next, timestamps[resolved_idx], -1).astype(np.int64)
+
+    # 5. 발생 구간 내 최대(또는 최소) 값
+    reducer = np.maximum if operator in (">", ">=") else np.minimum
+    padded = np.append(values, np.nan)
+    bounds = np.empty(len(fire_idx) * 2, dtype=np.int64)
+    bounds[0::2] = fire_idx
+    bounds[1::2] = ends + 1
+    peak = reducer.reduceat(padded, bounds)[0::2]
+
+    return {
+        "entity_index": entity_rank[fire_idx].astype(np.int64),
+        "fired_at": timestamps[fire_idx].astype(np.int64),
+        "resolved_at": resolved_at,
+        "peak": peak,
+    }
+
+
+def min_step_seconds(days: int) -> int:
+    """기간에 허용하는 최소 해상도 (초, 대상별 포인트 수가 MAX_POINTS_PER_TARGET을 넘지 않도록)"""
+    return max(MIN_STEP_SECONDS, math.ceil(days * 86400 / MAX_POINTS_PER_TARGET))
+
+
+def _to_iso(epoch_seconds: int) -> str:
+    """epoch 초 → UTC ISO 문자열 (서버 로컬 시간대와 무관)"""
+    return datetime.fromtimestamp(int(epoch_seconds), tz=timezone.utc).replace(tzinfo=None).isoformat() + "Z"
+
+
+class AlertBacktestService:
+    """알림 규칙 백테스트 서비스"""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def resolve_target(self, target: str) -> Tuple[str, Optional[str]]:
+        """
+        규칙 대상 문자열을 (대상 종류, LIKE 패턴)으로 변환
+
+        "모든 노드"/"모든 컨테이너"는 패턴 없이 전체를, "k8s-worker-*" 같은 와일드카드는
+        노드 이름에 먼저 매칭하고 없으면 컨테이너 이름에 매칭한다.
+        """
+        lowered = (target or "").lower()
+        if "컨테이너" in lowered or "container" in lowered:
+            return "container", None
+        if "노드" in lowered or "node" in lowered:
+            return "node", None
+
+        pattern = lowered.replace("%", r"\%").replace("*", "%").replace("?", "_")
+        node_count = self.db.execute(
+            text("SELECT COUNT(*) FROM nodes WHERE node_name LIKE :pattern"),
+            {"pattern": pattern}
+        ).scalar()
+        return ("node" if node_count else "container"), pattern
+
+    def _load_series(
+        self, target_type: str, column: str, pattern: Optional[str],
+        start: datetime, end: datetime, step: int
+    ) -> Tuple[np.ndarray, Dict[int, str]]:
+        """(대상ID, 버킷 시각, 평균값) 배열과 대상 이름 맵 조회 (버킷 평균은 DB에서 계산)"""
+        params = {"start": start, "end": end, "step": step}
+        if target_type == "node":
+            name_sql = "SELECT id, node_name AS name FROM nodes"
+            series_sql = f"""
+                SELECT m.node_id AS entity_id,
+                       FLOOR(UNIX_TIMESTAMP(m.collected_at) / :step) * :step AS bucket,
+                       AVG(m.{column}) AS value
+                FROM metrics m
+                {"JOIN nodes n ON n.id = m.node_id AND n.node_name LIKE :pattern" if pattern else ""}
+                WHERE m.collected_at >= :start AND m.collected_at < :end
+                GROUP BY m.node_id, bucket
+                ORDER BY m.node_id, bucket
+            """
+            if pattern:
+                name_sql += " WHERE node_name LIKE :pattern"
+        else:
+            name_sql = "SELECT id, container_name AS name FROM containers"
+            series_sql = f"""
+                SELECT cm.container_id AS entity_id,
+                       FLOOR(UNIX_TIMESTAMP(cm.collected_at) / :step) * :step AS bucket,
+                       AVG(cm.{column}) AS value
+                FROM container_metrics cm
+                {"JOIN containers c ON c.id = cm.container_id AND c.container_name LIKE :pattern" if pattern else ""}
+                WHERE cm.collected_at >= :start AND cm.collected_at < :end
+                GROUP BY cm.container_id, bucket
+                ORDER BY cm.container_id, bucket
+            """
+            if pattern:
+                name_sql += " WHERE container_name LIKE :pattern"
+
+        if pattern:
+            params["pattern"] = pattern
+
+        names = {row.id: row.name for row in self.db.execute(text(name_sql), params).fetchall()}
+        rows = self.db.execute(text(series_sql), params).fetchall()
+        if not rows:
+            return np.empty((0, 3), dtype=np.float64), names
+
+        series = np.array(rows, dtype=np.float64)
+        return series, names
+
+    def backtest(self, rule, days: int = 7, step_seconds: Optional[int] = None, limit: int = 200) -> Dict[str, Any]:
+        """
+        알림 규칙 백테스트 실행
+
+        Args:
+            rule: AlertRuleDB 객체
+            days: 평가할 과거 기간 (일)
+            step_seconds: 평가 해상도 (초, None이면 기간에 맞춰 자동 선택)
+            limit: 반환할 발생 이력 최대 개수
+
+        Returns:
+            Dict[str, Any]: AlertBacktestResult 필드를 담은 딕셔너리
+        """
+        started = time.perf_counter()
+        condition = parse_rule_condition(rule.condition)
+        target_type, pattern = self.resolve_target(rule.target)
+
+        columns = NODE_METRIC_COLUMNS if target_type == "node" else CONTAINER_METRIC_COLUMNS
+        column = columns.get(condition.metric)
+        if not column:
+            raise ValueError(f"Metric '{condition.metric}' is not collected for {target_type}s")
+
+        # 기간에 맞춰 해상도를 60초 단위로 자동 조정
+        if not step_seconds:
+            step_seconds = math.ceil(min_step_seconds(days) / 60) * 60
+
+        # 메트릭 수집 시각은 naive UTC로 저장됨
+        end = datetime.utcnow()
+        start = end - timedelta(days=days)
+        series, names = self._load_series(target_type, column, pattern, start, end, step_seconds)
+
+        entity_ids = series[:, 0].astype(np.int64)
+        timestamps = series[:, 1].astype(np.int64)
+        windows = evaluate_rule_windows(
+            entity_ids, timestamps, series[:, 2],
+            condition.operator, condition.threshold, condition.for_seconds
+        )
+
+        # entity_index(대상 순번) -> 실제 대상 ID
+        first_of_entity = np.ones(len(entity_ids), dtype=bool)
+        first_of_entity[1:] = entity_ids[1:] != entity_ids[:-1]
+        unique_ids = entity_ids[first_of_entity]
+        window_end = int(end.replace(tzinfo=timezone.utc).timestamp())
+        resolved_or_end = np.where(windows["resolved_at"] >= 0, windows["resolved_at"], window_end)
+        durations = resolved_or_end - windows["fired_at"]
+
+        # 최신순 limit개만 응답에 포함
+        order = np.argsort(windows["fired_at"])[::-1][:limit]
+        firings = []
+        for i in order:
+            entity_id = int(unique_ids[windows["entity_index"][i]])
+            resolved_at = int(windows["resolved_at"][i])
+            firings.append({
+                "target": names.get(entity_id, str(entity_id)),
+                "fired_at": _to_iso(windows["fired_at"][i]),
+                "resolved_at": _to_iso(resolved_at) if resolved_at >= 0 else None,
+                "duration_seconds": int(durations[i]),
+                "peak_value": round(float(windows["peak"][i]), 2)
+            })
+
+        return {
+            "rule_id": f"RULE-{rule.id:03d}",
+            "condition": rule.condition,
+            "target_type": target_type,
+            "evaluated_targets": len(unique_ids),
+            "evaluated_points": len(series),
+            "window_start": start.isoformat() + "Z",
+            "window_end": end.isoformat() + "Z",
+            "step_seconds": step_seconds,
+            "fire_count": len(durations),
+            "total_firing_seconds": int(durations.sum()),
+            "firings": firings,
+            "elapsed_ms": round((time.perf_counter() - started) * 1000, 1)
+        }
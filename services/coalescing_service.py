@@ -0,0 +1,233 @@
+"""
+요청 병합(single-flight) 서비스
+같은 키로 동시에 들어온 호출은 먼저 온 호출(리더) 하나만 실행하고 나머지는 그 결과를 공유한다.
+선택적으로 짧은 TTL 동안 결과를 재사용한다.
+
+대시보드 수백 개가 같은 순간 새로고침해도 같은 집계 쿼리는 한 번만 실행된다.
+TTL 캐시 키에는 데이터 버전(data_versions)을 포함할 수 있어, 쓰기 이후에는 이전 결과를 재사용하지 않는다.
+"""
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, Optional, Tuple
+import asyncio
+import functools
+import inspect
+import threading
+import time
+
+from services.metrics_service import coalesced_calls_total
+
+if TYPE_CHECKING:
+    from services.shared_cache_service import SharedMemoryCache
+
+# TTL 캐시 최대 항목 수 (초과 시 만료 항목 정리)
+COALESCE_CACHE_SIZE = 1024
+
+
+def _default_cacheable(result: Any) -> bool:
+    """실패 응답(BaseResponse.success=False)은 TTL 캐시에 넣지 않음"""
+    return getattr(result, "success", True) is not False
+
+
+class _Call:
+    __slots__ = ("event", "result", "error")
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """키별 동시 호출 병합 + 선택적 TTL 캐시 (스레드 안전)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[Any, _Call] = {}
+        self._async_calls: Dict[Any, asyncio.Future] = {}
+        self._cache: Dict[Any, Tuple[float, Any]] = {}
+
+    def _cached(self, key: Any, now: float) -> Tuple[bool, Any]:
+        entry = self._cache.get(key)
+        if entry is not None and entry[0] > now:
+            return True, entry[1]
+        return False, None
+
+    def _store(self, key: Any, result: Any, ttl: float, cacheable: Callable[[Any], bool]) -> None:
+        if ttl <= 0 or not cacheable(result):
+            return
+        now = time.monotonic()
+        if len(self._cache) >= COALESCE_CACHE_SIZE:
+            for stale in [k for k, (expires, _) in self._cache.items() if expires <= now]:
+                del self._cache[stale]
+        self._cache[key] = (now + ttl, result)
+
+    def do(self, name: str, key: Any, fn: Callable[[], Any], ttl: float = 0.0,
+           cacheable: Callable[[Any], bool] = _default_cacheable) -> Any:
+        """
+        동기 호출 병합
+
+        Args:
+            name: 지표 라벨용 이름 (예: 라우트 이름)
+            key: 병합 키 (같은 키의 동시 호출은 한 번만 실행)
+            fn: 실제 계산 함수
+            ttl: 결과 재사용 시간 (초, 0이면 진행 중인 호출만 공유)
+            cacheable: TTL 캐시에 넣을 결과인지 판단하는 함수
+
+        Returns:
+            Any: fn의 결과 (리더가 예외를 던지면 대기 중인 호출도 같은 예외를 받음)
+        """
+        with self._lock:
+            hit, result = self._cached(key, time.monotonic())
+            if hit:
+                coalesced_calls_total.labels(name, "cached").inc()
+                return result
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            call.event.wait()
+            coalesced_calls_total.labels(name, "joined").inc()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        coalesced_calls_total.labels(name, "executed").inc()
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+                if call.error is None:
+                    self._store(key, call.result, ttl, cacheable)
+            call.event.set()
+
+    async def do_async(self, name: str, key: Any, fn: Callable[[], Any], ttl: float = 0.0,
+                       cacheable: Callable[[Any], bool] = _default_cacheable) -> Any:
+        """비동기 호출 병합 (fn은 코루틴을 반환하는 함수, 같은 이벤트 루프에서만 공유)"""
+        hit, result = self._cached(key, time.monotonic())
+        if hit:
+            coalesced_calls_total.labels(name, "cached").inc()
+            return result
+        future = self._async_calls.get(key)
+        if future is not None:
+            coalesced_calls_total.labels(name, "joined").inc()
+            return await asyncio.shield(future)
+
+        coalesced_calls_total.labels(name, "executed").inc()
+        future = self._async_calls[key] = asyncio.get_running_loop().create_future()
+        try:
+            result = await fn()
+        except BaseException as e:
+            future.set_exception(e)
+            future.exception()  # 대기자가 없을 때 "never retrieved" 경고 방지
+            raise
+        else:
+            future.set_result(result)
+            with self._lock:
+                self._store(key, result, ttl, cacheable)
+            return result
+        finally:
+            del self._async_calls[key]
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"in_flight": len(self._calls) + len(self._async_calls), "cached": len(self._cache)}
+
+
+single_flight = SingleFlight()
+
+
+def _normalize(value: Any) -> Any:
+    """키에 넣을 파라미터 값 정규화 (순서가 의미 없는 컬렉션은 정렬)"""
+    if isinstance(value, (list, tuple)):
+        return tuple(_normalize(v) for v in value)
+    if isinstance(value, (set, frozenset)):
+        return tuple(sorted(_normalize(v) for v in value))
+    if isinstance(value, dict):
+        return tuple(sorted((k, _normalize(v)) for k, v in value.items()))
+    if hasattr(value, "model_dump"):
+        return _normalize(value.model_dump())
+    return value
+
+
+def coalesce(ttl: float = 0.0, versions: Iterable[str] = (), exclude: Iterable[str] = ("db",),
+             shared: Optional["SharedMemoryCache"] = None):
+    """
+    라우트 엔드포인트 병합 데코레이터
+
+    키는 함수 이름 + 정규화된 인자(exclude에 있는 인자, 예: DB 세션 제외) + 지정한 테이블의 데이터 버전이다.
+    병합된 호출은 리더의 결과 객체를 그대로 돌려받는다.
+
+    Args:
+        ttl: 결과 재사용 시간 (초)
+        versions: 키에 포함할 데이터 버전 테이블 (쓰기 후에는 새로 계산)
+        exclude: 키에서 제외할 인자 이름
+        shared: 워커 간 공유 캐시 (지정하면 리더가 계산 전에 조회하고 결과를 ttl 동안 저장,
+                다른 워커가 계산한 결과도 재사용)
+
+    Example:
+        @router.get("/nodes/stats", response_model=BaseResponse)
+        @coalesce(ttl=1.0, versions=("nodes", "metrics"))
+        def get_node_stats(db: Session = Depends(get_db)): ...
+    """
+    versions = tuple(versions)
+    exclude = frozenset(exclude)
+
+    def decorator(fn: Callable) -> Callable:
+        name = fn.__name__
+        signature = inspect.signature(fn)
+
+        def make_key(args, kwargs):
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            params = tuple(sorted(
+                (k, _normalize(v)) for k, v in bound.arguments.items() if k not in exclude
+            ))
+            if versions:
+                from services.data_version_service import data_versions
+
+                current = data_versions.current()
+                return name, params, tuple(current.get(table, 0) for table in versions)
+            return name, params
+
+        if asyncio.iscoroutinefunction(fn):
+            async def compute_async(key, args, kwargs):
+                if shared is not None:
+                    hit = shared.get(key)
+                    if hit is not None:
+                        coalesced_calls_total.labels(name, "shared").inc()
+                        return hit
+                result = await fn(*args, **kwargs)
+                if shared is not None and ttl > 0 and _default_cacheable(result):
+                    shared.set(key, result, ttl)
+                return result
+
+            @functools.wraps(fn)
+            async def async_wrapper(*args, **kwargs):
+                key = make_key(args, kwargs)
+                return await single_flight.do_async(name, key, lambda: compute_async(key, args, kwargs), ttl)
+            return async_wrapper
+
+        def compute(key, args, kwargs):
+            if shared is not None:
+                hit = shared.get(key)
+                if hit is not None:
+                    coalesced_calls_total.labels(name, "shared").inc()
+                    return hit
+            result = fn(*args, **kwargs)
+            if shared is not None and ttl > 0 and _default_cacheable(result):
+                shared.set(key, result, ttl)
+            return result
+
+        @functools.wraps(fn)
+        def sync_wrapper(*args, **kwargs):
+            key = make_key(args, kwargs)
+            return single_flight.do(name, key, lambda: compute(key, args, kwargs), ttl)
+        return sync_wrapper
+
+    return decorator
@@ -0,0 +1,198 @@
+"""
+데이터 버전 서비스
+테이블별 변경 카운터(data_versions)를 관리하고, 조회 API가 요청한 테이블들의 버전으로 ETag를 만든다.
+
+- 이 서버의 쓰기: 엔진 이벤트로 트랜잭션에서 쓴 테이블을 모아 두었다가, 커밋 직전 같은 트랜잭션에서
+  카운터를 올린다 (쓰기와 버전 증가가 함께 커밋되거나 함께 롤백됨).
+- 에이전트가 직접 적재하는 테이블(nodes, metrics, containers): 버전을 조회할 때 테이블의 집계값
+  (MAX(id), MAX(updated_at)) 또는 행 전체 체크섬을 카운터에 섞는다. 행 단위 트리거는 적재되는 모든 행이
+  data_versions의 같은 행을 갱신해 적재 트랜잭션끼리 락 경합을 일으키므로 쓰지 않는다
+  (마이그레이션 0002가 설치하던 트리거는 0004에서 제거).
+
+버전은 모든 워커가 같은 DB 행을 읽으므로 워커가 여러 개여도 ETag가 일치한다.
+조회 비용을 줄이기 위해 프로세스 안에서 짧게(VERSION_CACHE_TTL) 캐시하며,
+이 워커가 쓴 경우에는 즉시 캐시를 무효화한다.
+"""
+from sqlalchemy import event, select
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import IntegrityError
+from typing import Any, Callable, Dict, Iterable, Optional
+from datetime import datetime
+import hashlib
+import re
+import threading
+import time
+
+from logs import log_manager
+
+# 버전을 관리하는 테이블
+VERSIONED_TABLES = (
+    "nodes", "metrics", "containers", "events",
+    "alert_rules", "silences", "stats_snapshots", "users",
+)
+
+# 서버를 거치지 않고 에이전트가 직접 쓰는 테이블 (마이그레이션 0002의 트리거 대상)
+AGENT_WRITTEN_TABLES = ("nodes", "metrics", "containers")
+
+# 에이전트 테이블의 변경 감지용 집계 쿼리 (metrics는 추가만 되므로 기본 키 최댓값)
+AGENT_TABLE_SIGNATURES = {
+    "nodes": "SELECT COUNT(*), MAX(id), MAX(updated_at) FROM nodes",
+    "metrics": "SELECT MAX(id) FROM metrics",
+}
+
+# 갱신 시각 컬럼이 없어 집계값으로는 모든 변경을 감지할 수 없는 에이전트 테이블 → 행 전체 체크섬
+# (컨테이너 수만큼의 작은 테이블이라 VERSION_CACHE_TTL마다 전체를 읽어도 부담이 적음)
+ROW_CHECKSUM_TABLES = ("containers",)
+
+# 버전 조회 결과 캐시 시간 (초, 다른 워커/에이전트의 쓰기가 반영되기까지의 최대 지연)
+VERSION_CACHE_TTL = 1.0
+
+_WRITE_STATEMENT = re.compile(
+    r"^\s*(?:INSERT\s+(?:IGNORE\s+)?INTO|REPLACE\s+INTO|UPDATE|DELETE\s+FROM)\s+`?(\w+)`?",
+    re.IGNORECASE
+)
+
+
+class DataVersions:
+    """테이블별 변경 카운터 조회/증가"""
+
+    def __init__(self, ttl: float = VERSION_CACHE_TTL):
+        self.ttl = ttl
+        self._engine: Optional[Engine] = None
+        self._lock = threading.Lock()
+        self._versions: Dict[str, int] = {}
+        self._loaded_at = 0.0
+
+    # ----- 쓰기 추적 -----
+    def instrument(self, engine: Engine) -> None:
+        """엔진에 쓰기 추적 이벤트 연결"""
+        self._engine = engine
+
+        @event.listens_for(engine, "after_cursor_execute")
+        def _track_write(conn, cursor, statement, parameters, context, executemany):
+            match = _WRITE_STATEMENT.match(statement)
+            if match and match.group(1) in VERSIONED_TABLES:
+                conn.info.setdefault("dirty_tables", set()).add(match.group(1))
+
+        @event.listens_for(engine, "commit")
+        def _bump_on_commit(conn):
+            tables = conn.info.pop("dirty_tables", None)
+            if tables:
+                # SQLAlchemy 트랜잭션 상태를 건드리지 않도록 DBAPI 커서로 같은 트랜잭션에 실행
+                # (테이블 이름은 VERSIONED_TABLES에 있는 값만 들어옴)
+                names = ", ".join(f"'{name}'" for name in sorted(tables))
+                cursor = conn.connection.cursor()
+                try:
+                    cursor.execute(
+                        f"UPDATE data_versions SET version = version + 1, updated_at = CURRENT_TIMESTAMP "
+                        f"WHERE table_name IN ({names})"
+                    )
+                finally:
+                    cursor.close()
+                self.invalidate()
+
+        @event.listens_for(engine, "rollback")
+        def _discard_on_rollback(conn):
+            conn.info.pop("dirty_tables", None)
+
+    def _get_engine(self) -> Engine:
+        if self._engine is None:
+            from db.database import get_engine
+
+            # 엔진 생성 훅(main.py)에서 instrument가 호출되어 self._engine이 설정됨
+            return get_engine()
+        return self._engine
+
+    def ensure_rows(self, engine: Engine) -> None:
+        """버전 행이 없는 테이블의 행 생성 (마이그레이션에서 실행)"""
+        from models.data_version import DataVersionDB
+
+        with engine.connect() as conn:
+            existing = set(conn.execute(select(DataVersionDB.table_name)).scalars())
+            missing = [name for name in VERSIONED_TABLES if name not in existing]
+            if not missing:
+                return
+            try:
+                conn.execute(DataVersionDB.__table__.insert(), [
+                    {"table_name": name, "version": 0, "updated_at": datetime.utcnow()} for name in missing
+                ])
+                conn.commit()
+            except IntegrityError:
+                # 다른 워커가 동시에 생성한 경우
+                conn.rollback()
+
+    def install_triggers(self, engine: Engine) -> None:
+        """에이전트가 쓰는 테이블에 버전 증가 트리거 설치 (마이그레이션에서 실행, MySQL 전용, 권한이 없으면 경고만 남김)"""
+        if engine.dialect.name != "mysql":
+            return
+        for table in AGENT_WRITTEN_TABLES:
+            for operation in ("INSERT", "UPDATE", "DELETE"):
+                try:
+                    with engine.begin() as conn:
+                        conn.exec_driver_sql(
+                            f"CREATE TRIGGER IF NOT EXISTS trg_{table}_{operation.lower()}_version "
+                            f"AFTER {operation} ON {table} FOR EACH ROW "
+                            f"UPDATE data_versions SET version = version + 1, updated_at = CURRENT_TIMESTAMP "
+                            f"WHERE table_name = '{table}'"
+                        )
+                except Exception as e:
+                    log_manager.logger.warning(f"데이터 버전 트리거 설치 실패 ({table} {operation}): {e}")
+
+    # ----- 조회 -----
+    def invalidate(self) -> None:
+        self._loaded_at = 0.0
+
+    def current(self) -> Dict[str, int]:
+        """전체 테이블 버전 (TTL 동안 캐시)"""
+        now = time.monotonic()
+        if now - self._loaded_at < self.ttl:
+            return self._versions
+        from models.data_version import DataVersionDB
+
+        with self._get_engine().connect() as conn:
+            rows = conn.execute(select(DataVersionDB.table_name, DataVersionDB.version)).all()
+            signatures = {table: self._signature(conn, table, self._aggregate, sql)
+                          for table, sql in AGENT_TABLE_SIGNATURES.items()}
+            signatures.update({table: self._signature(conn, table, self._checksum, table)
+                               for table in ROW_CHECKSUM_TABLES})
+        versions = {row.table_name: int(row.version) for row in rows}
+        for table, signature in signatures.items():
+            if signature is not None:
+                key = f"{versions.get(table, 0)}|{signature}"
+                versions[table] = int(hashlib.sha1(key.encode("utf-8")).hexdigest()[:15], 16)
+        with self._lock:
+            self._versions = versions
+            self._loaded_at = now
+        return self._versions
+
+    def _signature(self, conn, table: str, compute: Callable[[Any, str], str], arg: str) -> Optional[str]:
+        """에이전트 테이블의 변경 감지값 (조회 실패 시 None → 이 서버의 쓰기 카운터만 사용)"""
+        try:
+            return compute(conn, arg)
+        except Exception as e:
+            conn.rollback()
+            log_manager.logger.warning(f"데이터 버전 집계 조회 실패 ({table}): {e}")
+            return None
+
+    @staticmethod
+    def _aggregate(conn, sql: str) -> str:
+        return repr(tuple(conn.exec_driver_sql(sql).one()))
+
+    @staticmethod
+    def _checksum(conn, table: str) -> str:
+        """행 전체 체크섬 (MySQL은 CHECKSUM TABLE, 그 밖의 DB는 모든 행을 읽어 해시)"""
+        if conn.dialect.name == "mysql":
+            return repr(conn.exec_driver_sql(f"CHECKSUM TABLE {table}").one()[1])
+        digest = hashlib.sha1()
+        for row in conn.exec_driver_sql(f"SELECT * FROM {table} ORDER BY id"):
+            digest.update(repr(tuple(row)).encode("utf-8"))
+        return digest.hexdigest()
+
+    def etag(self, tables: Iterable[str], *parts: str) -> str:
+        """테이블 버전과 추가 구분값(경로, 쿼리, 시간 구간 등)으로 만든 약한 ETag"""
+        versions = self.current()
+        key = "|".join([f"{name}:{versions.get(name, 0)}" for name in tables] + list(parts))
+        return f'W/"{hashlib.sha1(key.encode("utf-8")).hexdigest()[:20]}"'
+
+
+data_versions = DataVersions()
@@ -0,0 +1,209 @@
+"""
+Kubernetes 이벤트 저장소 서비스
+에이전트가 보내는 이벤트를 Kubernetes 방식으로 압축하여 저장하고 조회한다.
+같은 (namespace, object, reason, type, message) 이벤트는 한 행의 count/last_seen만 갱신된다.
+"""
+from sqlalchemy import and_, case, func, or_
+from sqlalchemy.dialects import mysql, sqlite
+from sqlalchemy.orm import Session
+from typing import Any, Dict, List, Optional, Tuple
+from datetime import datetime
+import base64
+import hashlib
+
+from models.event import EventDB, EventIngest
+from services.live_service import live_hub
+from services.metrics_service import ingested_items_total
+
+# 한 번의 INSERT 문에 담을 최대 행 수
+INGEST_CHUNK_SIZE = 500
+
+# 시스템 이벤트로 집계하는 네임스페이스
+SYSTEM_NAMESPACE = "kube-system"
+
+# 적재 처리량 지표 (/metrics)
+_ingested_received = ingested_items_total.labels("event", "received")
+_ingested_stored = ingested_items_total.labels("event", "stored")
+
+
+def encode_cursor(last_seen: datetime, event_id: int) -> str:
+    """키셋 페이지네이션 커서 (마지막 행의 last_seen, id)"""
+    raw = f"{last_seen.isoformat()}|{event_id}"
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """커서 해석 (형식이 잘못되면 ValueError)"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8")
+        last_seen, event_id = raw.rsplit("|", 1)
+        return datetime.fromisoformat(last_seen), int(event_id)
+    except (UnicodeError, ValueError, TypeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+
+
+def event_fingerprint(namespace: str, object_name: str, reason: str, event_type: str, message: str) -> str:
+    """이벤트 압축 키 (SHA-1 hex)"""
+    key = "\x1f".join((namespace, object_name, reason, event_type, message))
+    return hashlib.sha1(key.encode("utf-8")).hexdigest()
+
+
+class EventStoreService:
+    """이벤트 저장소 서비스"""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def _compress(self, events: List[EventIngest]) -> List[Dict[str, Any]]:
+        """배치 안의 동일 이벤트를 먼저 합쳐 DB로 보내는 행 수를 줄임"""
+        now = datetime.utcnow()
+        compressed: Dict[str, Dict[str, Any]] = {}
+        for event in events:
+            seen_at = event.timestamp or now
+            if seen_at.tzinfo is not None:
+                # 저장은 naive UTC 기준
+                seen_at = (seen_at - seen_at.utcoffset()).replace(tzinfo=None)
+            fingerprint = event_fingerprint(event.namespace, event.object, event.reason, event.type, event.message)
+
+            row = compressed.get(fingerprint)
+            if row is None:
+                compressed[fingerprint] = {
+                    "fingerprint": fingerprint,
+                    "namespace": event.namespace,
+                    "object": event.object,
+                    "reason": event.reason,
+                    "type": event.type,
+                    "message": event.message,
+                    "source": event.source,
+                    "count": max(1, event.count),
+                    "first_seen": seen_at,
+                    "last_seen": seen_at,
+                }
+            else:
+                row["count"] += max(1, event.count)
+                row["first_seen"] = min(row["first_seen"], seen_at)
+                row["last_seen"] = max(row["last_seen"], seen_at)
+        return list(compressed.values())
+
+    def _upsert_statement(self, rows: List[Dict[str, Any]]):
+        """DB 종류에 맞는 INSERT ... 충돌 시 UPDATE 문 생성"""
+        table = EventDB.__table__
+        dialect = self.db.get_bind().dialect.name
+
+        if dialect == "sqlite":
+            stmt = sqlite.insert(table).values(rows)
+            return stmt.on_conflict_do_update(
+                index_elements=[table.c.fingerprint],
+                set_={
+                    "count": table.c.count + stmt.excluded.count,
+                    "first_seen": func.min(table.c.first_seen, stmt.excluded.first_seen),
+                    "last_seen": func.max(table.c.last_seen, stmt.excluded.last_seen),
+                    "source": stmt.excluded.source,
+                }
+            )
+
+        stmt = mysql.insert(table).values(rows)
+        return stmt.on_duplicate_key_update(
+            count=table.c.count + stmt.inserted.count,
+            first_seen=func.least(table.c.first_seen, stmt.inserted.first_seen),
+            last_seen=func.greatest(table.c.last_seen, stmt.inserted.last_seen),
+            source=stmt.inserted.source,
+        )
+
+    def ingest(self, events: List[EventIngest]) -> Dict[str, int]:
+        """
+        이벤트 일괄 적재
+
+        Returns:
+            Dict[str, int]: received(수신 이벤트 수), stored(압축 후 반영된 행 수)
+        """
+        rows = self._compress(events)
+        for i in range(0, len(rows), INGEST_CHUNK_SIZE):
+            self.db.execute(self._upsert_statement(rows[i:i + INGEST_CHUNK_SIZE]))
+        self.db.commit()
+
+        # 실시간 구독자에게 푸시 (같은 이벤트가 밀려 있으면 최신 값으로 합쳐짐)
+        for row in rows:
+            live_hub.publish("event", {
+                "namespace": row["namespace"],
+                "object": row["object"],
+                "reason": row["reason"],
+                "type": row["type"],
+                "message": row["message"],
+                "source": row["source"],
+                "count": row["count"],  # 이번 적재분의 발생 횟수
+                "last_seen": row["last_seen"].isoformat() + "Z",
+            }, key=f"event:{row['fingerprint']}")
+        _ingested_received.inc(len(events))
+        _ingested_stored.inc(len(rows))
+        return {"received": len(events), "stored": len(rows)}
+
+    @staticmethod
+    def _apply_filters(query, namespace: Optional[str], event_type: Optional[str],
+                       since: Optional[datetime], until: Optional[datetime]):
+        if namespace:
+            query = query.filter(EventDB.namespace == namespace)
+        if event_type:
+            query = query.filter(EventDB.type == event_type)
+        if since:
+            query = query.filter(EventDB.last_seen >= since)
+        if until:
+            query = query.filter(EventDB.last_seen < until)
+        return query
+
+    def list_events(self, namespace: Optional[str] = None, event_type: Optional[str] = None,
+                    since: Optional[datetime] = None, until: Optional[datetime] = None,
+                    cursor: Optional[str] = None, limit: int = 25) -> Tuple[List[EventDB], Optional[str]]:
+        """
+        최근 이벤트 목록 (last_seen, id 역순 키셋 페이지네이션)
+
+        OFFSET 대신 직전 페이지 마지막 행의 (last_seen, id) 뒤부터 읽으므로
+        페이지 깊이와 무관하게 (namespace, last_seen) / (type, last_seen) 인덱스 범위 스캔으로 끝난다.
+
+        Returns:
+            Tuple[List[EventDB], Optional[str]]: 이벤트 목록, 다음 페이지 커서
+        """
+        query = self._apply_filters(self.db.query(EventDB), namespace, event_type, since, until)
+        if cursor:
+            cursor_seen, cursor_id = decode_cursor(cursor)
+            query = query.filter(or_(
+                EventDB.last_seen < cursor_seen,
+                and_(EventDB.last_seen == cursor_seen, EventDB.id < cursor_id)
+            ))
+
+        # 다음 페이지 존재 여부 확인을 위해 한 건 더 조회
+        rows = query.order_by(EventDB.last_seen.desc(), EventDB.id.desc()).limit(limit + 1).all()
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_cursor(rows[-1].last_seen, rows[-1].id)
+        return rows, next_cursor
+
+    def summarize(self, namespace: Optional[str] = None, since: Optional[datetime] = None,
+                  until: Optional[datetime] = None) -> Dict[str, int]:
+        """
+        유형별 이벤트 발생 횟수 집계 (GROUP BY 쿼리 한 번)
+
+        지문 중복 제거로 한 행이 count번의 발생을 나타내므로 행 수가 아닌 count 합계를 센다.
+
+        Returns:
+            Dict[str, int]: total, warning, normal, system
+        """
+        is_system = case((EventDB.namespace == SYSTEM_NAMESPACE, 1), else_=0)
+        query = self.db.query(EventDB.type, is_system.label("is_system"), func.sum(EventDB.count).label("count"))
+        query = self._apply_filters(query, namespace, None, since, until)
+
+        counts = {"total": 0, "warning": 0, "normal": 0, "system": 0}
+        for row in query.group_by(EventDB.type, is_system).all():
+            occurrences = int(row.count or 0)  # MySQL SUM은 Decimal
+            counts["total"] += occurrences
+            if row.type == "Warning":
+                counts["warning"] += occurrences
+            elif row.type == "Normal":
+                counts["normal"] += occurrences
+            if row.is_system:
+                counts["system"] += occurrences
+        return counts
+
+    def get_event(self, event_id: int) -> Optional[EventDB]:
+        return self.db.query(EventDB).filter(EventDB.id == event_id).first()
@@ -0,0 +1,274 @@
+"""
+네트워크/디스크 I/O 집계 서비스
+컨테이너 네트워크 속도(container_metrics)와 노드 디스크 누적 카운터(node_disk_io)를
+클러스터 전체 시간별 평균 처리량(bytes/s)으로 만든다.
+
+끝난 시간은 한 번만 계산해 io_hourly_stats에 보관하고 프로세스 메모리에도 캐시한다.
+진행 중인 최근 시간은 원본 테이블에서 계산하되 CURRENT_HOURS_TTL 동안 결과를 재사용하므로
+대시보드 폴링마다 원본을 다시 읽지 않는다.
+
+데이터가 없던 끝난 시간은 확정하지 않고 recompute_after 이후 다시 계산한다
+(에이전트 데이터가 늦게 들어온 경우, LATE_DATA_HORIZON이 지나면 빈 시간으로 확정).
+"""
+from sqlalchemy import text
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+from typing import Dict, List, Optional, Tuple
+from datetime import datetime, timedelta
+import threading
+import time
+
+import numpy as np
+
+from services.metrics_service import record_cache
+
+SERIES = ("net_rx", "net_tx", "disk_read", "disk_write")
+
+HOUR = timedelta(hours=1)
+
+# 에이전트 적재 지연을 고려해 끝난 뒤 이 시간이 지나야 집계를 확정
+ROLLUP_GRACE = timedelta(minutes=2)
+
+# 시간 경계 직전 카운터 샘플을 찾기 위한 조회 여유
+COUNTER_LOOKBACK = timedelta(minutes=15)
+
+# 진행 중인 시간 집계 재사용 시간 (초)
+CURRENT_HOURS_TTL = 30.0
+
+# 데이터가 없던 끝난 시간을 다시 계산하는 간격과, 늦은 데이터를 기다리는 최대 기간
+EMPTY_HOUR_RECHECK = timedelta(minutes=10)
+LATE_DATA_HORIZON = timedelta(hours=24)
+
+# 캐시 항목: (값, 재계산 시각 또는 None=확정)
+_Rollup = Tuple[Optional[float], Optional[datetime]]
+
+
+def _is_settled(entry: Optional[_Rollup], now: datetime) -> bool:
+    return entry is not None and (entry[1] is None or entry[1] > now)
+
+
+def _recompute_after(hour_start: datetime, value: Optional[float], now: datetime) -> Optional[datetime]:
+    """빈 시간은 늦은 데이터를 기다리는 동안 재계산 시각을 둠"""
+    if value is not None or hour_start + HOUR + LATE_DATA_HORIZON <= now:
+        return None
+    return now + EMPTY_HOUR_RECHECK
+
+
+def counter_increase_by_bucket(entity_ids: np.ndarray, offsets: np.ndarray, values: np.ndarray,
+                               bucket_seconds: float, bucket_count: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    누적 카운터의 구간별 증가량 (엔티티 합계)
+
+    인접한 두 샘플의 차이를 뒤 샘플 시각의 구간에 더한다. 값이 줄어든 경우는
+    카운터 리셋(재부팅)으로 보고 뒤 샘플 값 자체를 리셋 이후 증가량으로 사용한다.
+
+    Args:
+        entity_ids: 엔티티 ID 배열
+        offsets: 기준 시각으로부터의 경과 초 배열
+        values: 누적 카운터 값 배열
+        bucket_seconds: 구간 길이 (초)
+        bucket_count: 구간 개수
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: 구간별 증가량 합계, 구간별 샘플 쌍 개수
+    """
+    increase = np.zeros(bucket_count)
+    pairs = np.zeros(bucket_count, dtype=np.int64)
+    if len(values) < 2:
+        return increase, pairs
+
+    order = np.lexsort((offsets, entity_ids))
+    entity_ids, offsets, values = entity_ids[order], offsets[order], values[order]
+
+    same_entity = entity_ids[1:] == entity_ids[:-1]
+    delta = values[1:] - values[:-1]
+    delta = np.where(delta >= 0, delta, values[1:])
+    bucket = np.floor(offsets[1:] / bucket_seconds).astype(np.int64)
+
+    mask = same_entity & (bucket >= 0) & (bucket < bucket_count)
+    increase += np.bincount(bucket[mask], weights=delta[mask], minlength=bucket_count)
+    pairs += np.bincount(bucket[mask], minlength=bucket_count)
+    return increase, pairs
+
+
+class _RollupCache:
+    """끝난 시간의 집계 값 + 진행 중인 시간의 단기 캐시 (프로세스 단위)"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.values: Dict[Tuple[str, datetime], _Rollup] = {}
+        # ((settled_end, end), 만료 monotonic, 값)
+        self.current: Optional[Tuple[Tuple[datetime, datetime], float, Dict[Tuple[str, datetime], Optional[float]]]] = None
+
+    def prune(self, oldest: datetime) -> None:
+        for key in [k for k in self.values if k[1] < oldest]:
+            del self.values[key]
+
+
+_rollup_cache = _RollupCache()
+
+
+class IoAggregationService:
+    """네트워크/디스크 I/O 시간별 집계 서비스"""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    # ----- 원본 집계 -----
+    def _network_by_hour(self, start: datetime, end: datetime, hour_count: int) -> Dict[str, List[Optional[float]]]:
+        """컨테이너별 시간 평균 속도를 구해 클러스터 합계로 더함"""
+        rows = self.db.execute(text("""
+            SELECT FLOOR(UNIX_TIMESTAMP(cm.collected_at) / 3600) - FLOOR(UNIX_TIMESTAMP(:start) / 3600) AS hour_index,
+                   cm.container_id,
+                   AVG(cm.network_rx_bps) AS rx,
+                   AVG(cm.network_tx_bps) AS tx
+            FROM container_metrics cm
+            WHERE cm.collected_at >= :start AND cm.collected_at < :end
+            GROUP BY hour_index, cm.container_id
+        """), {"start": start, "end": end}).fetchall()
+
+        rx: List[Optional[float]] = [None] * hour_count
+        tx: List[Optional[float]] = [None] * hour_count
+        for row in rows:
+            i = int(row.hour_index)
+            if 0 <= i < hour_count:
+                rx[i] = (rx[i] or 0.0) + float(row.rx or 0)
+                tx[i] = (tx[i] or 0.0) + float(row.tx or 0)
+        return {"net_rx": rx, "net_tx": tx}
+
+    def _disk_by_hour(self, start: datetime, end: datetime, hour_count: int,
+                      now: datetime) -> Dict[str, List[Optional[float]]]:
+        """노드 디스크 누적 카운터를 시간별 평균 속도로 변환"""
+        from models.metric import NodeDiskIoDB
+
+        rows = self.db.query(
+            NodeDiskIoDB.node_id, NodeDiskIoDB.read_bytes, NodeDiskIoDB.write_bytes, NodeDiskIoDB.collected_at
+        ).filter(
+            NodeDiskIoDB.collected_at >= start - COUNTER_LOOKBACK,
+            NodeDiskIoDB.collected_at < end
+        ).all()
+
+        result: Dict[str, List[Optional[float]]] = {"disk_read": [None] * hour_count, "disk_write": [None] * hour_count}
+        if not rows:
+            return result
+
+        node_ids = np.array([row.node_id for row in rows], dtype=np.int64)
+        offsets = np.array([(row.collected_at - start).total_seconds() for row in rows])
+        for series, column in (("disk_read", "read_bytes"), ("disk_write", "write_bytes")):
+            values = np.array([float(getattr(row, column)) for row in rows])
+            increase, pairs = counter_increase_by_bucket(node_ids, offsets, values, 3600.0, hour_count)
+            for i in range(hour_count):
+                if pairs[i]:
+                    hour_start = start + i * HOUR
+                    # 진행 중인 시간은 경과한 시간만큼으로 나눔
+                    elapsed = (min(hour_start + HOUR, now) - hour_start).total_seconds()
+                    result[series][i] = float(increase[i]) / max(elapsed, 1.0)
+        return result
+
+    def _compute(self, start: datetime, end: datetime, now: datetime) -> Dict[Tuple[str, datetime], Optional[float]]:
+        hour_count = int((end - start) / HOUR)
+        series = self._network_by_hour(start, end, hour_count)
+        series.update(self._disk_by_hour(start, end, hour_count, now))
+        return {
+            (name, start + i * HOUR): series[name][i]
+            for name in SERIES
+            for i in range(hour_count)
+        }
+
+    # ----- 확정 집계 (io_hourly_stats) -----
+    def _load_rollups(self, start: datetime, end: datetime) -> Dict[Tuple[str, datetime], _Rollup]:
+        from models.metric import IoHourlyStatDB
+
+        rows = self.db.query(IoHourlyStatDB).filter(
+            IoHourlyStatDB.hour_start >= start,
+            IoHourlyStatDB.hour_start < end
+        ).all()
+        return {(row.series, row.hour_start): (row.value, row.recompute_after) for row in rows}
+
+    def _store_rollups(self, values: Dict[Tuple[str, datetime], _Rollup], existing: set) -> None:
+        """새 시간은 추가하고, 재계산한 빈 시간(existing)은 갱신"""
+        from models.metric import IoHourlyStatDB
+
+        for (series, hour_start), (value, recompute_after) in values.items():
+            if (series, hour_start) in existing:
+                self.db.query(IoHourlyStatDB).filter(
+                    IoHourlyStatDB.series == series, IoHourlyStatDB.hour_start == hour_start
+                ).update({"value": value, "recompute_after": recompute_after}, synchronize_session=False)
+            else:
+                self.db.add(IoHourlyStatDB(series=series, hour_start=hour_start, value=value,
+                                           recompute_after=recompute_after))
+        try:
+            self.db.commit()
+        except IntegrityError:
+            # 다른 워커가 먼저 저장한 경우 (같은 원본에서 계산했으므로 값은 동일)
+            self.db.rollback()
+
+    def _completed_values(self, start: datetime, settled_end: datetime, now: datetime) -> Dict[Tuple[str, datetime], Optional[float]]:
+        """확정된 시간 [start, settled_end)의 집계 (메모리 캐시 → io_hourly_stats → 원본 순)"""
+        hours = []
+        hour = start
+        while hour < settled_end:
+            hours.append(hour)
+            hour += HOUR
+
+        with _rollup_cache.lock:
+            _rollup_cache.prune(start)
+            cached = dict(_rollup_cache.values)
+
+        def unsettled(hour_list):
+            return [h for h in hour_list if not all(_is_settled(cached.get((s, h)), now) for s in SERIES)]
+
+        missing = unsettled(hours)
+        record_cache("io_rollup", len(hours) - len(missing), len(missing))
+        if missing:
+            loaded = self._load_rollups(missing[0], settled_end)
+            cached.update(loaded)
+            still_missing = unsettled(missing)
+            if still_missing:
+                computed = self._compute(still_missing[0], settled_end, now)
+                refreshed = {
+                    key: (value, _recompute_after(key[1], value, now))
+                    for key, value in computed.items()
+                    if not _is_settled(cached.get(key), now)
+                }
+                self._store_rollups(refreshed, existing=set(loaded) & set(refreshed))
+                cached.update(refreshed)
+
+            with _rollup_cache.lock:
+                _rollup_cache.values.update({k: v for k, v in cached.items() if start <= k[1] < settled_end})
+        return {key: entry[0] for key, entry in cached.items()}
+
+    def _current_values(self, settled_end: datetime, end: datetime, now: datetime) -> Dict[Tuple[str, datetime], Optional[float]]:
+        """진행 중인 시간 [settled_end, end)의 집계 (CURRENT_HOURS_TTL 동안 재사용)"""
+        key = (settled_end, end)
+        with _rollup_cache.lock:
+            current = _rollup_cache.current
+        if current is not None and current[0] == key and current[1] > time.monotonic():
+            record_cache("io_current", 1, 0)
+            return current[2]
+        record_cache("io_current", 0, 1)
+        values = self._compute(settled_end, end, now)
+        with _rollup_cache.lock:
+            _rollup_cache.current = (key, time.monotonic() + CURRENT_HOURS_TTL, values)
+        return values
+
+    def hourly_series(self, hours: int = 24, now: Optional[datetime] = None) -> Tuple[List[datetime], Dict[str, List[Optional[float]]]]:
+        """
+        최근 hours개 시간의 클러스터 전체 평균 처리량
+
+        Returns:
+            Tuple[List[datetime], Dict[str, List[Optional[float]]]]: 시간 시작 시각(UTC) 목록, 시리즈별 bytes/s 값
+        """
+        now = now or datetime.utcnow()
+        current_hour = now.replace(minute=0, second=0, microsecond=0)
+        start = current_hour - (hours - 1) * HOUR
+
+        # 유예 시간이 지나지 않은 시간(현재 시간, 경계 직후엔 직전 시간 포함)은 원본에서 계산해 잠시 재사용
+        settled_end = (now - ROLLUP_GRACE).replace(minute=0, second=0, microsecond=0)
+        settled_end = max(min(settled_end, current_hour), start)
+
+        values = self._completed_values(start, settled_end, now)
+        values.update(self._current_values(settled_end, current_hour + HOUR, now))
+
+        hour_starts = [start + i * HOUR for i in range(hours)]
+        return hour_starts, {name: [values.get((name, h)) for h in hour_starts] for name in SERIES}
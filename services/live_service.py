@@ -0,0 +1,343 @@
+"""
+실시간 푸시(SSE/WebSocket) 서비스
+새 알림/이벤트/노드 상태 변경/메트릭 포인트를 구독자에게 전달한다.
+메시지는 발행 시 한 번만 직렬화해 모든 구독자가 공유하고,
+구독자별 큐는 크기가 제한되어 느린 클라이언트는 같은 키의 메시지를 합치거나(coalesce)
+가장 오래된 메시지를 버린다.
+
+멀티 워커(serve.py)에서는 요청 처리 중 발행되는 채널(RELAYED_CHANNELS)의 메시지를 공유 메모리 링에도
+기록하고, 각 워커의 중계 작업이 다른 워커가 기록한 메시지를 자기 구독자에게 전달한다.
+노드 상태/메트릭은 워커마다 변경 감지기가 DB를 직접 조회하므로 중계하지 않는다.
+"""
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+from typing import Any, Callable, Dict, Iterable, Optional, Set
+from datetime import datetime
+from collections import deque
+import asyncio
+import itertools
+import json
+import os
+import threading
+
+from db.database import SessionLocal
+from logs import log_manager
+from services.metrics_service import time_job
+from services.shared_cache_service import SharedMemoryRing
+
+# 구독 가능한 채널
+LIVE_CHANNELS = ("alert", "event", "node_status", "metric")
+
+# 구독자별 대기 메시지 최대 개수
+SUBSCRIBER_QUEUE_SIZE = 256
+
+# 노드 상태/메트릭 변경 확인 주기 (초)
+CHANGE_FEED_INTERVAL = 5.0
+
+# 다른 워커로 중계하는 채널 (요청 처리 중 한 워커에서만 발행되는 채널)
+RELAYED_CHANNELS = ("alert", "event")
+
+# 다른 워커가 발행한 메시지 확인 주기 (초, 워커 간 전달의 최대 추가 지연)
+RELAY_INTERVAL = 0.1
+
+
+class LiveMessage:
+    """발행 메시지 (SSE/WebSocket 프레임을 한 번만 만들어 공유)"""
+    __slots__ = ("id", "channel", "key", "sse", "text")
+
+    def __init__(self, message_id: int, channel: str, data: Any, key: Optional[str] = None):
+        self.id = message_id
+        self.channel = channel
+        self.key = key  # 같은 키의 대기 메시지는 최신 값으로 대체됨
+        payload = json.dumps(data, ensure_ascii=False, default=str, separators=(",", ":"))
+        self.sse = f"id: {message_id}\nevent: {channel}\ndata: {payload}\n\n".encode("utf-8")
+        self.text = f'{{"id":{message_id},"type":"{channel}","data":{payload}}}'
+
+
+class LiveSubscriber:
+    """
+    구독자 큐
+
+    발행은 요청 처리 스레드에서도 일어나므로 큐는 스레드 락으로 보호하고,
+    대기 중인 이벤트 루프는 call_soon_threadsafe로 깨운다.
+    """
+
+    def __init__(self, channels: Iterable[str], loop: asyncio.AbstractEventLoop,
+                 maxsize: int = SUBSCRIBER_QUEUE_SIZE):
+        self.channels: Set[str] = set(channels)
+        self.maxsize = maxsize
+        self.dropped = 0
+        self.coalesced = 0
+        self._loop = loop
+        self._lock = threading.Lock()
+        self._queue: deque = deque()  # [LiveMessage] 슬롯 (coalesce 시 슬롯 내용만 교체)
+        self._slots_by_key: Dict[str, list] = {}
+        self._ready = asyncio.Event()
+        self._closed = False
+
+    def push(self, message: LiveMessage) -> None:
+        with self._lock:
+            if self._closed:
+                return
+            if message.key is not None:
+                slot = self._slots_by_key.get(message.key)
+                if slot is not None:
+                    # 아직 전달되지 않은 같은 키 메시지는 최신 값으로 교체
+                    slot[0] = message
+                    self.coalesced += 1
+                    return
+            was_empty = not self._queue
+            if len(self._queue) >= self.maxsize:
+                oldest = self._queue.popleft()
+                if oldest[0].key is not None:
+                    self._slots_by_key.pop(oldest[0].key, None)
+                self.dropped += 1
+            slot = [message]
+            self._queue.append(slot)
+            if message.key is not None:
+                self._slots_by_key[message.key] = slot
+        # 큐가 비어 있던 경우에만 대기 중인 소비자를 깨움 (그 외에는 이미 깨어 있음)
+        if was_empty:
+            self._wake()
+
+    def close(self) -> None:
+        with self._lock:
+            self._closed = True
+        self._wake()
+
+    def _wake(self) -> None:
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is self._loop:
+            self._ready.set()
+        elif not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(self._ready.set)
+
+    def _pop(self) -> Optional[LiveMessage]:
+        with self._lock:
+            if not self._queue:
+                self._ready.clear()
+                return None
+            message = self._queue.popleft()[0]
+            if message.key is not None:
+                self._slots_by_key.pop(message.key, None)
+            return message
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    async def get(self, timeout: Optional[float] = None) -> Optional[LiveMessage]:
+        """다음 메시지 (timeout 동안 없으면 None, 닫히면 None)"""
+        message = self._pop()
+        if message is not None or self._closed:
+            return message
+        try:
+            await asyncio.wait_for(self._ready.wait(), timeout)
+        except asyncio.TimeoutError:
+            return None
+        return self._pop()
+
+
+class LiveHub:
+    """발행/구독 허브"""
+
+    def __init__(self, ring: Optional[SharedMemoryRing] = None):
+        self._lock = threading.Lock()
+        self._subscribers: Set[LiveSubscriber] = set()
+        self._ids = itertools.count(1)
+        self.published = 0
+        self.ring = ring
+        self.relayed = 0
+        self._relay_task: Optional[asyncio.Task] = None
+        self._relay_cursor = 0
+
+    def subscribe(self, channels: Optional[Iterable[str]] = None) -> LiveSubscriber:
+        """현재 이벤트 루프에서 구독 시작 (channels 미지정 시 전체)"""
+        subscriber = LiveSubscriber(channels or LIVE_CHANNELS, asyncio.get_running_loop())
+        with self._lock:
+            self._subscribers.add(subscriber)
+        return subscriber
+
+    def unsubscribe(self, subscriber: LiveSubscriber) -> None:
+        with self._lock:
+            self._subscribers.discard(subscriber)
+        subscriber.close()
+
+    def has_subscribers(self, channel: Optional[str] = None) -> bool:
+        with self._lock:
+            if channel is None:
+                return bool(self._subscribers)
+            return any(channel in s.channels for s in self._subscribers)
+
+    def publish(self, channel: str, data: Any, key: Optional[str] = None) -> None:
+        """
+        메시지 발행 (어느 스레드에서든 호출 가능)
+
+        Args:
+            channel: 채널 이름 (LIVE_CHANNELS)
+            data: JSON 직렬화 가능한 값
+            key: 지정 시 느린 구독자 큐에서 같은 키 메시지를 최신 값으로 합침
+        """
+        if self._relay_task is not None and channel in RELAYED_CHANNELS:
+            self.ring.append((channel, data, key))
+        self._deliver(channel, data, key)
+
+    def _deliver(self, channel: str, data: Any, key: Optional[str]) -> None:
+        """이 워커의 구독자에게 전달"""
+        with self._lock:
+            targets = [s for s in self._subscribers if channel in s.channels]
+        if not targets:
+            return
+        message = LiveMessage(next(self._ids), channel, data, key)
+        self.published += 1
+        for subscriber in targets:
+            subscriber.push(message)
+
+    # ----- 워커 간 중계 -----
+    async def start_relay(self) -> None:
+        """멀티 워커(serve.py)에서 다른 워커가 발행한 메시지 중계 시작 (단일 프로세스에서는 아무것도 하지 않음)"""
+        if self.ring is None or self._relay_task is not None or "SERVER_WORKER_ID" not in os.environ:
+            return
+        self._relay_cursor = self.ring.head()
+        self._relay_task = asyncio.create_task(self._relay())
+
+    async def stop_relay(self) -> None:
+        if self._relay_task is not None:
+            self._relay_task.cancel()
+            try:
+                await self._relay_task
+            except asyncio.CancelledError:
+                pass
+            self._relay_task = None
+
+    async def _relay(self) -> None:
+        pid = os.getpid()
+        while True:
+            await asyncio.sleep(RELAY_INTERVAL)
+            if not self.has_subscribers():
+                # 구독자가 없는 동안의 메시지는 건너뜀
+                self._relay_cursor = self.ring.head()
+                continue
+            self._relay_cursor, entries = self.ring.read(self._relay_cursor)
+            for origin, (channel, data, key) in entries:
+                if origin != pid:
+                    self.relayed += 1
+                    self._deliver(channel, data, key)
+
+    def close_all(self) -> None:
+        with self._lock:
+            subscribers, self._subscribers = self._subscribers, set()
+        for subscriber in subscribers:
+            subscriber.close()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            subscribers = list(self._subscribers)
+        return {
+            "subscribers": len(subscribers),
+            "published": self.published,
+            "dropped": sum(s.dropped for s in subscribers),
+            "coalesced": sum(s.coalesced for s in subscribers),
+            "relayed": self.relayed,
+            "relay_lost": self.ring.stats()["lost"] if self.ring is not None else 0,
+        }
+
+
+class LiveChangeFeed:
+    """
+    노드 상태/메트릭 변경 감지기
+
+    노드와 메트릭은 에이전트가 DB에 직접 적재하므로, 구독자가 있을 때만
+    서버가 한 번 조회해 변경분을 허브로 발행한다 (클라이언트 수와 무관하게 쿼리 1회).
+    """
+
+    def __init__(self, hub: LiveHub, session_factory: Callable[[], Session] = SessionLocal,
+                 interval: float = CHANGE_FEED_INTERVAL):
+        self.hub = hub
+        self.session_factory = session_factory
+        self.interval = interval
+        self._task: Optional[asyncio.Task] = None
+        self._metric_watermark: Optional[datetime] = None
+        self._node_status: Optional[Dict[int, str]] = None
+
+    async def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            if not (self.hub.has_subscribers("node_status") or self.hub.has_subscribers("metric")):
+                # 구독자가 없는 동안의 변경분은 건너뜀 (다음 구독 시 현재 시점부터 전달)
+                self._metric_watermark = None
+                self._node_status = None
+                continue
+            try:
+                await asyncio.to_thread(self.poll_once)
+            except Exception as e:
+                log_manager.logger.error(f"실시간 변경 감지 실패: {e}")
+
+    def poll_once(self) -> None:
+        db = self.session_factory()
+        try:
+            with time_job("live_change_feed"):
+                self._poll_node_status(db)
+                self._poll_metrics(db)
+        finally:
+            db.close()
+
+    def _poll_node_status(self, db: Session) -> None:
+        rows = db.execute(text("SELECT id, node_name, status FROM nodes")).fetchall()
+        current = {row.id: row.status for row in rows}
+        previous, self._node_status = self._node_status, current
+        if previous is None:
+            return
+        for row in rows:
+            if previous.get(row.id) != row.status:
+                self.hub.publish(
+                    "node_status",
+                    {"node_id": row.id, "node_name": row.node_name,
+                     "status": row.status, "previous_status": previous.get(row.id)},
+                    key=f"node_status:{row.id}"
+                )
+
+    def _poll_metrics(self, db: Session) -> None:
+        if self._metric_watermark is None:
+            self._metric_watermark = db.execute(text("SELECT MAX(collected_at) FROM metrics")).scalar() or datetime.utcnow()
+            return
+        rows = db.execute(text("""
+            SELECT m.node_id, n.node_name, m.cpu_usage, m.memory_usage, m.disk_usage,
+                   m.containers, m.collected_at
+            FROM metrics m
+            JOIN nodes n ON n.id = m.node_id
+            WHERE m.collected_at > :since
+            ORDER BY m.collected_at
+        """), {"since": self._metric_watermark}).fetchall()
+        for row in rows:
+            self.hub.publish(
+                "metric",
+                {"node_id": row.node_id, "node_name": row.node_name,
+                 "cpu_usage": row.cpu_usage, "memory_usage": row.memory_usage,
+                 "disk_usage": row.disk_usage, "containers": row.containers,
+                 "collected_at": row.collected_at.isoformat() + "Z"},
+                key=f"metric:{row.node_id}"
+            )
+        if rows:
+            self._metric_watermark = rows[-1].collected_at
+
+
+# 링은 fork 전에 만들어 모든 워커가 공유 (메시지당 4KB, 1024개)
+live_hub = LiveHub(SharedMemoryRing("live", slots=1024, slot_size=4096))
+live_change_feed = LiveChangeFeed(live_hub)
@@ -0,0 +1,389 @@
+"""
+Prometheus 텍스트 형식 자체 지표 레지스트리
+요청 수/지연 시간, DB 커넥션 풀, SQL 문 지문별 실행 수/시간, 캐시 적중, 백그라운드 작업 시간,
+적재 처리량을 수집해 /metrics 로 노출한다.
+
+수집 비용을 운영 환경에서도 켜 둘 수 있을 만큼 낮게 유지한다:
+- 값은 미리 집계된 카운터/히스토그램 버킷에 더하기만 하고, 샘플을 보관하지 않는다.
+- 라벨 조합별 자식 지표는 처음 한 번만 만들고, 요청 경로에서는 문자열 키로 캐시된 자식을 꺼내 쓴다
+  (요청마다 라벨 튜플을 만들지 않음).
+- 풀 상태처럼 조회 시점에 읽으면 되는 값은 스크레이프할 때 콜백으로 계산한다.
+"""
+from typing import Callable, Dict, Iterable, List, Sequence, Tuple
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from contextlib import contextmanager
+import re
+import threading
+import time
+
+# 지연 시간 히스토그램 버킷 (초)
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# 백그라운드 작업 시간 버킷 (초)
+JOB_BUCKETS = (0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 30.0, 60.0)
+
+# SQL 지문 라벨 개수 상한 (초과분은 "other"로 합산)
+MAX_QUERY_FINGERPRINTS = 200
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if isinstance(value, int) or float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _label_text(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    parts = [f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+class _CounterChild:
+    __slots__ = ("value", "lock")
+
+    def __init__(self):
+        self.value = 0.0
+        self.lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0) -> None:
+        with self.lock:
+            self.value += amount
+
+
+class _HistogramChild:
+    __slots__ = ("bounds", "counts", "sum", "lock")
+
+    def __init__(self, bounds: Tuple[float, ...]):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)  # 마지막 칸은 +Inf
+        self.sum = 0.0
+        self.lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        index = bisect_left(self.bounds, value)
+        with self.lock:
+            self.counts[index] += 1
+            self.sum += value
+
+
+class _Metric(ABC):
+    """지표 패밀리 (이름, 설명, 라벨 이름)"""
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+
+    @abstractmethod
+    def collect(self) -> List[str]:
+        """Prometheus 텍스트 형식 줄 목록"""
+
+    def _header(self) -> List[str]:
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+
+
+class _LabeledMetric(_Metric):
+    """라벨 조합별 자식 지표를 가진 지표 패밀리"""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._children: Dict[Tuple[str, ...], object] = {}
+        self._lock = threading.Lock()
+
+    @abstractmethod
+    def _new_child(self):
+        """라벨 조합 하나의 자식 지표 생성"""
+
+    def labels(self, *values: str):
+        """라벨 값에 해당하는 자식 지표 (호출 측에서 캐시해 재사용)"""
+        child = self._children.get(values)
+        if child is None:
+            with self._lock:
+                child = self._children.setdefault(values, self._new_child())
+        return child
+
+
+class Counter(_LabeledMetric):
+    kind = "counter"
+
+    def _new_child(self) -> _CounterChild:
+        return _CounterChild()
+
+    def inc(self, amount: float = 1.0) -> None:
+        """라벨이 없는 카운터 증가"""
+        self.labels().inc(amount)
+
+    def collect(self) -> List[str]:
+        lines = self._header()
+        for values, child in list(self._children.items()):
+            lines.append(f"{self.name}{_label_text(self.labelnames, values)} {_format_value(child.value)}")
+        return lines
+
+
+class Histogram(_LabeledMetric):
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = LATENCY_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.bounds = tuple(sorted(buckets))
+
+    def _new_child(self) -> _HistogramChild:
+        return _HistogramChild(self.bounds)
+
+    def observe(self, value: float) -> None:
+        self.labels().observe(value)
+
+    def collect(self) -> List[str]:
+        lines = self._header()
+        for values, child in list(self._children.items()):
+            with child.lock:
+                counts, total = list(child.counts), child.sum
+            cumulative = 0
+            for bound, count in zip(self.bounds + (float("inf"),), counts):
+                cumulative += count
+                le = f'le="{_format_value(bound)}"'
+                lines.append(f"{self.name}_bucket{_label_text(self.labelnames, values, le)} {cumulative}")
+            labels = _label_text(self.labelnames, values)
+            lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+            lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+
+class GaugeCallback(_Metric):
+    """스크레이프 시점에 콜백으로 값을 읽는 게이지"""
+    kind = "gauge"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str],
+                 callback: Callable[[], Iterable[Tuple[Sequence[str], float]]]):
+        super().__init__(name, documentation, labelnames)
+        self.callback = callback
+
+    def collect(self) -> List[str]:
+        lines = self._header()
+        for values, value in self.callback():
+            lines.append(f"{self.name}{_label_text(self.labelnames, values)} {_format_value(value)}")
+        return lines
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def register(self, metric: _Metric) -> _Metric:
+        with self._lock:
+            self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self.register(Counter(name, documentation, labelnames))
+
+    def histogram(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                  buckets: Sequence[float] = LATENCY_BUCKETS) -> Histogram:
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+
+    def gauge_callback(self, name: str, documentation: str, labelnames: Sequence[str],
+                       callback: Callable[[], Iterable[Tuple[Sequence[str], float]]]) -> GaugeCallback:
+        return self.register(GaugeCallback(name, documentation, labelnames, callback))
+
+    def families(self) -> List[Tuple[str, List[str]]]:
+        """지표 패밀리별 텍스트 줄 [(이름, [# HELP, # TYPE, 시계열 ...])]"""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        families = []
+        for metric in metrics:
+            try:
+                families.append((metric.name, metric.collect()))
+            except Exception as e:
+                families.append((metric.name, [f"# {metric.name} collect failed: {_escape(str(e))}"]))
+        return families
+
+    def exposition(self) -> str:
+        """Prometheus 텍스트 형식 (0.0.4)"""
+        return "\n".join(line for _, lines in self.families() for line in lines) + "\n"
+
+
+registry = MetricsRegistry()
+
+# ----- HTTP 요청 -----
+http_requests_total = registry.counter(
+    "http_requests_total", "HTTP requests by route template and status class", ("route", "status")
+)
+http_request_duration_seconds = registry.histogram(
+    "http_request_duration_seconds", "HTTP request latency by route template", ("route",)
+)
+
+_STATUS_LABELS = ("2xx", "2xx", "2xx", "3xx", "4xx", "5xx")  # status_code // 100 → 라벨 (1xx는 2xx로)
+
+
+class _RouteInstruments:
+    __slots__ = ("duration", "status")
+
+    def __init__(self, route: str):
+        self.duration = http_request_duration_seconds.labels(route)
+        self.status = [http_requests_total.labels(route, label) for label in _STATUS_LABELS]
+
+
+_route_instruments: Dict[str, _RouteInstruments] = {}
+
+
+def record_http_request(route: str, status_code: int, duration_seconds: float) -> None:
+    """요청 한 건 기록 (경로 템플릿별 자식 지표는 처음 한 번만 생성)"""
+    instruments = _route_instruments.get(route)
+    if instruments is None:
+        instruments = _route_instruments.setdefault(route, _RouteInstruments(route))
+    instruments.duration.observe(duration_seconds)
+    instruments.status[min(max(status_code // 100, 0), 5)].inc()
+
+
+# ----- SQL -----
+db_queries_total = registry.counter(
+    "db_queries_total", "SQL statements executed by normalized fingerprint", ("fingerprint",)
+)
+db_query_errors_total = registry.counter(
+    "db_query_errors_total", "SQL statements that raised by normalized fingerprint", ("fingerprint",)
+)
+db_query_duration_seconds = registry.histogram(
+    "db_query_duration_seconds", "SQL statement execution time by normalized fingerprint", ("fingerprint",)
+)
+
+_LITERAL_PATTERNS = (
+    (re.compile(r"'(?:[^']|'')*'"), "?"),
+    (re.compile(r"\b\d+(?:\.\d+)?\b"), "?"),
+    (re.compile(r"%\(\w+\)s|%s|:\w+"), "?"),
+    (re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)"), "(?+)"),
+    (re.compile(r"\s+"), " "),
+)
+
+
+def statement_fingerprint(statement: str) -> str:
+    """리터럴/파라미터를 ?로 바꾸고 공백을 정리한 SQL 지문"""
+    fingerprint = statement
+    for pattern, replacement in _LITERAL_PATTERNS:
+        fingerprint = pattern.sub(replacement, fingerprint)
+    fingerprint = fingerprint.strip()
+    return fingerprint[:160]
+
+
+class _QueryInstruments:
+    __slots__ = ("count", "errors", "duration")
+
+    def __init__(self, fingerprint: str):
+        self.count = db_queries_total.labels(fingerprint)
+        self.errors = db_query_errors_total.labels(fingerprint)
+        self.duration = db_query_duration_seconds.labels(fingerprint)
+
+
+_query_instruments: Dict[str, _QueryInstruments] = {}  # SQL 원문 → 지표 (원문별로 정규화는 한 번만)
+_fingerprints: Dict[str, _QueryInstruments] = {}
+
+
+def _instruments_for(statement: str) -> _QueryInstruments:
+    instruments = _query_instruments.get(statement)
+    if instruments is None:
+        fingerprint = statement_fingerprint(statement)
+        if fingerprint not in _fingerprints and len(_fingerprints) >= MAX_QUERY_FINGERPRINTS:
+            fingerprint = "other"
+        instruments = _fingerprints.get(fingerprint)
+        if instruments is None:
+            instruments = _fingerprints.setdefault(fingerprint, _QueryInstruments(fingerprint))
+        if len(_query_instruments) >= MAX_QUERY_FINGERPRINTS * 20:
+            _query_instruments.clear()
+        _query_instruments[statement] = instruments
+    return instruments
+
+
+def instrument_engine(engine) -> None:
+    """SQLAlchemy 엔진에 실행 시간 측정 이벤트와 커넥션 풀 게이지 연결"""
+    from sqlalchemy import event
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if context is not None:
+            context._metrics_started = time.perf_counter()
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        started = getattr(context, "_metrics_started", None)
+        if started is not None:
+            instruments = _instruments_for(statement)
+            instruments.count.inc()
+            instruments.duration.observe(time.perf_counter() - started)
+
+    @event.listens_for(engine, "handle_error")
+    def _handle_error(exception_context):
+        statement = exception_context.statement
+        if statement:
+            instruments = _instruments_for(statement)
+            instruments.count.inc()
+            instruments.errors.inc()
+
+    def pool_stats():
+        pool = engine.pool
+        stats = []
+        for name in ("size", "checkedin", "checkedout", "overflow"):
+            reader = getattr(pool, name, None)
+            if callable(reader):
+                stats.append(((name,), reader()))
+        return stats
+
+    registry.gauge_callback("db_pool_connections", "SQLAlchemy connection pool state", ("state",), pool_stats)
+
+
+# ----- 캐시 / 백그라운드 작업 / 적재 -----
+cache_requests_total = registry.counter(
+    "cache_requests_total", "Cache lookups by cache name and result (hit/miss)", ("cache", "result")
+)
+background_job_duration_seconds = registry.histogram(
+    "background_job_duration_seconds", "Background job run time", ("job",), JOB_BUCKETS
+)
+background_job_failures_total = registry.counter(
+    "background_job_failures_total", "Background job runs that raised", ("job",)
+)
+ingested_items_total = registry.counter(
+    "ingested_items_total", "Items accepted by ingest paths (received before dedup, stored after)", ("kind", "stage")
+)
+
+coalesced_calls_total = registry.counter(
+    "coalesced_calls_total",
+    "Single-flight calls by name and outcome (executed, joined an in-flight call, served from TTL cache, "
+    "served from the cross-worker shared cache)",
+    ("name", "outcome")
+)
+
+traces_total = registry.counter(
+    "traces_total", "Request traces by result (sampled, exported, dropped when the export queue is full, failed)",
+    ("result",)
+)
+
+
+def record_cache(cache: str, hits: int, misses: int) -> None:
+    if hits:
+        cache_requests_total.labels(cache, "hit").inc(hits)
+    if misses:
+        cache_requests_total.labels(cache, "miss").inc(misses)
+
+
+@contextmanager
+def time_job(job: str):
+    """백그라운드 작업 한 번의 실행 시간 기록 (예외는 실패 횟수에도 기록 후 다시 발생)"""
+    started = time.perf_counter()
+    try:
+        yield
+    except BaseException:
+        background_job_failures_total.labels(job).inc()
+        raise
+    finally:
+        background_job_duration_seconds.labels(job).observe(time.perf_counter() - started)
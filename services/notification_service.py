@@ -0,0 +1,309 @@
+"""
+알림 전송 서비스
+발생한 알림을 notification_outbox 테이블에 먼저 적재하고(아웃박스 패턴),
+asyncio 디스패처가 대상별로 다이제스트를 묶어 웹훅으로 전송한다.
+요청 처리/평가 흐름에서는 DB 적재만 하므로 전송 지연에 영향을 받지 않는다.
+"""
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from datetime import datetime, timedelta
+from collections import deque
+import asyncio
+import json
+import os
+import random
+import urllib.request
+
+from db.database import SessionLocal
+from models.notification import NotificationOutboxDB
+from services.live_service import live_hub
+from services.metrics_service import ingested_items_total, time_job
+from logs import log_manager
+
+# 웹훅 대상 목록 (쉼표로 구분, 예: "http://hooks.local/slack,http://hooks.local/pager")
+WEBHOOK_DESTINATIONS = [url.strip() for url in os.getenv("ALERT_WEBHOOK_URLS", "").split(",") if url.strip()]
+
+
+def enqueue_notifications(db: Session, alerts: List[Dict[str, Any]], destinations: Optional[List[str]] = None) -> int:
+    """
+    알림을 아웃박스에 적재 (대상별로 한 행씩)
+
+    Args:
+        db: 데이터베이스 세션
+        alerts: 전송할 알림 딕셔너리 목록
+        destinations: 웹훅 URL 목록 (기본값: 디스패처에 설정된 대상)
+
+    Returns:
+        int: 적재한 행 수
+    """
+    destinations = destinations or notification_dispatcher.destinations
+    now = datetime.utcnow()
+    rows = [
+        NotificationOutboxDB(
+            destination=destination,
+            payload=json.dumps(alert, ensure_ascii=False, default=str),
+            status="pending",
+            attempts=0,
+            next_attempt_at=now,
+            created_at=now
+        )
+        for destination in destinations
+        for alert in alerts
+    ]
+    if rows:
+        db.add_all(rows)
+        db.commit()
+        ingested_items_total.labels("notification", "enqueued").inc(len(rows))
+        notification_dispatcher.wake()
+
+    # 실시간 구독자에게 새 알림 푸시 (웹훅 대상 설정 여부와 무관)
+    for alert in alerts:
+        live_hub.publish("alert", alert)
+    return len(rows)
+
+
+class NotificationDispatcher:
+    """
+    아웃박스 기반 비동기 알림 디스패처
+
+    - 폴러: 전송 시각이 된 행을 점유(lease)하고 대상별 다이제스트로 묶어 큐에 넣는다
+    - 워커: 대상별 동시 전송 수를 세마포어로 제한하며 웹훅을 호출한다
+    - 실패 시 지수 백오프(지터 포함)로 재시도하고, 최대 횟수를 넘으면 failed 처리
+    점유 중 프로세스가 죽어도 lease가 끝나면 다른 워커가 다시 가져간다.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session] = SessionLocal,
+        destinations: Optional[List[str]] = None,
+        workers: int = 4,
+        per_destination_limit: int = 2,
+        max_batch: int = 50,
+        coalesce_window: float = 0.5,
+        poll_interval: float = 2.0,
+        max_attempts: int = 6,
+        backoff_base: float = 2.0,
+        backoff_max: float = 300.0,
+        timeout: float = 5.0,
+        lease_seconds: int = 60
+    ):
+        self.session_factory = session_factory
+        self.destinations = destinations if destinations is not None else WEBHOOK_DESTINATIONS
+        self.workers = workers
+        self.per_destination_limit = per_destination_limit
+        self.max_batch = max_batch
+        self.coalesce_window = coalesce_window
+        self.poll_interval = poll_interval
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.timeout = timeout
+        self.lease_seconds = lease_seconds
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._tasks: List[asyncio.Task] = []
+        self._running = False
+
+        self._latencies = deque(maxlen=2048)
+        self._counters = {"sent": 0, "failed": 0, "retried": 0, "digests_sent": 0}
+        self._queue_depth = 0
+        self._in_flight = 0
+
+    @property
+    def running(self) -> bool:
+        return self._running
+
+    # ----- 수명 주기 -----
+    async def start(self) -> None:
+        """폴러와 워커 태스크 시작 (이미 실행 중이면 무시)"""
+        if self._running:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._queue = asyncio.Queue(maxsize=self.workers * 2)
+        self._wakeup = asyncio.Event()
+        self._running = True
+        self._tasks = [asyncio.create_task(self._poll_loop())]
+        self._tasks.extend(asyncio.create_task(self._worker()) for _ in range(self.workers))
+        log_manager.logger.info(f"알림 디스패처 시작 (워커 {self.workers}개, 대상 {len(self.destinations)}개)")
+
+    async def stop(self) -> None:
+        """태스크 종료 (전송 중이던 행은 lease 만료 후 다시 전송됨)"""
+        if not self._running:
+            return
+        self._running = False
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    def wake(self) -> None:
+        """새 알림 적재를 폴러에 알림 (다른 스레드에서 호출해도 안전)"""
+        if self._running and self._loop:
+            self._loop.call_soon_threadsafe(self._wakeup.set)
+
+    # ----- 폴러 -----
+    async def _poll_loop(self) -> None:
+        while self._running:
+            try:
+                with time_job("notification_poll"):
+                    batches = await asyncio.to_thread(self._claim_due)
+                for batch in batches:
+                    await self._queue.put(batch)
+            except Exception as e:
+                log_manager.logger.error(f"알림 아웃박스 조회 실패: {e}")
+
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.poll_interval)
+                # 깨어난 직후 잠시 기다려 연속으로 들어온 알림을 하나의 다이제스트로 병합
+                await asyncio.sleep(self.coalesce_window)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+
+    def _claim_due(self) -> List[Tuple[str, List[Tuple[int, Any, datetime]]]]:
+        """전송 시각이 된 행을 lease로 점유하고 대상별 다이제스트 묶음으로 반환"""
+        db = self.session_factory()
+        try:
+            now = datetime.utcnow()
+            rows = (
+                db.query(NotificationOutboxDB)
+                .filter(
+                    NotificationOutboxDB.status.in_(["pending", "sending"]),
+                    NotificationOutboxDB.next_attempt_at <= now
+                )
+                .order_by(NotificationOutboxDB.id)
+                .limit(self.max_batch * self.workers)
+                .with_for_update(skip_locked=True)
+                .all()
+            )
+
+            lease_until = now + timedelta(seconds=self.lease_seconds)
+            grouped: Dict[str, List[Tuple[int, Any, datetime]]] = {}
+            for row in rows:
+                row.status = "sending"
+                row.next_attempt_at = lease_until
+                grouped.setdefault(row.destination, []).append((row.id, json.loads(row.payload), row.created_at))
+
+            self._queue_depth = db.query(func.count(NotificationOutboxDB.id)).filter(
+                NotificationOutboxDB.status.in_(["pending", "sending"])
+            ).scalar() or 0
+            db.commit()
+        finally:
+            db.close()
+
+        batches = []
+        for destination, items in grouped.items():
+            for i in range(0, len(items), self.max_batch):
+                batches.append((destination, items[i:i + self.max_batch]))
+        return batches
+
+    # ----- 워커 -----
+    def _semaphore(self, destination: str) -> asyncio.Semaphore:
+        if destination not in self._semaphores:
+            self._semaphores[destination] = asyncio.Semaphore(self.per_destination_limit)
+        return self._semaphores[destination]
+
+    async def _worker(self) -> None:
+        while True:
+            destination, items = await self._queue.get()
+            error = None
+            try:
+                digest = {
+                    "type": "alert_digest",
+                    "count": len(items),
+                    "alerts": [payload for _, payload, _ in items],
+                    "generated_at": datetime.utcnow().isoformat() + "Z"
+                }
+                async with self._semaphore(destination):
+                    self._in_flight += 1
+                    try:
+                        with time_job("notification_delivery"):
+                            await asyncio.to_thread(self._post, destination, digest)
+                    except Exception as e:
+                        error = str(e)[:500]
+                    finally:
+                        self._in_flight -= 1
+                await asyncio.to_thread(self._record_result, items, error)
+            except Exception as e:
+                log_manager.logger.error(f"알림 전송 결과 기록 실패: {e}")
+            finally:
+                self._queue.task_done()
+
+    def _post(self, destination: str, digest: Dict[str, Any]) -> None:
+        """웹훅 호출 (2xx가 아니면 예외)"""
+        request = urllib.request.Request(
+            destination,
+            data=json.dumps(digest, ensure_ascii=False).encode("utf-8"),
+            headers={"Content-Type": "application/json"},
+            method="POST"
+        )
+        with urllib.request.urlopen(request, timeout=self.timeout) as response:
+            if not 200 <= response.status < 300:
+                raise RuntimeError(f"HTTP {response.status}")
+
+    def _backoff(self, attempts: int) -> float:
+        """지수 백오프 (full jitter의 절반 하한)"""
+        delay = min(self.backoff_max, self.backoff_base * (2 ** (attempts - 1)))
+        return delay * random.uniform(0.5, 1.0)
+
+    def _record_result(self, items: List[Tuple[int, Any, datetime]], error: Optional[str]) -> None:
+        counts = {"sent": 0, "failed": 0, "retried": 0}
+        db = self.session_factory()
+        try:
+            now = datetime.utcnow()
+            rows = db.query(NotificationOutboxDB).filter(
+                NotificationOutboxDB.id.in_([item_id for item_id, _, _ in items])
+            ).all()
+            for row in rows:
+                row.attempts += 1
+                if error is None:
+                    row.status = "sent"
+                    row.sent_at = now
+                    counts["sent"] += 1
+                    self._latencies.append((now - row.created_at).total_seconds() * 1000)
+                elif row.attempts >= self.max_attempts:
+                    row.status = "failed"
+                    row.last_error = error
+                    counts["failed"] += 1
+                else:
+                    row.status = "pending"
+                    row.last_error = error
+                    row.next_attempt_at = now + timedelta(seconds=self._backoff(row.attempts))
+                    counts["retried"] += 1
+            db.commit()
+        finally:
+            db.close()
+
+        for key, value in counts.items():
+            self._counters[key] += value
+        if error is None:
+            self._counters["digests_sent"] += 1
+        else:
+            log_manager.logger.warning(f"알림 전송 실패 ({len(items)}건): {error}")
+
+    # ----- 지표 -----
+    def stats(self) -> Dict[str, Any]:
+        latencies = sorted(self._latencies)
+
+        def percentile(p: float) -> float:
+            if not latencies:
+                return 0.0
+            return round(latencies[min(len(latencies) - 1, int(len(latencies) * p))], 1)
+
+        return {
+            "running": self._running,
+            "destinations": list(self.destinations),
+            "queue_depth": self._queue_depth,
+            "in_flight": self._in_flight,
+            **self._counters,
+            "latency_p50_ms": percentile(0.50),
+            "latency_p95_ms": percentile(0.95),
+            "latency_max_ms": round(latencies[-1], 1) if latencies else 0.0
+        }
+
+
+notification_dispatcher = NotificationDispatcher()
@@ -0,0 +1,171 @@
+"""
+통계적 스택 샘플링 프로파일러
+실행 중인 워커 프로세스에서 일정 간격으로 모든 스레드의 스택(sys._current_frames)을 읽어
+flamegraph용 collapsed-stack 형식("프레임;프레임;프레임 횟수")으로 집계한다.
+
+- 한 번에 하나의 프로파일만 실행 (진행 중이면 ProfilerBusyError)
+- 샘플링 비용을 직접 재서 예산(PROFILE_OVERHEAD_BUDGET, 전체 시간 대비 비율)을 넘으면 간격을 늘린다.
+  결과에 실제 샘플 수, 최종 간격, 측정된 오버헤드를 함께 보고한다.
+"""
+from collections import Counter
+from typing import Any, Dict, Optional
+import os
+import sys
+import threading
+import time
+
+# 기본 샘플링 간격 (초, 100Hz)
+PROFILE_DEFAULT_INTERVAL = 0.01
+
+# 간격 하한/상한 (초)
+PROFILE_MIN_INTERVAL = 0.001
+PROFILE_MAX_INTERVAL = 0.5
+
+# 최대 프로파일 시간 (초)
+PROFILE_MAX_SECONDS = 60
+
+# 샘플링에 쓸 수 있는 시간 비율 (초과하면 간격을 두 배로)
+PROFILE_OVERHEAD_BUDGET = 0.02
+
+# 스택 최대 깊이 (깊은 재귀에서 한 샘플 비용 제한)
+MAX_STACK_DEPTH = 128
+
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class ProfilerBusyError(RuntimeError):
+    """다른 프로파일이 이미 실행 중"""
+
+
+def _short_path(filename: str) -> str:
+    """프레임 파일 경로 축약 (site-packages 이후 또는 프로젝트 기준 상대 경로)"""
+    marker = "site-packages" + os.sep
+    index = filename.rfind(marker)
+    if index >= 0:
+        return filename[index + len(marker):]
+    if filename.startswith(_PROJECT_ROOT):
+        return os.path.relpath(filename, _PROJECT_ROOT)
+    return os.path.basename(filename)
+
+
+class StackSampler:
+    """스택 샘플러 (프로세스당 하나의 실행만 허용)"""
+
+    def __init__(self):
+        self._running = threading.Lock()
+        self._labels: Dict[Any, str] = {}
+
+    @property
+    def busy(self) -> bool:
+        return self._running.locked()
+
+    def _label(self, code) -> str:
+        label = self._labels.get(code)
+        if label is None:
+            # collapsed 형식의 프레임 구분자(;)는 이름에 들어가면 안 됨 (횟수는 마지막 공백 뒤라 공백은 허용)
+            label = f"{code.co_name} ({_short_path(code.co_filename)})".replace(";", ":")
+            self._labels[code] = label
+        return label
+
+    def _collapse(self, frame, thread_name: Optional[str]) -> str:
+        labels = []
+        depth = 0
+        while frame is not None and depth < MAX_STACK_DEPTH:
+            labels.append(self._label(frame.f_code))
+            frame = frame.f_back
+            depth += 1
+        if thread_name:
+            labels.append(thread_name.replace(";", ":"))
+        labels.reverse()
+        return ";".join(labels)
+
+    def profile(self, seconds: float, interval: float = PROFILE_DEFAULT_INTERVAL,
+                by_thread: bool = False, include_idle: bool = False) -> Dict[str, Any]:
+        """
+        현재 스레드에서 seconds 동안 다른 모든 스레드의 스택을 샘플링
+
+        Args:
+            seconds: 프로파일 시간 (최대 PROFILE_MAX_SECONDS)
+            interval: 시작 샘플링 간격 (초)
+            by_thread: 스택 맨 앞에 스레드 이름을 붙일지 여부
+            include_idle: 대기 중인 스택(락/큐/셀렉터 대기)도 포함할지 여부
+
+        Returns:
+            Dict: collapsed(flamegraph 입력 텍스트), samples, stacks, interval, overhead 등
+
+        Raises:
+            ProfilerBusyError: 다른 프로파일이 실행 중인 경우
+        """
+        if not self._running.acquire(blocking=False):
+            raise ProfilerBusyError("다른 프로파일이 실행 중입니다.")
+        try:
+            return self._profile(min(max(seconds, 0.1), PROFILE_MAX_SECONDS),
+                                 min(max(interval, PROFILE_MIN_INTERVAL), PROFILE_MAX_INTERVAL),
+                                 by_thread, include_idle)
+        finally:
+            self._running.release()
+
+    def _profile(self, seconds: float, interval: float, by_thread: bool, include_idle: bool) -> Dict[str, Any]:
+        own_id = threading.get_ident()
+        stacks: Counter = Counter()
+        samples = 0
+        idle_skipped = 0
+        sampling_time = 0.0
+        started = time.perf_counter()
+        deadline = started + seconds
+        next_sample = started
+
+        while True:
+            now = time.perf_counter()
+            if now >= deadline:
+                break
+            if now < next_sample:
+                time.sleep(next_sample - now)
+                continue
+
+            sample_started = time.perf_counter()
+            names = {thread.ident: thread.name for thread in threading.enumerate()} if by_thread else {}
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_id:
+                    continue
+                if not include_idle and _is_idle(frame):
+                    idle_skipped += 1
+                    continue
+                stacks[self._collapse(frame, names.get(thread_id, str(thread_id)) if by_thread else None)] += 1
+            samples += 1
+            cost = time.perf_counter() - sample_started
+            sampling_time += cost
+
+            # 샘플당 평균 비용이 간격 대비 예산을 넘으면 간격을 늘려 오버헤드를 제한
+            if sampling_time / samples > interval * PROFILE_OVERHEAD_BUDGET and interval < PROFILE_MAX_INTERVAL:
+                interval = min(interval * 2, PROFILE_MAX_INTERVAL)
+            next_sample = sample_started + interval
+
+        duration = time.perf_counter() - started
+        collapsed = "\n".join(f"{stack} {count}" for stack, count in stacks.most_common())
+        return {
+            "collapsed": collapsed,
+            "duration_seconds": round(duration, 3),
+            "samples": samples,
+            "stacks": len(stacks),
+            "idle_skipped": idle_skipped,
+            "final_interval_ms": round(interval * 1000, 3),
+            "sampling_time_ms": round(sampling_time * 1000, 3),
+            "overhead_ratio": round(sampling_time / duration, 5) if duration else 0.0,
+            "overhead_budget": PROFILE_OVERHEAD_BUDGET,
+        }
+
+
+# 대기 중인 스레드의 맨 위 프레임 (CPU를 쓰지 않으므로 기본적으로 제외)
+_IDLE_FUNCTIONS = frozenset({
+    ("threading.py", "wait"), ("threading.py", "_wait_for_tstate_lock"), ("queue.py", "get"),
+    ("selectors.py", "select"), ("thread.py", "_worker"), ("connection.py", "wait"),
+})
+
+
+def _is_idle(frame) -> bool:
+    code = frame.f_code
+    return (os.path.basename(code.co_filename), code.co_name) in _IDLE_FUNCTIONS
+
+
+profiler = StackSampler()
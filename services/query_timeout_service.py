@@ -0,0 +1,211 @@
+"""
+라우트별 SQL 실행 시간 예산 (statement timeout)
+오래 걸리는 쿼리 하나가 풀 커넥션을 몇 분씩 잡고 있어 다른 라우트가 커넥션을 얻지 못하는 일을 막는다.
+
+라우트에서 query_budget(초) 의존성으로 예산을 정하면 요청 안의 모든 SQL 문은 남은 예산 안에서만 실행된다.
+- MySQL SELECT: /*+ MAX_EXECUTION_TIME(ms) */ 힌트를 붙여 서버가 직접 중단 (오류 3024)
+- MySQL 그 밖의 문장: 감시 스레드가 기한에 별도 연결로 KILL QUERY 실행
+- SQLite: 감시 스레드가 기한에 connection.interrupt() 호출
+중단된 쿼리는 QueryTimeoutError로 바뀌어 올라가고, BaseResponseRoute가 TIMEOUT 오류 응답(504)으로 변환한다.
+타임아웃 횟수는 query_timeouts_total{route} 지표로 집계한다.
+"""
+from contextvars import ContextVar
+from typing import Callable, List, Optional
+import heapq
+import itertools
+import re
+import threading
+import time
+
+from services.metrics_service import registry
+
+query_timeouts_total = registry.counter(
+    "query_timeouts_total", "SQL statements cancelled for exceeding the route query budget", ("route",)
+)
+
+# MySQL: 실행 시간 초과로 중단된 쿼리 오류 코드 (ER_QUERY_TIMEOUT)
+MYSQL_QUERY_TIMEOUT_ERROR = 3024
+
+_SELECT = re.compile(r"^\s*SELECT\b", re.IGNORECASE)
+
+
+class QueryTimeoutError(Exception):
+    """라우트의 SQL 실행 시간 예산 초과"""
+
+    def __init__(self, budget: float, statement: str = ""):
+        self.budget = budget
+        self.statement = statement
+        super().__init__(f"query budget of {budget:g}s exceeded")
+
+
+class _Budget:
+    __slots__ = ("seconds", "deadline")
+
+    def __init__(self, seconds: float):
+        self.seconds = seconds
+        self.deadline = time.monotonic() + seconds
+
+
+_budget: ContextVar[Optional[_Budget]] = ContextVar("query_budget", default=None)
+
+
+class _Watchdog:
+    """기한이 지난 쿼리를 취소하는 감시 스레드 하나 (쿼리마다 타이머 스레드를 만들지 않음)"""
+
+    def __init__(self):
+        self._heap: List = []
+        self._cancelled = set()
+        self._condition = threading.Condition()
+        self._sequence = itertools.count()
+        self._thread: Optional[threading.Thread] = None
+
+    def schedule(self, delay: float, cancel: Callable[[], None]) -> int:
+        with self._condition:
+            handle = next(self._sequence)
+            heapq.heappush(self._heap, (time.monotonic() + delay, handle, cancel))
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="query-timeout-watchdog", daemon=True)
+                self._thread.start()
+            self._condition.notify()
+            return handle
+
+    def discard(self, handle: int) -> None:
+        with self._condition:
+            self._cancelled.add(handle)
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while True:
+                    while self._heap and self._heap[0][1] in self._cancelled:
+                        self._cancelled.discard(heapq.heappop(self._heap)[1])
+                    if not self._heap:
+                        self._condition.wait()
+                        continue
+                    wait = self._heap[0][0] - time.monotonic()
+                    if wait <= 0:
+                        _, handle, cancel = heapq.heappop(self._heap)
+                        break
+                    self._condition.wait(wait)
+            try:
+                cancel()
+            except Exception:
+                pass
+
+
+class QueryTimeouts:
+    """요청별 예산(ContextVar)과 엔진 이벤트로 SQL 실행 시간을 제한"""
+
+    def __init__(self):
+        self.watchdog = _Watchdog()
+        self._kill_engine = None
+
+    def start(self, seconds: float) -> None:
+        """현재 요청(컨텍스트)의 예산 시작"""
+        _budget.set(_Budget(seconds) if seconds > 0 else None)
+
+    def _route(self) -> str:
+        from logs.context import current_request
+
+        context = current_request()
+        return (context.route if context is not None else None) or "unknown"
+
+    def _timed_out(self, budget: _Budget, statement: str) -> QueryTimeoutError:
+        query_timeouts_total.labels(self._route()).inc()
+        return QueryTimeoutError(budget.seconds, statement)
+
+    def _kill_query(self, engine, thread_id: int) -> None:
+        """MySQL: 별도 연결(풀 밖)에서 실행 중인 쿼리 중단"""
+        if self._kill_engine is None:
+            from sqlalchemy import create_engine
+            from sqlalchemy.pool import NullPool
+
+            self._kill_engine = create_engine(engine.url, poolclass=NullPool)
+        with self._kill_engine.connect() as conn:
+            conn.exec_driver_sql(f"KILL QUERY {int(thread_id)}")
+
+    def instrument(self, engine) -> None:
+        """엔진에 예산 적용 이벤트 연결"""
+        from sqlalchemy import event
+
+        mysql = engine.dialect.name == "mysql"
+
+        @event.listens_for(engine, "before_cursor_execute", retval=True)
+        def _apply_budget(conn, cursor, statement, parameters, context, executemany):
+            budget = _budget.get()
+            if budget is None or context is None:
+                return statement, parameters
+            remaining = budget.deadline - time.monotonic()
+            if remaining <= 0:
+                raise self._timed_out(budget, statement)
+
+            context._query_budget = budget
+            if mysql and _SELECT.match(statement):
+                hint = f"/*+ MAX_EXECUTION_TIME({max(1, int(remaining * 1000))}) */ "
+                match = _SELECT.match(statement)
+                statement = statement[:match.end()] + " " + hint + statement[match.end():].lstrip()
+                return statement, parameters
+
+            dbapi_connection = conn.connection.dbapi_connection
+            if mysql:
+                thread_id = dbapi_connection.thread_id()
+                cancel = lambda: self._kill_query(engine, thread_id)
+            elif hasattr(dbapi_connection, "interrupt"):
+                cancel = dbapi_connection.interrupt
+            else:
+                return statement, parameters
+
+            def fire():
+                # 문장이 이미 끝났으면(after_cursor_execute에서 해제) 같은 연결의 다음 문장을 중단하지 않음
+                if getattr(context, "_query_watch", None) is None:
+                    return
+                context._query_cancelled = True
+                cancel()
+
+            context._query_watch = -1  # 예약 직후 바로 기한이 되어도 fire가 중단하도록 먼저 표시
+            context._query_watch = self.watchdog.schedule(remaining, fire)
+            return statement, parameters
+
+        @event.listens_for(engine, "after_cursor_execute")
+        def _clear_watch(conn, cursor, statement, parameters, context, executemany):
+            handle = getattr(context, "_query_watch", None)
+            if handle is not None:
+                self.watchdog.discard(handle)
+                context._query_watch = None
+
+        @event.listens_for(engine, "handle_error")
+        def _translate_timeout(exception_context):
+            context = exception_context.execution_context
+            original = exception_context.original_exception
+            if context is None or isinstance(original, QueryTimeoutError):
+                return None
+            handle = getattr(context, "_query_watch", None)
+            if handle is not None:
+                self.watchdog.discard(handle)
+            budget = getattr(context, "_query_budget", None)
+            if budget is None:
+                return None
+            timed_out = getattr(context, "_query_cancelled", False)
+            if mysql and getattr(original, "args", None) and original.args[0] == MYSQL_QUERY_TIMEOUT_ERROR:
+                timed_out = True
+            if timed_out:
+                raise self._timed_out(budget, exception_context.statement or "") from original
+            return None
+
+
+query_timeouts = QueryTimeouts()
+
+
+def query_budget(seconds: float) -> Callable:
+    """
+    라우트 SQL 실행 시간 예산 의존성 생성
+
+    async 의존성이라 요청 태스크의 컨텍스트에 예산이 기록되고, 엔드포인트(스레드풀 실행 포함)가 그대로 물려받는다.
+
+    Example:
+        @router.get("/logs", dependencies=[Depends(query_budget(5.0))])
+    """
+    async def dependency() -> None:
+        query_timeouts.start(seconds)
+
+    return dependency
@@ -0,0 +1,207 @@
+"""
+HTTP 요청 지표 수집 서비스
+경로별 응답 시간을 병합 가능한 DDSketch 히스토그램으로, 상태 코드를 클래스(2xx~5xx)별로
+1시간 단위로 누적한다.
+
+요청 처리 경로에는 락이 없다: 기록은 스레드별 샤드(threading.local)에만 하고,
+조회 시 모든 샤드를 복사해 합친다 (내장 dict 복사는 GIL 아래에서 원자적).
+"""
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+import math
+import threading
+import time
+
+# 상대 오차 1% 이내의 분위수 (DDSketch alpha)
+SKETCH_RELATIVE_ACCURACY = 0.01
+
+# 보관 시간 (시간 단위 버킷 개수)
+RETENTION_HOURS = 24
+
+STATUS_CLASSES = ("2xx", "3xx", "4xx", "5xx")
+
+
+class DDSketch:
+    """
+    DDSketch 히스토그램 (양수 값 전용)
+
+    값 x를 ceil(log_gamma(x)) 버킷에 세므로 어떤 분위수든 상대 오차 alpha 이내로 복원되고,
+    같은 gamma를 쓰는 스케치끼리는 버킷 합으로 병합된다.
+    """
+    __slots__ = ("gamma", "_log_gamma", "bins", "count", "total", "zero_count")
+
+    def __init__(self, relative_accuracy: float = SKETCH_RELATIVE_ACCURACY):
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self.gamma)
+        self.bins: Dict[int, int] = {}
+        self.count = 0
+        self.total = 0.0
+        self.zero_count = 0  # 1e-9 이하 값
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        self.total += value
+        if value <= 1e-9:
+            self.zero_count += 1
+            return
+        key = math.ceil(math.log(value) / self._log_gamma)
+        self.bins[key] = self.bins.get(key, 0) + 1
+
+    def merge(self, other: "DDSketch") -> None:
+        for key, count in dict(other.bins).items():
+            self.bins[key] = self.bins.get(key, 0) + count
+        self.count += other.count
+        self.total += other.total
+        self.zero_count += other.zero_count
+
+    def copy(self) -> "DDSketch":
+        sketch = DDSketch.__new__(DDSketch)
+        sketch.gamma = self.gamma
+        sketch._log_gamma = self._log_gamma
+        sketch.bins = dict(self.bins)
+        sketch.count = self.count
+        sketch.total = self.total
+        sketch.zero_count = self.zero_count
+        return sketch
+
+    def quantile(self, q: float) -> Optional[float]:
+        """q 분위수 (0~1, 데이터가 없으면 None)"""
+        if self.count == 0:
+            return None
+        rank = q * (self.count - 1)
+        seen = self.zero_count
+        if rank < seen:
+            return 0.0
+        for key in sorted(self.bins):
+            seen += self.bins[key]
+            if seen > rank:
+                # 버킷 (gamma^(k-1), gamma^k] 의 대표값
+                return 2 * self.gamma ** key / (self.gamma + 1)
+        return 2 * self.gamma ** max(self.bins) / (self.gamma + 1)
+
+
+class _Shard:
+    """스레드 하나가 단독으로 기록하는 누적 공간"""
+    __slots__ = ("latency", "status", "hour")
+
+    def __init__(self):
+        self.latency: Dict[Tuple[int, str], DDSketch] = {}  # (hour, route) -> 응답 시간(ms)
+        self.status: Dict[Tuple[int, str], int] = {}  # (hour, "2xx") -> 요청 수
+        self.hour = 0
+
+    def prune(self, current_hour: int) -> None:
+        """보관 기간이 지난 버킷 삭제 (샤드 소유 스레드만 호출)"""
+        oldest = current_hour - RETENTION_HOURS + 1
+        for key in [k for k in self.latency if k[0] < oldest]:
+            del self.latency[key]
+        for key in [k for k in self.status if k[0] < oldest]:
+            del self.status[key]
+        self.hour = current_hour
+
+
+Snapshot = Tuple[List[Tuple[Tuple[int, str], DDSketch]], List[Tuple[Tuple[int, str], int]]]
+
+
+class RequestMetrics:
+    """경로별 응답 시간/상태 코드 누적기"""
+
+    def __init__(self):
+        self._local = threading.local()
+        self._shards: List[_Shard] = []
+        self._shards_lock = threading.Lock()  # 샤드 등록 시에만 사용
+        # 조회 시 함께 합칠 다른 워커의 스냅샷 (멀티 워커에서 services/worker_metrics_service.py가 설정)
+        self.peer_snapshots: Optional[Callable[[], Iterable[Snapshot]]] = None
+
+    def _shard(self) -> _Shard:
+        shard = getattr(self._local, "shard", None)
+        if shard is None:
+            shard = _Shard()
+            self._local.shard = shard
+            with self._shards_lock:
+                self._shards.append(shard)
+        return shard
+
+    def record(self, route: str, status_code: int, duration_ms: float, now: Optional[float] = None) -> None:
+        """요청 한 건 기록"""
+        shard = self._shard()
+        hour = int((now if now is not None else time.time()) // 3600)
+        if hour != shard.hour:
+            shard.prune(hour)
+
+        sketch = shard.latency.get((hour, route))
+        if sketch is None:
+            sketch = shard.latency[(hour, route)] = DDSketch()
+        sketch.add(duration_ms)
+
+        status_class = f"{min(max(status_code // 100, 2), 5)}xx"
+        key = (hour, status_class)
+        shard.status[key] = shard.status.get(key, 0) + 1
+
+    # ----- 조회 -----
+    def snapshot(self) -> Snapshot:
+        """이 프로세스의 누적값 복사본 (응답 시간 스케치 목록, 상태 코드 수 목록)"""
+        with self._shards_lock:
+            shards = list(self._shards)
+        latency, status = [], []
+        for shard in shards:
+            latency.extend((key, sketch.copy()) for key, sketch in list(shard.latency.items()))
+            status.extend(list(shard.status.items()))
+        return latency, status
+
+    def _snapshot(self) -> Snapshot:
+        latency, status = self.snapshot()
+        if self.peer_snapshots is not None:
+            for peer_latency, peer_status in self.peer_snapshots():
+                latency.extend(peer_latency)
+                status.extend(peer_status)
+        return latency, status
+
+    @staticmethod
+    def hours(count: int = RETENTION_HOURS, now: Optional[float] = None) -> List[int]:
+        """최근 count개 시간 버킷 (오래된 순)"""
+        current = int((now if now is not None else time.time()) // 3600)
+        return list(range(current - count + 1, current + 1))
+
+    def latency_series(self, quantiles: Iterable[float] = (0.5, 0.95, 0.99), route: Optional[str] = None,
+                       now: Optional[float] = None) -> Tuple[List[int], Dict[float, List[Optional[float]]]]:
+        """
+        시간별 응답 시간 분위수 (ms)
+
+        Returns:
+            Tuple[List[int], Dict[float, List[Optional[float]]]]: 시간 버킷 목록, 분위수별 값 (요청이 없는 시간은 None)
+        """
+        hours = self.hours(now=now)
+        merged: Dict[int, DDSketch] = {}
+        latency, _ = self._snapshot()
+        for (hour, sketch_route), sketch in latency:
+            if hour < hours[0] or (route is not None and sketch_route != route):
+                continue
+            if hour in merged:
+                merged[hour].merge(sketch)
+            else:
+                merged[hour] = sketch
+
+        series = {}
+        for q in quantiles:
+            values = []
+            for hour in hours:
+                value = merged[hour].quantile(q) if hour in merged else None
+                values.append(round(value, 1) if value is not None else None)
+            series[q] = values
+        return hours, series
+
+    def status_distribution(self, now: Optional[float] = None) -> Dict[str, int]:
+        """보관 기간 동안의 상태 클래스별 요청 수"""
+        oldest = self.hours(now=now)[0]
+        counts = {status_class: 0 for status_class in STATUS_CLASSES}
+        _, status = self._snapshot()
+        for (hour, status_class), count in status:
+            if hour >= oldest:
+                counts[status_class] += count
+        return counts
+
+    def routes(self) -> List[str]:
+        latency, _ = self._snapshot()
+        return sorted({route for (_, route), _ in latency})
+
+
+request_metrics = RequestMetrics()
@@ -0,0 +1,343 @@
+"""
+워커 간 공유 메모리 캐시
+멀티 워커(serve.py)로 실행하면 프로세스별 캐시는 워커 수만큼 중복되고 각자 따로 채워진다.
+이 캐시는 fork 전에 만든 익명 공유 mmap 위의 고정 크기 슬롯 해시 테이블이라
+한 워커가 채우거나 무효화한 항목을 다른 모든 워커가 바로 본다.
+
+- 슬롯: [seq u32][키 다이제스트 16B][만료 f64][세대 u32][값 길이 u32][값 ...]
+- 읽기는 락 없이 seqlock으로 수행 (seq가 홀수이거나 읽는 동안 바뀌면 다시 읽음)
+- 쓰기/삭제는 프로세스 간 락 하나로 직렬화 (쓰기는 캐시 미스 때만 일어남)
+- 락은 LOCK_TIMEOUT까지만 기다린다. 락을 잡은 워커가 죽어(OOM, 강제 종료) 풀리지 않으면
+  공유 헤더에 고장 표시를 남기고, 모든 워커가 그 매핑을 끈 것으로 처리 (조회는 미스, 쓰기는 건너뜀)
+- clear()는 헤더의 세대 번호를 올려 기존 항목 전체를 한 번에 무효화
+- 값은 pickle로 저장하며, 슬롯보다 큰 값은 캐시하지 않음 (oversize로 집계)
+
+같은 방식의 공유 매핑 위에 워커 간 브로드캐스트 링(SharedMemoryRing, 실시간 푸시 전달)도 둔다.
+
+매핑은 객체를 만들 때 생성되므로 serve.py처럼 앱을 임포트한 뒤 fork해야 워커 간에 공유된다
+(uvicorn --workers처럼 각 워커가 따로 임포트하면 프로세스별 캐시로 동작).
+"""
+from typing import Any, Dict, List, Tuple
+import hashlib
+import mmap
+import multiprocessing
+import os
+import pickle
+import struct
+import time
+
+from logs import log_manager
+
+# 헤더: [세대 u64][락 고장 표시 u32]
+_HEADER = struct.Struct("<QI")
+_GENERATION = struct.Struct("<Q")
+# 락 고장 표시 위치 (캐시/링 헤더 공통, 앞 8바이트 다음)
+_BROKEN = struct.Struct("<I")
+_BROKEN_OFFSET = 8
+# 슬롯 헤더: seq, 키 다이제스트, 만료 시각(time.time), 세대, 값 길이
+_SLOT = struct.Struct("<I16sdII")
+_EMPTY_DIGEST = bytes(16)
+_unpack_slot = _SLOT.unpack_from
+_unpack_seq = struct.Struct("<I").unpack_from
+
+# 해시 위치에서 선형 탐사할 최대 슬롯 수
+PROBE_LIMIT = 8
+
+# seqlock 읽기 재시도 횟수 (초과 시 미스로 처리)
+READ_RETRIES = 16
+
+# 프로세스 간 락 대기 한도 (초), 쓰기 구간은 마이크로초 단위라 넘으면 락을 잡은 워커가 죽은 것으로 봄
+LOCK_TIMEOUT = 0.5
+
+
+def _digest(key: Any) -> bytes:
+    if isinstance(key, str):
+        raw = key.encode()
+    else:
+        raw = key if isinstance(key, bytes) else repr(key).encode()
+    digest = hashlib.blake2b(raw, digest_size=16).digest()
+    return digest if digest != _EMPTY_DIGEST else b"\x01" + digest[1:]
+
+
+class _SharedLock:
+    """
+    대기 한도가 있는 프로세스 간 락
+
+    한도 안에 잡지 못하면 매핑 헤더에 고장 표시를 남긴다. 표시는 모든 워커가 보며,
+    이후로는 락을 기다리지 않고 바로 실패한다 (서버를 다시 시작해 매핑을 새로 만들 때까지).
+    """
+
+    def __init__(self, name: str, buf: mmap.mmap):
+        self.name = name
+        self._buf = buf
+        self._lock = multiprocessing.Lock()
+
+    @property
+    def broken(self) -> bool:
+        return _BROKEN.unpack_from(self._buf, _BROKEN_OFFSET)[0] != 0
+
+    def acquire(self) -> bool:
+        if self.broken:
+            return False
+        if self._lock.acquire(timeout=LOCK_TIMEOUT):
+            return True
+        _BROKEN.pack_into(self._buf, _BROKEN_OFFSET, 1)
+        log_manager.logger.error(f"공유 메모리 '{self.name}' 락을 {LOCK_TIMEOUT}초 안에 잡지 못했습니다 "
+                     f"(락을 잡은 워커가 종료된 것으로 보임). 서버를 다시 시작할 때까지 사용하지 않습니다.")
+        return False
+
+    def release(self) -> None:
+        self._lock.release()
+
+
+class SharedMemoryCache:
+    """고정 크기 슬롯 공유 메모리 해시 테이블 (TTL, 프로세스/스레드 안전)"""
+
+    def __init__(self, name: str, slots: int = 1024, slot_size: int = 512):
+        if slot_size <= _SLOT.size:
+            raise ValueError(f"slot_size는 {_SLOT.size}바이트보다 커야 합니다.")
+        self.name = name
+        self.slots = slots
+        self.slot_size = slot_size
+        self.capacity = slot_size - _SLOT.size
+        # 익명 MAP_SHARED 매핑: fork한 자식 프로세스와 같은 물리 페이지를 공유
+        self._buf = mmap.mmap(-1, _HEADER.size + slots * slot_size)
+        self._lock = _SharedLock(name, self._buf)
+        self._counts = {"hit": 0, "miss": 0, "set": 0, "oversize": 0, "evicted": 0, "lock_timeout": 0}
+
+    def _offset(self, index: int) -> int:
+        return _HEADER.size + index * self.slot_size
+
+    def _generation(self) -> int:
+        return _HEADER.unpack_from(self._buf, 0)[0] & 0xFFFFFFFF
+
+    def _probe(self, digest: bytes):
+        """키가 들어갈 수 있는 슬롯 오프셋 목록 (해시 위치부터 PROBE_LIMIT개)"""
+        start = int.from_bytes(digest[:8], "little") % self.slots
+        return [self._offset((start + step) % self.slots) for step in range(min(PROBE_LIMIT, self.slots))]
+
+    def _read_slot(self, offset: int):
+        """seqlock 읽기 → (다이제스트, 만료, 세대, 값 바이트) 또는 None (계속 쓰기 중)"""
+        buf = self._buf
+        for _ in range(READ_RETRIES):
+            seq, digest, expires, generation, length = _unpack_slot(buf, offset)
+            if seq & 1:
+                continue
+            start = offset + _SLOT.size
+            payload = buf[start:start + min(length, self.capacity)]
+            if _unpack_seq(buf, offset)[0] == seq:
+                return digest, expires, generation, payload
+        return None
+
+    def _write_slot(self, offset: int, digest: bytes, expires: float, generation: int, payload: bytes) -> None:
+        """락을 잡은 상태에서 호출 (seq 홀수 → 내용 기록 → seq 짝수)"""
+        buf = self._buf
+        seq = _SLOT.unpack_from(buf, offset)[0]
+        struct.pack_into("<I", buf, offset, (seq + 1) & 0xFFFFFFFF)
+        buf[offset + _SLOT.size:offset + _SLOT.size + len(payload)] = payload
+        struct.pack_into("<16sdII", buf, offset + 4, digest, expires, generation, len(payload))
+        struct.pack_into("<I", buf, offset, (seq + 2) & 0xFFFFFFFF)
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        """키의 값 (없거나 만료/무효화되었으면 default)"""
+        if self._lock.broken:
+            # 락이 고장 나면 무효화(delete/clear)도 기록되지 않으므로 남은 항목을 믿지 않음
+            self._counts["miss"] += 1
+            return default
+        digest = _digest(key)
+        now = time.time()
+        generation = self._generation()
+        # 대부분의 키는 해시 위치의 첫 슬롯에 있으므로 탐사 목록은 필요할 때만 만듦
+        start = int.from_bytes(digest[:8], "little") % self.slots
+        first = self._offset(start)
+        offsets = (first,) if _unpack_slot(self._buf, first)[1] == digest else self._probe(digest)
+        for offset in offsets:
+            entry = self._read_slot(offset)
+            if entry is None or entry[0] != digest:
+                continue
+            if entry[1] > now and entry[2] == generation:
+                try:
+                    value = pickle.loads(entry[3])
+                except Exception:
+                    break
+                self._counts["hit"] += 1
+                return value
+            break
+        self._counts["miss"] += 1
+        return default
+
+    def set(self, key: Any, value: Any, ttl: float) -> bool:
+        """
+        값 저장 (같은 키 → 빈/만료 슬롯 → 만료가 가장 이른 슬롯 순으로 자리를 고름)
+
+        Returns:
+            bool: 저장 여부 (값이 슬롯보다 크거나 락을 잡지 못하면 False)
+        """
+        payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        if len(payload) > self.capacity:
+            self._counts["oversize"] += 1
+            return False
+        digest = _digest(key)
+        now = time.time()
+        if not self._lock.acquire():
+            self._counts["lock_timeout"] += 1
+            return False
+        try:
+            generation = self._generation()
+            target, victim, victim_expires = None, None, float("inf")
+            for offset in self._probe(digest):
+                _, slot_digest, expires, slot_generation, _ = _SLOT.unpack_from(self._buf, offset)
+                if slot_digest == digest or slot_digest == _EMPTY_DIGEST \
+                        or expires <= now or slot_generation != generation:
+                    target = offset
+                    break
+                if expires < victim_expires:
+                    victim, victim_expires = offset, expires
+            if target is None:
+                target = victim
+                self._counts["evicted"] += 1
+            self._write_slot(target, digest, now + ttl, generation, payload)
+        finally:
+            self._lock.release()
+        self._counts["set"] += 1
+        return True
+
+    def delete(self, key: Any) -> bool:
+        """키 무효화 (모든 워커에 즉시 반영, 락을 잡지 못하면 캐시 전체가 꺼지므로 역시 반영됨)"""
+        digest = _digest(key)
+        if not self._lock.acquire():
+            self._counts["lock_timeout"] += 1
+            return False
+        try:
+            for offset in self._probe(digest):
+                if _SLOT.unpack_from(self._buf, offset)[1] == digest:
+                    self._write_slot(offset, _EMPTY_DIGEST, 0.0, 0, b"")
+                    return True
+        finally:
+            self._lock.release()
+        return False
+
+    def clear(self) -> None:
+        """전체 무효화 (세대 번호 증가, 기존 항목은 읽을 때 미스로 처리되고 쓸 때 덮어씀)"""
+        if not self._lock.acquire():
+            self._counts["lock_timeout"] += 1
+            return
+        try:
+            _GENERATION.pack_into(self._buf, 0, _GENERATION.unpack_from(self._buf, 0)[0] + 1)
+        finally:
+            self._lock.release()
+
+    def stats(self) -> Dict[str, int]:
+        """이 프로세스의 조회/저장 횟수와 공유 테이블의 사용 중 슬롯 수"""
+        now = time.time()
+        generation = self._generation()
+        used = 0
+        for index in range(self.slots):
+            _, digest, expires, slot_generation, _ = _SLOT.unpack_from(self._buf, self._offset(index))
+            if digest != _EMPTY_DIGEST and expires > now and slot_generation == generation:
+                used += 1
+        return {**self._counts, "used_slots": used, "slots": self.slots, "lock_broken": int(self._lock.broken)}
+
+
+# 링 헤더: [다음 순번 u64][락 고장 표시 u32], 링 슬롯: [순번 + 1 u64 (0이면 쓰는 중)][보낸 프로세스 ID u32][값 길이 u32]
+_RING_HEADER = struct.Struct("<QI")
+_RING_SLOT = struct.Struct("<QII")
+
+
+class SharedMemoryRing:
+    """
+    워커 간 브로드캐스트 링 버퍼 (여러 워커가 쓰고 모든 워커가 각자의 커서로 읽음)
+
+    - 쓰기는 프로세스 간 락으로 직렬화하고, 슬롯 순번을 0으로 지운 뒤 값을 쓰고 순번을 기록
+      (락을 잡지 못하면 기록하지 않음, lock_timeout으로 집계)
+    - 읽기는 락 없이 값 앞뒤로 슬롯 순번을 확인 (그사이 덮어쓰였으면 잃은 메시지로 집계)
+    - 읽는 쪽이 슬롯 수보다 뒤처지면 가장 오래된 메시지부터 잃음
+    """
+
+    def __init__(self, name: str, slots: int = 1024, slot_size: int = 4096):
+        if slot_size <= _RING_SLOT.size:
+            raise ValueError(f"slot_size는 {_RING_SLOT.size}바이트보다 커야 합니다.")
+        self.name = name
+        self.slots = slots
+        self.slot_size = slot_size
+        self.capacity = slot_size - _RING_SLOT.size
+        self._buf = mmap.mmap(-1, _RING_HEADER.size + slots * slot_size)
+        self._lock = _SharedLock(name, self._buf)
+        self._counts = {"appended": 0, "read": 0, "lost": 0, "oversize": 0, "lock_timeout": 0}
+
+    def _offset(self, sequence: int) -> int:
+        return _RING_HEADER.size + (sequence % self.slots) * self.slot_size
+
+    def head(self) -> int:
+        """다음에 기록될 순번 (새 독자는 여기서부터 읽음)"""
+        return _GENERATION.unpack_from(self._buf, 0)[0]
+
+    def append(self, value: Any) -> bool:
+        """
+        값 추가 (보낸 프로세스 ID를 함께 기록)
+
+        Returns:
+            bool: 기록 여부 (값이 슬롯보다 크거나 락을 잡지 못하면 False)
+        """
+        payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        if len(payload) > self.capacity:
+            self._counts["oversize"] += 1
+            return False
+        buf = self._buf
+        if not self._lock.acquire():
+            self._counts["lock_timeout"] += 1
+            return False
+        try:
+            sequence = self.head()
+            offset = self._offset(sequence)
+            _RING_SLOT.pack_into(buf, offset, 0, 0, 0)
+            buf[offset + _RING_SLOT.size:offset + _RING_SLOT.size + len(payload)] = payload
+            _RING_SLOT.pack_into(buf, offset, sequence + 1, os.getpid(), len(payload))
+            _GENERATION.pack_into(buf, 0, sequence + 1)
+        finally:
+            self._lock.release()
+        self._counts["appended"] += 1
+        return True
+
+    def read(self, cursor: int) -> Tuple[int, List[Tuple[int, Any]]]:
+        """
+        cursor 이후에 추가된 값
+
+        Returns:
+            Tuple[int, List[Tuple[int, Any]]]: 다음 cursor, [(보낸 프로세스 ID, 값)]
+        """
+        buf = self._buf
+        head = self.head()
+        if head - cursor > self.slots:
+            self._counts["lost"] += head - self.slots - cursor
+            cursor = head - self.slots
+        entries = []
+        for sequence in range(cursor, head):
+            offset = self._offset(sequence)
+            marker, pid, length = _RING_SLOT.unpack_from(buf, offset)
+            start = offset + _RING_SLOT.size
+            payload = buf[start:start + min(length, self.capacity)]
+            if marker != sequence + 1 or _RING_SLOT.unpack_from(buf, offset)[0] != marker:
+                self._counts["lost"] += 1
+                continue
+            try:
+                entries.append((pid, pickle.loads(payload)))
+            except Exception:
+                self._counts["lost"] += 1
+        self._counts["read"] += len(entries)
+        return head, entries
+
+    def stats(self) -> Dict[str, int]:
+        """이 프로세스의 기록/읽기 횟수"""
+        return dict(self._counts)
+
+
+# 세션 토큰 → 사용자 (토큰 원문이 아닌 다이제스트만 저장)
+session_cache = SharedMemoryCache("session", slots=4096, slot_size=256)
+
+# 통계 엔드포인트 응답 (키에 데이터 버전 포함)
+stats_cache = SharedMemoryCache("stats", slots=64, slot_size=16384)
+
+
+def shared_caches() -> Dict[str, SharedMemoryCache]:
+    return {cache.name: cache for cache in (session_cache, stats_cache)}
@@ -0,0 +1,327 @@
+"""
+알림 사일런스(유지보수 구간) 서비스
+사일런스를 매처 인덱스 + 구간 트리(interval tree)에 보관하여
+알림이 사일런스 대상인지 O(log n) 시간에 판별하고, 만료는 타이머로 처리한다.
+
+인덱스는 워커마다 따로 있으므로, 조회 전에 silences 데이터 버전(data_versions, 모든 워커가 같은 DB 행을 봄)을
+확인해 바뀌었으면 DB에서 다시 구성한다 (다른 워커의 생성/만료가 최대 VERSION_CACHE_TTL 안에 반영됨).
+"""
+from sqlalchemy.orm import Session
+from typing import Dict, List, Optional, Iterator, Tuple
+from datetime import datetime
+import fnmatch
+import heapq
+import json
+import random
+import threading
+
+GLOB_CHARS = "*?["
+
+
+def _is_glob(value: str) -> bool:
+    return any(ch in value for ch in GLOB_CHARS)
+
+
+def _literal_prefix(pattern: str) -> str:
+    """와일드카드 앞까지의 고정 접두사 (예: "k8s-worker-*" -> "k8s-worker-")"""
+    for i, ch in enumerate(pattern):
+        if ch in GLOB_CHARS:
+            return pattern[:i]
+    return pattern
+
+
+class _TreeNode:
+    __slots__ = ("start", "end", "silence_id", "priority", "left", "right", "max_end")
+
+    def __init__(self, start: float, end: float, silence_id: int):
+        self.start = start
+        self.end = end
+        self.silence_id = silence_id
+        self.priority = random.random()
+        self.left = None
+        self.right = None
+        self.max_end = end
+
+
+class IntervalTree:
+    """
+    시작 시각을 키로 하는 트립(treap) 기반 구간 트리
+
+    각 노드에 서브트리의 최대 종료 시각을 보관하여, 특정 시각을 포함하는 구간을
+    O(log n + k)에 찾는다.
+    """
+
+    def __init__(self):
+        self.root = None
+        self.size = 0
+
+    @staticmethod
+    def _update(node: _TreeNode) -> None:
+        node.max_end = node.end
+        if node.left and node.left.max_end > node.max_end:
+            node.max_end = node.left.max_end
+        if node.right and node.right.max_end > node.max_end:
+            node.max_end = node.right.max_end
+
+    def _rotate_right(self, node: _TreeNode) -> _TreeNode:
+        pivot = node.left
+        node.left = pivot.right
+        pivot.right = node
+        self._update(node)
+        self._update(pivot)
+        return pivot
+
+    def _rotate_left(self, node: _TreeNode) -> _TreeNode:
+        pivot = node.right
+        node.right = pivot.left
+        pivot.left = node
+        self._update(node)
+        self._update(pivot)
+        return pivot
+
+    def _insert(self, node: Optional[_TreeNode], new: _TreeNode) -> _TreeNode:
+        if node is None:
+            return new
+        if (new.start, new.silence_id) < (node.start, node.silence_id):
+            node.left = self._insert(node.left, new)
+            if node.left.priority > node.priority:
+                node = self._rotate_right(node)
+        else:
+            node.right = self._insert(node.right, new)
+            if node.right.priority > node.priority:
+                node = self._rotate_left(node)
+        self._update(node)
+        return node
+
+    def _remove(self, node: Optional[_TreeNode], start: float, silence_id: int) -> Optional[_TreeNode]:
+        if node is None:
+            return None
+        key = (start, silence_id)
+        if key < (node.start, node.silence_id):
+            node.left = self._remove(node.left, start, silence_id)
+        elif key > (node.start, node.silence_id):
+            node.right = self._remove(node.right, start, silence_id)
+        else:
+            if node.left is None:
+                return node.right
+            if node.right is None:
+                return node.left
+            # 우선순위가 높은 자식을 올려 삭제 대상을 아래로 내린다
+            if node.left.priority > node.right.priority:
+                node = self._rotate_right(node)
+                node.right = self._remove(node.right, start, silence_id)
+            else:
+                node = self._rotate_left(node)
+                node.left = self._remove(node.left, start, silence_id)
+        self._update(node)
+        return node
+
+    def insert(self, start: float, end: float, silence_id: int) -> None:
+        self.root = self._insert(self.root, _TreeNode(start, end, silence_id))
+        self.size += 1
+
+    def remove(self, start: float, silence_id: int) -> None:
+        """등록된 구간 제거 (호출자가 존재를 보장)"""
+        self.root = self._remove(self.root, start, silence_id)
+        self.size -= 1
+
+    def stab(self, point: float) -> Iterator[int]:
+        """point 시각을 포함하는 [start, end) 구간들의 사일런스 ID"""
+        stack = [self.root] if self.root else []
+        while stack:
+            node = stack.pop()
+            if node.max_end <= point:
+                continue
+            if node.left:
+                stack.append(node.left)
+            if node.start <= point:
+                if point < node.end:
+                    yield node.silence_id
+                if node.right:
+                    stack.append(node.right)
+
+
+class SilenceIndex:
+    """
+    사일런스 인메모리 인덱스
+
+    사일런스는 가장 선택적인 매처 하나를 기준 키로 삼아 키별 구간 트리에 들어간다.
+    - 정확한 대상 이름: 대상 이름 키
+    - 정확한 라벨 값: (라벨, 값) 키
+    - 와일드카드 대상: 고정 접두사별 패턴 키
+    - 그 외(와일드카드 라벨만): 공통 트리
+    조회 시 알림이 닿을 수 있는 트리만 찍어본 뒤 전체 매처를 검증한다.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._silences: Dict[int, dict] = {}
+        self._trees: Dict[Tuple, IntervalTree] = {}
+        self._glob_prefixes: Dict[str, set] = {}
+        self._expiry_heap: List[Tuple[float, int]] = []
+        self._timer: Optional[threading.Timer] = None
+        self._timer_deadline: Optional[float] = None
+        self._loaded = False
+        self._version: Optional[int] = None
+
+    # ----- 인덱스 키 -----
+    @staticmethod
+    def _index_key(target: Optional[str], labels: Dict[str, str]) -> Tuple:
+        if target and not _is_glob(target):
+            return ("target", target)
+        for name, value in sorted(labels.items()):
+            if not _is_glob(value):
+                return ("label", name, value)
+        if target:
+            return ("glob", target)
+        return ("any",)
+
+    @staticmethod
+    def _matches(silence: dict, target: str, labels: Dict[str, str]) -> bool:
+        if silence["target"] and not fnmatch.fnmatchcase(target, silence["target"]):
+            return False
+        for name, value in silence["labels"].items():
+            if name not in labels or not fnmatch.fnmatchcase(labels[name], value):
+                return False
+        return True
+
+    # ----- 등록/삭제 -----
+    def add(self, silence_id: int, target: Optional[str], labels: Dict[str, str],
+            starts_at: datetime, ends_at: datetime) -> None:
+        """사일런스를 인덱스에 등록 (이미 끝난 사일런스는 무시)"""
+        start, end = starts_at.timestamp(), ends_at.timestamp()
+        if end <= datetime.utcnow().timestamp():
+            return
+
+        with self._lock:
+            self.remove(silence_id)
+            key = self._index_key(target, labels)
+            self._silences[silence_id] = {
+                "target": target or None,
+                "labels": dict(labels),
+                "start": start,
+                "end": end,
+                "key": key,
+            }
+            self._trees.setdefault(key, IntervalTree()).insert(start, end, silence_id)
+            if key[0] == "glob":
+                self._glob_prefixes.setdefault(_literal_prefix(target), set()).add(target)
+
+            heapq.heappush(self._expiry_heap, (end, silence_id))
+            self._schedule_expiry()
+
+    def remove(self, silence_id: int) -> None:
+        """사일런스를 인덱스에서 제거"""
+        with self._lock:
+            silence = self._silences.pop(silence_id, None)
+            if not silence:
+                return
+            key = silence["key"]
+            tree = self._trees[key]
+            tree.remove(silence["start"], silence_id)
+            if tree.size == 0:
+                del self._trees[key]
+                if key[0] == "glob":
+                    patterns = self._glob_prefixes[_literal_prefix(key[1])]
+                    patterns.discard(key[1])
+                    if not patterns:
+                        del self._glob_prefixes[_literal_prefix(key[1])]
+            # 만료 힙의 항목은 타이머가 꺼낼 때 무시된다 (지연 삭제)
+
+    # ----- 만료 타이머 -----
+    def _schedule_expiry(self) -> None:
+        """가장 먼저 끝나는 사일런스 시각에 맞춰 타이머를 하나만 유지"""
+        while self._expiry_heap and self._expiry_heap[0][1] not in self._silences:
+            heapq.heappop(self._expiry_heap)
+        if not self._expiry_heap:
+            return
+
+        deadline = self._expiry_heap[0][0]
+        if self._timer and self._timer_deadline is not None and self._timer_deadline <= deadline:
+            return
+        if self._timer:
+            self._timer.cancel()
+
+        delay = max(0.0, deadline - datetime.utcnow().timestamp())
+        self._timer = threading.Timer(delay, self._expire_due)
+        self._timer.daemon = True
+        self._timer_deadline = deadline
+        self._timer.start()
+
+    def _expire_due(self) -> None:
+        with self._lock:
+            self._timer = None
+            self._timer_deadline = None
+            now = datetime.utcnow().timestamp()
+            while self._expiry_heap and self._expiry_heap[0][0] <= now:
+                end, silence_id = heapq.heappop(self._expiry_heap)
+                silence = self._silences.get(silence_id)
+                if silence and silence["end"] == end:
+                    self.remove(silence_id)
+            self._schedule_expiry()
+
+    # ----- 조회 -----
+    def _candidate_trees(self, target: str, labels: Dict[str, str]) -> Iterator[IntervalTree]:
+        keys = [("target", target), ("any",)]
+        keys.extend(("label", name, value) for name, value in labels.items())
+        for i in range(len(target) + 1):
+            for pattern in self._glob_prefixes.get(target[:i], ()):
+                keys.append(("glob", pattern))
+        for key in keys:
+            tree = self._trees.get(key)
+            if tree:
+                yield tree
+
+    def find(self, target: str, labels: Optional[Dict[str, str]] = None, at: Optional[datetime] = None) -> Optional[int]:
+        """알림을 가리는 사일런스 ID (없으면 None)"""
+        labels = labels or {}
+        point = (at or datetime.utcnow()).timestamp()
+        with self._lock:
+            for tree in self._candidate_trees(target, labels):
+                for silence_id in tree.stab(point):
+                    if self._matches(self._silences[silence_id], target, labels):
+                        return silence_id
+        return None
+
+    def is_silenced(self, target: str, labels: Optional[Dict[str, str]] = None, at: Optional[datetime] = None) -> bool:
+        return self.find(target, labels, at) is not None
+
+    def __len__(self) -> int:
+        return len(self._silences)
+
+    # ----- DB 동기화 -----
+    def _clear(self) -> None:
+        with self._lock:
+            if self._timer:
+                self._timer.cancel()
+            self._timer = None
+            self._timer_deadline = None
+            self._silences.clear()
+            self._trees.clear()
+            self._glob_prefixes.clear()
+            self._expiry_heap.clear()
+
+    def ensure_loaded(self, db: Session) -> None:
+        """
+        아직 끝나지 않은 사일런스를 DB에서 읽어 인덱스 구성
+        (최초 사용 시, 그리고 silences 데이터 버전이 바뀌었을 때 = 다른 워커의 변경 포함)
+        """
+        from services.data_version_service import data_versions
+
+        version = data_versions.current().get("silences")
+        if self._loaded and version == self._version:
+            return
+        from models.alert import SilenceDB
+
+        with self._lock:
+            if self._loaded and version == self._version:
+                return
+            rows = db.query(SilenceDB).filter(SilenceDB.ends_at > datetime.utcnow()).all()
+            self._clear()
+            for row in rows:
+                self.add(row.id, row.target, json.loads(row.labels or "{}"), row.starts_at, row.ends_at)
+            self._loaded = True
+            self._version = version
+
+
+silence_index = SilenceIndex()
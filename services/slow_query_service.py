@@ -0,0 +1,186 @@
+"""
+느린 쿼리 로그 서비스
+엔진 이벤트로 모든 SQL 실행 시간을 재고, 기준(SLOW_QUERY_THRESHOLD_MS)을 넘은 실행을 정규화된 문장 지문별로 집계한다.
+
+- 지문별 느린 실행 횟수, 합계/최대/p95 시간(최근 실행 기준), 처음/마지막 발생 시각
+- 지문별 첫 번째 느린 SELECT의 실행 계획(EXPLAIN)을 같은 파라미터로 한 번만 수집.
+  EXPLAIN은 별도 스레드에서 풀의 다른 커넥션으로 실행하므로 요청을 더 늦추지 않는다.
+- 관리자 API(/api/admin/slow-queries)에서 합계 시간 등의 기준으로 정렬한 보고서를 제공
+"""
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Deque, Dict, List, Optional
+import os
+import threading
+import time
+
+from logs import log_manager
+from services.metrics_service import statement_fingerprint
+
+# 느린 쿼리 기준 (밀리초)
+SLOW_QUERY_THRESHOLD_MS = float(os.getenv("SLOW_QUERY_THRESHOLD_MS", "200"))
+
+# 추적할 최대 지문 수 (초과 시 새 지문은 "other"로 집계)
+MAX_SLOW_FINGERPRINTS = 200
+
+# p95 계산에 쓰는 지문별 최근 실행 수
+RECENT_SAMPLES = 256
+
+# 보고서 정렬 기준
+SORT_KEYS = ("total_ms", "p95_ms", "max_ms", "count")
+
+
+class _SlowQueryStats:
+    __slots__ = ("fingerprint", "statement", "count", "total_ms", "max_ms", "recent",
+                 "first_seen", "last_seen", "explain", "explain_error")
+
+    def __init__(self, fingerprint: str, statement: str):
+        self.fingerprint = fingerprint
+        self.statement = statement
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.recent: Deque[float] = deque(maxlen=RECENT_SAMPLES)
+        self.first_seen = datetime.utcnow()
+        self.last_seen = self.first_seen
+        self.explain: Optional[List[dict]] = None
+        self.explain_error: Optional[str] = None
+
+    def add(self, elapsed_ms: float) -> None:
+        self.count += 1
+        self.total_ms += elapsed_ms
+        self.max_ms = max(self.max_ms, elapsed_ms)
+        self.recent.append(elapsed_ms)
+        self.last_seen = datetime.utcnow()
+
+    def p95(self) -> float:
+        ordered = sorted(self.recent)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))] if ordered else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "fingerprint": self.fingerprint,
+            "statement": self.statement,
+            "count": self.count,
+            "total_ms": round(self.total_ms, 2),
+            "avg_ms": round(self.total_ms / self.count, 2) if self.count else 0.0,
+            "p95_ms": round(self.p95(), 2),
+            "max_ms": round(self.max_ms, 2),
+            "first_seen": self.first_seen.isoformat() + "Z",
+            "last_seen": self.last_seen.isoformat() + "Z",
+            "explain": self.explain,
+            "explain_error": self.explain_error,
+        }
+
+
+class SlowQueryLog:
+    """엔진 단위 느린 쿼리 감지/집계"""
+
+    def __init__(self, threshold_ms: float = SLOW_QUERY_THRESHOLD_MS):
+        self.threshold_ms = threshold_ms
+        self._engine = None
+        self._lock = threading.Lock()
+        self._stats: Dict[str, _SlowQueryStats] = {}
+        self._explainer: Optional[ThreadPoolExecutor] = None
+
+    def instrument(self, engine) -> None:
+        """엔진에 실행 시간 측정 이벤트 연결"""
+        from sqlalchemy import event
+
+        self._engine = engine
+
+        @event.listens_for(engine, "before_cursor_execute")
+        def _start_timer(conn, cursor, statement, parameters, context, executemany):
+            if context is not None:
+                context._slow_query_started = time.perf_counter()
+
+        @event.listens_for(engine, "after_cursor_execute")
+        def _check_slow(conn, cursor, statement, parameters, context, executemany):
+            started = getattr(context, "_slow_query_started", None)
+            if started is None:
+                return
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            if elapsed_ms >= self.threshold_ms:
+                self.record(statement, parameters, elapsed_ms, executemany)
+
+    def record(self, statement: str, parameters: Any, elapsed_ms: float, executemany: bool = False) -> None:
+        """느린 실행 한 건 집계 (지문별 첫 실행이면 EXPLAIN 수집 예약)"""
+        fingerprint = statement_fingerprint(statement)
+        with self._lock:
+            stats = self._stats.get(fingerprint)
+            first = stats is None
+            if first:
+                if len(self._stats) >= MAX_SLOW_FINGERPRINTS:
+                    fingerprint = "other"
+                    stats = self._stats.get(fingerprint)
+                    first = False
+                if stats is None:
+                    stats = self._stats[fingerprint] = _SlowQueryStats(fingerprint, statement.strip())
+            stats.add(elapsed_ms)
+
+        log_manager.logger.warning(
+            f"느린 쿼리 {elapsed_ms:.0f}ms: {fingerprint[:120]}", extra={"rate_limit": 1}
+        )
+        if first and not executemany and self._explainable(statement):
+            self._submit_explain(stats, statement, parameters)
+
+    @staticmethod
+    def _explainable(statement: str) -> bool:
+        head = statement.lstrip().split(None, 1)[0].upper() if statement.strip() else ""
+        return head in ("SELECT", "WITH")
+
+    def _submit_explain(self, stats: _SlowQueryStats, statement: str, parameters: Any) -> None:
+        if self._engine is None:
+            return
+        if self._explainer is None:
+            with self._lock:
+                if self._explainer is None:
+                    self._explainer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="slow-query-explain")
+        self._explainer.submit(self._capture_explain, stats, statement, parameters)
+
+    def _capture_explain(self, stats: _SlowQueryStats, statement: str, parameters: Any) -> None:
+        """
+        실행 계획 수집 (DBAPI 커서로 직접 실행해 엔진 이벤트/지표에 다시 잡히지 않게 함)
+
+        문장은 이미 방언에 맞게 컴파일되어 있으므로 원래 파라미터를 그대로 넘긴다.
+        """
+        prefix = "EXPLAIN QUERY PLAN " if self._engine.dialect.name == "sqlite" else "EXPLAIN "
+        connection = self._engine.raw_connection()
+        try:
+            cursor = connection.cursor()
+            try:
+                cursor.execute(prefix + statement, parameters or ())
+                columns = [column[0] for column in cursor.description or ()]
+                stats.explain = [
+                    {column: (value if isinstance(value, (int, float, str)) or value is None else str(value))
+                     for column, value in zip(columns, row)}
+                    for row in cursor.fetchall()
+                ]
+            finally:
+                cursor.close()
+            connection.rollback()
+        except Exception as e:
+            stats.explain_error = str(e)
+        finally:
+            connection.close()
+
+    def report(self, sort_by: str = "total_ms", limit: int = 20) -> Dict[str, Any]:
+        """지문별 집계를 기준 내림차순으로 정렬한 보고서"""
+        if sort_by not in SORT_KEYS:
+            raise ValueError(f"알 수 없는 정렬 기준: {sort_by} (가능한 값: {', '.join(SORT_KEYS)})")
+        with self._lock:
+            entries = [stats.to_dict() for stats in self._stats.values()]
+        entries.sort(key=lambda entry: entry[sort_by], reverse=True)
+        return {
+            "threshold_ms": self.threshold_ms,
+            "fingerprints": len(entries),
+            "queries": entries[:limit],
+        }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats.clear()
+
+
+slow_query_log = SlowQueryLog()
@@ -0,0 +1,367 @@
+"""
+개요/대시보드 통계 스냅샷 서비스
+클러스터 전체 집계 쿼리를 요청마다 실행하지 않고, 백그라운드 갱신기가 일정 주기로
+계산해 stats_snapshots 테이블에 적재한다. API는 최신 스냅샷을 읽기만 하며,
+스냅샷이 오래되었으면 그대로 응답하고 갱신을 예약한다 (stale-while-revalidate).
+
+조회 API의 ETag는 stats_snapshots 데이터 버전으로 만들므로, 응답 본문도 그 버전의 스냅샷이어야 한다.
+다른 워커가 새 스냅샷을 적재해 버전이 바뀌면 계산하지 않고 최신 행만 다시 읽는다.
+"""
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+from datetime import datetime, timedelta
+import asyncio
+import json
+import threading
+
+from db.database import SessionLocal
+from logs import log_manager
+from services.data_version_service import data_versions
+from services.metrics_service import record_cache, time_job
+
+# 스냅샷 갱신 주기 (초)
+STATS_REFRESH_INTERVAL = 30.0
+
+# 이 시간보다 오래된 스냅샷은 응답 후 갱신을 예약
+STATS_STALE_AFTER = timedelta(seconds=STATS_REFRESH_INTERVAL * 2)
+
+# 변화량 비교 대상 (이전 시간대)
+STATS_CHANGE_WINDOW = timedelta(hours=1)
+
+# 노드별 최신 메트릭을 찾는 구간 (이보다 오래 수집되지 않은 노드는 평균에서 제외)
+STATS_LATEST_METRIC_WINDOW = timedelta(minutes=15)
+
+# 가동률 계산 구간 및 스냅샷 보관 기간
+STATS_UPTIME_WINDOW = timedelta(hours=24)
+STATS_RETENTION = timedelta(days=7)
+
+HEALTHY_NODE_STATUSES = ("Ready", "Active")
+WARNING_NODE_STATUSES = ("Warning",)
+FAILED_CONTAINER_STATUSES = ("failed", "error", "dead", "crashloopbackoff")
+STOPPED_CONTAINER_STATUSES = ("stopped", "exited", "paused", "created")
+
+
+class StatsSnapshot(NamedTuple):
+    id: int
+    created_at: datetime
+    values: Dict[str, float]
+
+
+def _percent_change(current: float, previous: Optional[float], digits: int = 0) -> str:
+    """이전 값 대비 변화율 문자열 (예: "+2%", "-1.5%", "0%")"""
+    if previous is None or current == previous:
+        return "0%"
+    if not previous:
+        return "+100%"
+    change = round((current - previous) / abs(previous) * 100, digits)
+    if change == 0:
+        return "0%"
+    text_value = f"{change:.{digits}f}" if digits else str(int(change))
+    return f"+{text_value}%" if change > 0 else f"{text_value}%"
+
+
+class StatsSnapshotService:
+    """통계 스냅샷 계산/저장/조회"""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def compute(self, now: Optional[datetime] = None) -> Dict[str, float]:
+        """현재 클러스터 통계 집계 (변화량 제외 원본 수치)"""
+        now = now or datetime.utcnow()
+
+        container_counts: Dict[str, int] = {}
+        for row in self.db.execute(text("SELECT status, COUNT(id) AS count FROM containers GROUP BY status")):
+            status = (row.status or "").lower()
+            container_counts[status] = container_counts.get(status, 0) + row.count
+        total_containers = sum(container_counts.values())
+        running = container_counts.get("running", 0)
+        failed = sum(container_counts.get(s, 0) for s in FAILED_CONTAINER_STATUSES)
+        stopped = sum(container_counts.get(s, 0) for s in STOPPED_CONTAINER_STATUSES)
+
+        node_counts = {row.status: row.count for row in self.db.execute(
+            text("SELECT status, COUNT(id) AS count FROM nodes GROUP BY status")
+        )}
+        total_nodes = sum(node_counts.values())
+        healthy_nodes = sum(node_counts.get(s, 0) for s in HEALTHY_NODE_STATUSES)
+        warning_nodes = sum(node_counts.get(s, 0) for s in WARNING_NODE_STATUSES)
+
+        # 노드별 최신 메트릭 평균 (최근 구간에 수집된 노드만, 노드마다 최신 행 하나)
+        usage = self.db.execute(text("""
+            SELECT AVG(m.cpu_usage) AS avg_cpu, AVG(m.memory_usage) AS avg_mem
+            FROM metrics m
+            JOIN (
+                SELECT node_id, MAX(collected_at) AS collected_at
+                FROM metrics
+                WHERE collected_at >= :since
+                GROUP BY node_id
+            ) latest ON latest.node_id = m.node_id AND latest.collected_at = m.collected_at
+        """), {"since": now - STATS_LATEST_METRIC_WINDOW}).fetchone()
+
+        network_bps = self.db.execute(text(
+            "SELECT SUM(COALESCE(network_rx_bps, 0) + COALESCE(network_tx_bps, 0)) FROM containers"
+        )).scalar() or 0
+
+        # 최근 1시간 Warning 이벤트를 경고 알림으로, 실패 컨테이너/비정상 노드를 위험 알림으로 집계
+        warning_alerts = self.db.execute(
+            text("SELECT COUNT(id) FROM events WHERE type = 'Warning' AND last_seen >= :since"),
+            {"since": now - timedelta(hours=1)}
+        ).scalar() or 0
+        unhealthy_nodes = total_nodes - healthy_nodes - warning_nodes
+
+        # 시스템 상태: 정상 노드와 실행 중 컨테이너가 관리 대상(중지 제외)에서 차지하는 비율
+        managed = total_nodes + running + failed
+        system_health = (healthy_nodes + running) / managed * 100 if managed else 100.0
+
+        return {
+            "total_containers": total_containers,
+            "running_containers": running,
+            "stopped_containers": stopped,
+            "failed_containers": failed,
+            "total_nodes": total_nodes,
+            "healthy_nodes": healthy_nodes,
+            "warning_nodes": warning_nodes,
+            "active_nodes": healthy_nodes + warning_nodes,
+            "avg_cpu": round(float(usage.avg_cpu or 0.0), 1) if usage else 0.0,
+            "avg_memory": round(float(usage.avg_mem or 0.0), 1) if usage else 0.0,
+            "network_traffic": int(network_bps / (1024 * 1024)),
+            "system_health": round(system_health, 1),
+            "uptime": round(self._uptime(now, total_nodes, healthy_nodes), 1),
+            "warning_alerts": warning_alerts,
+            "critical_alerts": failed + max(unhealthy_nodes, 0),
+        }
+
+    def _uptime(self, now: datetime, total_nodes: int, healthy_nodes: int) -> float:
+        """최근 24시간 스냅샷의 정상 노드 비율 평균 (%)"""
+        ratios = [healthy_nodes / total_nodes if total_nodes else 1.0]
+        rows = self.db.execute(
+            text("SELECT payload FROM stats_snapshots WHERE created_at >= :since"),
+            {"since": now - STATS_UPTIME_WINDOW}
+        ).fetchall()
+        for row in rows:
+            values = json.loads(row.payload)
+            total = values.get("total_nodes", 0)
+            ratios.append(values.get("healthy_nodes", 0) / total if total else 1.0)
+        return sum(ratios) / len(ratios) * 100
+
+    def store(self, values: Dict[str, float], now: Optional[datetime] = None) -> StatsSnapshot:
+        from models.overview import StatsSnapshotDB
+
+        row = StatsSnapshotDB(payload=json.dumps(values), created_at=now or datetime.utcnow())
+        self.db.add(row)
+        self.db.commit()
+        return StatsSnapshot(row.id, row.created_at, values)
+
+    def _load(self, query) -> Optional[StatsSnapshot]:
+        row = query.first()
+        return StatsSnapshot(row.id, row.created_at, json.loads(row.payload)) if row else None
+
+    def latest(self) -> Optional[StatsSnapshot]:
+        from models.overview import StatsSnapshotDB
+
+        return self._load(self.db.query(StatsSnapshotDB).order_by(StatsSnapshotDB.created_at.desc()))
+
+    def previous(self, current: StatsSnapshot) -> Optional[StatsSnapshot]:
+        """변화량 비교용 스냅샷 (current 기준 한 시간 이전 중 가장 최근)"""
+        from models.overview import StatsSnapshotDB
+
+        return self._load(self.db.query(StatsSnapshotDB).filter(
+            StatsSnapshotDB.created_at <= current.created_at - STATS_CHANGE_WINDOW
+        ).order_by(StatsSnapshotDB.created_at.desc()))
+
+    def prune(self, now: Optional[datetime] = None) -> None:
+        from models.overview import StatsSnapshotDB
+
+        cutoff = (now or datetime.utcnow()) - STATS_RETENTION
+        self.db.query(StatsSnapshotDB).filter(StatsSnapshotDB.created_at < cutoff).delete(synchronize_session=False)
+        self.db.commit()
+
+
+class StatsRefresher:
+    """
+    통계 스냅샷 백그라운드 갱신기
+
+    여러 워커가 떠 있어도 다른 워커가 방금 적재한 스냅샷이 있으면 계산하지 않고 그대로 사용한다.
+    """
+
+    def __init__(self, session_factory: Callable[[], Session] = SessionLocal,
+                 interval: float = STATS_REFRESH_INTERVAL):
+        self.session_factory = session_factory
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._current: Optional[StatsSnapshot] = None
+        self._previous: Optional[StatsSnapshot] = None
+        # 현재 스냅샷을 읽을 때의 stats_snapshots 데이터 버전
+        self._version: Optional[int] = None
+        self._refreshing = False
+        self._task: Optional[asyncio.Task] = None
+        self._runs = 0
+
+    # ----- 갱신 -----
+    def refresh_now(self) -> Optional[StatsSnapshot]:
+        """스냅샷 갱신 (동시 호출 시 하나만 실행)"""
+        with self._lock:
+            if self._refreshing:
+                return self._current
+            self._refreshing = True
+        db = self.session_factory()
+        try:
+            with time_job("stats_refresh"):
+                return self._refresh(db)
+        except Exception as e:
+            db.rollback()
+            log_manager.logger.error(f"통계 스냅샷 갱신 실패: {e}")
+            return self._current
+        finally:
+            db.close()
+            with self._lock:
+                self._refreshing = False
+
+    def _refresh(self, db: Session, compute: bool = True) -> Optional[StatsSnapshot]:
+        # 버전을 먼저 읽어, 그 뒤에 적재된 스냅샷은 다음 조회에서 버전 차이로 다시 읽히게 함
+        version = data_versions.current().get("stats_snapshots")
+        service = StatsSnapshotService(db)
+        now = datetime.utcnow()
+        current = service.latest()
+        if compute and (current is None or now - current.created_at >= timedelta(seconds=self.interval * 0.9)):
+            current = service.store(service.compute(now), now)
+        if current is None:
+            return None
+        previous = service.previous(current)
+
+        if compute:
+            self._runs += 1
+            if self._runs % 120 == 1:
+                service.prune(now)
+
+        with self._lock:
+            self._current, self._previous, self._version = current, previous, version
+        return current
+
+    def reload(self) -> None:
+        """DB의 최신 스냅샷으로 교체 (다른 워커가 적재한 경우, 계산하지 않음)"""
+        db = self.session_factory()
+        try:
+            self._refresh(db, compute=False)
+        except Exception as e:
+            db.rollback()
+            log_manager.logger.error(f"통계 스냅샷 다시 읽기 실패: {e}")
+        finally:
+            db.close()
+
+    def request_refresh(self) -> None:
+        """응답을 막지 않고 백그라운드 스레드에서 갱신"""
+        if not self._refreshing:
+            threading.Thread(target=self.refresh_now, daemon=True).start()
+
+    async def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.to_thread(self.refresh_now)
+            await asyncio.sleep(self.interval)
+
+    # ----- 조회 -----
+    def get(self) -> Tuple[Optional[StatsSnapshot], Optional[StatsSnapshot]]:
+        """
+        최신 스냅샷과 비교 대상 스냅샷
+
+        스냅샷이 오래되었으면 그대로 반환하고 갱신을 예약하며,
+        아직 하나도 없을 때만 호출한 요청에서 직접 계산한다.
+        stats_snapshots 데이터 버전이 바뀌었으면(다른 워커의 적재) 최신 행을 먼저 다시 읽는다.
+        """
+        with self._lock:
+            current, previous, version = self._current, self._previous, self._version
+        if current is not None and data_versions.current().get("stats_snapshots") != version:
+            self.reload()
+            with self._lock:
+                current, previous = self._current, self._previous
+        record_cache("stats_snapshot", int(current is not None), int(current is None))
+        if current is None:
+            current = self.refresh_now()
+            with self._lock:
+                previous = self._previous
+        elif datetime.utcnow() - current.created_at > STATS_STALE_AFTER:
+            self.request_refresh()
+        return current, previous
+
+
+stats_refresher = StatsRefresher()
+
+
+def build_overview_stats(current: StatsSnapshot, previous: Optional[StatsSnapshot]) -> Dict[str, Any]:
+    """스냅샷으로 OverviewStats 필드 구성"""
+    values = current.values
+    before = previous.values if previous else {}
+
+    def change(key: str, digits: int = 0) -> str:
+        return _percent_change(values[key], before.get(key), digits)
+
+    return {
+        "total_containers": int(values["total_containers"]),
+        "running_containers": int(values["running_containers"]),
+        "active_nodes": int(values["active_nodes"]),
+        "healthy_nodes": int(values["healthy_nodes"]),
+        "system_health": values["system_health"],
+        "uptime": values["uptime"],
+        "warning_alerts": int(values["warning_alerts"]),
+        "critical_alerts": int(values["critical_alerts"]),
+        "total_containers_change": change("total_containers"),
+        "running_containers_change": change("running_containers"),
+        "active_nodes_change": change("active_nodes"),
+        "healthy_nodes_change": change("healthy_nodes"),
+        "system_health_change": change("system_health", 1),
+        "uptime_change": change("uptime", 1),
+        "warning_alerts_change": change("warning_alerts"),
+        "critical_alerts_change": change("critical_alerts"),
+    }
+
+
+def build_dashboard_stats(current: StatsSnapshot, previous: Optional[StatsSnapshot]) -> Dict[str, Dict[str, Any]]:
+    """스냅샷으로 DashboardStats 필드 구성"""
+    values = current.values
+    before = previous.values if previous else {}
+
+    def change(key: str, digits: int = 0) -> str:
+        return _percent_change(values[key], before.get(key), digits)
+
+    return {
+        "containers": {
+            "total": int(values["total_containers"]),
+            "running": int(values["running_containers"]),
+            "stopped": int(values["stopped_containers"]),
+            "failed": int(values["failed_containers"]),
+            "total_change": change("total_containers"),
+            "running_change": change("running_containers"),
+            "stopped_change": change("stopped_containers"),
+            "failed_change": change("failed_containers"),
+        },
+        "nodes": {
+            "total": int(values["total_nodes"]),
+            "healthy": int(values["healthy_nodes"]),
+            "warning": int(values["warning_nodes"]),
+            "total_change": change("total_nodes"),
+            "healthy_change": change("healthy_nodes"),
+            "warning_change": change("warning_nodes"),
+        },
+        "resources": {
+            "avg_cpu": values["avg_cpu"],
+            "avg_memory": values["avg_memory"],
+            "network_traffic": int(values["network_traffic"]),
+            "avg_cpu_change": change("avg_cpu", 1),
+            "avg_memory_change": change("avg_memory", 1),
+            "network_traffic_change": change("network_traffic"),
+        },
+    }
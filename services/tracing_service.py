@@ -0,0 +1,308 @@
+"""
+요청 추적(tracing) 서비스
+요청 하나를 스팬 트리로 기록해 느린 요청의 시간이 어디에 쓰였는지(의존성/검증, 엔드포인트, SQL 문장별, 직렬화) 보여 준다.
+
+- 헤드 기반 샘플링: 요청 시작 시 TRACE_SAMPLE_RATE 확률로 추적 여부를 정한다 (상위 서비스가 보낸
+  traceparent 헤더의 sampled 플래그가 있으면 그 결정을 따름). 샘플링되지 않은 요청은 contextvar 조회 한 번으로 끝난다.
+- SQL 스팬: 엔진 before/after_cursor_execute 이벤트로 문장별 실행 시간을 현재 스팬의 자식으로 기록
+- 내보내기: 완료된 추적을 OTLP/HTTP JSON(ExportTraceServiceRequest) 형식으로 묶어
+  파일(TRACE_EXPORT_FILE, 한 줄에 한 배치) 또는 로컬 수집기(TRACE_EXPORT_URL, 예: http://127.0.0.1:4318/v1/traces)로 보낸다.
+  내보내기 대상이 없으면 추적하지 않는다.
+
+엔드포인트 안의 구간은 span()으로 직접 나눌 수 있다.
+    with span("convert", rows=len(rows)):
+        nodes = [Node(...) for row in rows]
+"""
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, List, Optional
+import json
+import os
+import queue
+import random
+import re
+import threading
+import time
+import urllib.request
+
+from logs import log_manager
+from services.metrics_service import statement_fingerprint, traces_total
+
+# 샘플링 비율 (0~1)
+TRACE_SAMPLE_RATE = float(os.getenv("TRACE_SAMPLE_RATE", "0.01"))
+
+# 내보내기 대상 (둘 다 비어 있으면 추적 비활성화)
+TRACE_EXPORT_FILE = os.getenv("TRACE_EXPORT_FILE", "")
+TRACE_EXPORT_URL = os.getenv("TRACE_EXPORT_URL", "")
+
+TRACE_SERVICE_NAME = os.getenv("TRACE_SERVICE_NAME", "kubernetes-docker-server")
+
+# 내보내기 대기 큐 크기 / 배치 크기 / 배치 주기(초)
+EXPORT_QUEUE_SIZE = 1000
+EXPORT_BATCH_SIZE = 100
+EXPORT_INTERVAL = 2.0
+
+# 추적 하나에 기록할 최대 스팬 수 (N+1 쿼리 등으로 스팬이 폭증할 때 메모리 제한)
+MAX_SPANS_PER_TRACE = 500
+
+# OTLP SpanKind / StatusCode
+SPAN_KIND_INTERNAL = 1
+SPAN_KIND_SERVER = 2
+SPAN_KIND_CLIENT = 3
+STATUS_UNSET = 0
+STATUS_ERROR = 2
+
+_TRACEPARENT = re.compile(r"^00-([0-9a-f]{32})-([0-9a-f]{16})-([0-9a-f]{2})$")
+
+
+class Trace:
+    __slots__ = ("trace_id", "spans", "dropped_spans")
+
+    def __init__(self, trace_id: str):
+        self.trace_id = trace_id
+        self.spans: List["Span"] = []
+        self.dropped_spans = 0
+
+
+class Span:
+    """스팬 하나 (OTLP 스팬 필드와 같은 의미)"""
+    __slots__ = ("trace", "span_id", "parent_id", "name", "kind", "start_ns", "end_ns", "attributes", "status")
+
+    def __init__(self, trace: Trace, name: str, parent_id: Optional[str] = None,
+                 kind: int = SPAN_KIND_INTERNAL, start_ns: Optional[int] = None, **attributes: Any):
+        self.trace = trace
+        self.span_id = os.urandom(8).hex()
+        self.parent_id = parent_id
+        self.name = name
+        self.kind = kind
+        self.start_ns = start_ns or time.time_ns()
+        self.end_ns: Optional[int] = None
+        self.attributes: Dict[str, Any] = attributes
+        self.status = STATUS_UNSET
+        if len(trace.spans) < MAX_SPANS_PER_TRACE:
+            trace.spans.append(self)
+        else:
+            trace.dropped_spans += 1
+
+    def child(self, name: str, kind: int = SPAN_KIND_INTERNAL, start_ns: Optional[int] = None,
+              **attributes: Any) -> "Span":
+        return Span(self.trace, name, self.span_id, kind, start_ns, **attributes)
+
+    def end(self, error: Optional[BaseException] = None) -> None:
+        if error is not None:
+            self.status = STATUS_ERROR
+            self.attributes["exception.type"] = type(error).__name__
+        self.end_ns = time.time_ns()
+
+
+_current_span: ContextVar[Optional[Span]] = ContextVar("trace_span", default=None)
+
+
+def current_span() -> Optional[Span]:
+    return _current_span.get()
+
+
+@contextmanager
+def span(name: str, start_ns: Optional[int] = None, **attributes: Any):
+    """현재 스팬의 자식 스팬 구간 (추적 중이 아니면 아무것도 하지 않음)"""
+    parent = _current_span.get()
+    if parent is None:
+        yield None
+        return
+    child = parent.child(name, start_ns=start_ns, **attributes)
+    token = _current_span.set(child)
+    try:
+        yield child
+    except BaseException as e:
+        child.end(e)
+        raise
+    else:
+        child.end()
+    finally:
+        _current_span.reset(token)
+
+
+def _attribute_value(value: Any) -> dict:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def _otlp_span(item: Span) -> dict:
+    data = {
+        "traceId": item.trace.trace_id,
+        "spanId": item.span_id,
+        "name": item.name,
+        "kind": item.kind,
+        "startTimeUnixNano": str(item.start_ns),
+        "endTimeUnixNano": str(item.end_ns or item.start_ns),
+        "attributes": [{"key": k, "value": _attribute_value(v)} for k, v in item.attributes.items() if v is not None],
+        "status": {"code": item.status},
+    }
+    if item.parent_id:
+        data["parentSpanId"] = item.parent_id
+    return data
+
+
+def to_otlp(traces: List[Trace], service_name: str = TRACE_SERVICE_NAME) -> dict:
+    """추적 목록을 OTLP/HTTP JSON(ExportTraceServiceRequest)으로 변환"""
+    return {
+        "resourceSpans": [{
+            "resource": {"attributes": [{"key": "service.name", "value": {"stringValue": service_name}}]},
+            "scopeSpans": [{
+                "scope": {"name": "services.tracing_service"},
+                "spans": [_otlp_span(item) for trace in traces for item in trace.spans],
+            }],
+        }]
+    }
+
+
+class TraceExporter:
+    """완료된 추적을 모아 배치로 내보내는 스레드 (큐가 가득 차면 버림)"""
+
+    def __init__(self, file_path: str = "", url: str = ""):
+        self.file_path = file_path
+        self.url = url
+        self._queue: "queue.Queue[Optional[Trace]]" = queue.Queue(maxsize=EXPORT_QUEUE_SIZE)
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.file_path or self.url)
+
+    def submit(self, trace: Trace) -> None:
+        if self._thread is None:
+            with self._lock:
+                if self._thread is None:
+                    self._thread = threading.Thread(target=self._run, name="trace-exporter", daemon=True)
+                    self._thread.start()
+        try:
+            self._queue.put_nowait(trace)
+        except queue.Full:
+            traces_total.labels("dropped").inc()
+
+    def stop(self) -> None:
+        """대기 중인 추적을 내보내고 종료"""
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join(EXPORT_INTERVAL * 5)
+            self._thread = None
+
+    def _run(self) -> None:
+        while True:
+            batch: List[Trace] = []
+            deadline = time.monotonic() + EXPORT_INTERVAL
+            stopping = False
+            while len(batch) < EXPORT_BATCH_SIZE:
+                try:
+                    item = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+                except queue.Empty:
+                    break
+                if item is None:
+                    stopping = True
+                    break
+                batch.append(item)
+            if batch:
+                self._export(batch)
+            if stopping:
+                return
+
+    def _export(self, batch: List[Trace]) -> None:
+        body = json.dumps(to_otlp(batch), separators=(",", ":")).encode("utf-8")
+        try:
+            if self.file_path:
+                with open(self.file_path, "ab") as f:
+                    f.write(body + b"\n")
+            if self.url:
+                request = urllib.request.Request(
+                    self.url, data=body, method="POST", headers={"Content-Type": "application/json"}
+                )
+                with urllib.request.urlopen(request, timeout=5) as response:
+                    response.read()
+            traces_total.labels("exported").inc(len(batch))
+        except Exception as e:
+            traces_total.labels("failed").inc(len(batch))
+            log_manager.logger.warning(f"추적 내보내기 실패 ({len(batch)}건): {e}", extra={"rate_limit": 0.1})
+
+
+class Tracer:
+    """요청 추적 시작/종료와 SQL 스팬 기록"""
+
+    def __init__(self, sample_rate: float = TRACE_SAMPLE_RATE, exporter: Optional[TraceExporter] = None):
+        self.sample_rate = sample_rate
+        self.exporter = exporter or TraceExporter(TRACE_EXPORT_FILE, TRACE_EXPORT_URL)
+
+    @property
+    def enabled(self) -> bool:
+        return self.exporter.enabled and self.sample_rate > 0
+
+    def start_request(self, name: str, traceparent: Optional[str] = None, **attributes: Any) -> Optional[Span]:
+        """
+        요청 루트 스팬 시작 (샘플링되지 않으면 None)
+
+        traceparent가 올바르면 그 추적 ID/부모 스팬과 sampled 플래그를 이어받는다.
+        """
+        if not self.exporter.enabled:
+            return None
+        parent_id = None
+        match = _TRACEPARENT.match(traceparent or "")
+        if match:
+            trace_id, parent_id, flags = match.groups()
+            if not int(flags, 16) & 1:
+                return None
+        else:
+            if self.sample_rate <= 0 or random.random() >= self.sample_rate:
+                return None
+            trace_id = os.urandom(16).hex()
+        traces_total.labels("sampled").inc()
+        return Span(Trace(trace_id), name, parent_id, SPAN_KIND_SERVER, **attributes)
+
+    def activate(self, root: Span):
+        return _current_span.set(root)
+
+    def finish(self, root: Span, token, error: Optional[BaseException] = None) -> None:
+        """루트 스팬 종료 후 내보내기 큐에 추가"""
+        root.end(error)
+        _current_span.reset(token)
+        if root.trace.dropped_spans:
+            root.attributes["trace.dropped_spans"] = root.trace.dropped_spans
+        self.exporter.submit(root.trace)
+
+    def instrument(self, engine) -> None:
+        """엔진에 SQL 스팬 기록 이벤트 연결"""
+        from sqlalchemy import event
+
+        @event.listens_for(engine, "before_cursor_execute")
+        def _start_query_span(conn, cursor, statement, parameters, context, executemany):
+            parent = _current_span.get()
+            if parent is not None and context is not None:
+                context._trace_span = parent.child(
+                    "db.query", SPAN_KIND_CLIENT,
+                    **{"db.system": engine.dialect.name, "db.statement": statement_fingerprint(statement),
+                       "db.executemany": executemany or None}
+                )
+
+        @event.listens_for(engine, "after_cursor_execute")
+        def _end_query_span(conn, cursor, statement, parameters, context, executemany):
+            query_span = getattr(context, "_trace_span", None)
+            if query_span is not None:
+                if cursor.rowcount is not None and cursor.rowcount >= 0:
+                    query_span.attributes["db.rowcount"] = cursor.rowcount
+                query_span.end()
+                context._trace_span = None
+
+        @event.listens_for(engine, "handle_error")
+        def _fail_query_span(exception_context):
+            context = exception_context.execution_context
+            query_span = getattr(context, "_trace_span", None)
+            if query_span is not None:
+                query_span.end(exception_context.original_exception)
+                context._trace_span = None
+
+
+tracer = Tracer()
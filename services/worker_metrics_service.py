@@ -0,0 +1,218 @@
+"""
+워커 간 지표 합산
+serve.py로 워커를 여러 개 띄우면 지표 레지스트리(/metrics)와 요청 지표(모니터링 API의 응답 시간/상태 코드)는
+워커마다 따로 쌓이고, 요청을 받은 워커 하나의 값만 응답된다.
+각 워커가 주기적으로(WORKER_SNAPSHOT_INTERVAL) 자기 값을 공유 메모리의 워커별 영역에 기록하고,
+조회하는 워커는 자기 현재 값과 다른 워커들의 최근 스냅샷을 합쳐 응답한다.
+
+- /metrics: 모든 시계열에 worker 라벨을 붙여 노출 (클러스터 합계는 sum without (worker) (...))
+- 요청 지표: 워커별 DDSketch/상태 코드 수를 그대로 병합
+
+다른 워커의 값은 최대 WORKER_SNAPSHOT_INTERVAL만큼 늦으며, WORKER_SNAPSHOT_MAX_AGE보다 오래된
+스냅샷(종료한 워커)은 제외한다. 단일 프로세스 실행(SERVER_WORKER_ID 미설정)에서는 아무것도 하지 않는다.
+"""
+from typing import Any, Dict, List, Optional, Tuple
+import asyncio
+import mmap
+import os
+import pickle
+import re
+import struct
+import time
+import zlib
+
+from logs import log_manager
+from services.metrics_service import registry
+from services.request_metrics_service import request_metrics
+from services.shared_cache_service import READ_RETRIES
+
+# 스냅샷 기록 주기 (초)
+WORKER_SNAPSHOT_INTERVAL = 5.0
+
+# 이보다 오래된 스냅샷은 종료한 워커로 보고 합산에서 제외 (초)
+WORKER_SNAPSHOT_MAX_AGE = 30.0
+
+# 워커별 영역 헤더: [seq u32][기록 시각 f64][값 길이 u32]
+_REGION = struct.Struct("<IdI")
+_unpack_seq = struct.Struct("<I").unpack_from
+
+
+class WorkerSnapshots:
+    """
+    워커별 스냅샷 영역 (각 워커는 자기 번호의 영역만 쓰고, 모든 워커가 전체를 읽음)
+
+    영역마다 쓰는 프로세스가 하나이므로 락 없이 seqlock만 사용한다.
+    값은 pickle 후 zlib으로 압축해 저장하며, 영역보다 크면 기록하지 않는다 (oversize로 집계).
+    """
+
+    def __init__(self, name: str, workers: int, region_size: int = 1 << 20):
+        self.name = name
+        self.workers = workers
+        self.region_size = region_size
+        self.capacity = region_size - _REGION.size
+        self._buf = mmap.mmap(-1, workers * region_size)
+        self._counts = {"written": 0, "oversize": 0, "out_of_range": 0}
+
+    def write(self, worker_id: int, value: Any) -> bool:
+        """worker_id 영역에 값 기록 (기록 여부 반환)"""
+        if not 0 <= worker_id < self.workers:
+            self._counts["out_of_range"] += 1
+            return False
+        payload = zlib.compress(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL), 1)
+        if len(payload) > self.capacity:
+            self._counts["oversize"] += 1
+            return False
+        buf = self._buf
+        offset = worker_id * self.region_size
+        seq = _REGION.unpack_from(buf, offset)[0]
+        struct.pack_into("<I", buf, offset, (seq + 1) & 0xFFFFFFFF)
+        buf[offset + _REGION.size:offset + _REGION.size + len(payload)] = payload
+        struct.pack_into("<dI", buf, offset + 4, time.time(), len(payload))
+        struct.pack_into("<I", buf, offset, (seq + 2) & 0xFFFFFFFF)
+        self._counts["written"] += 1
+        return True
+
+    def read_all(self, max_age: float) -> Dict[int, Any]:
+        """max_age초 안에 기록된 워커별 값 {워커 번호: 값}"""
+        buf = self._buf
+        now = time.time()
+        values = {}
+        for worker_id in range(self.workers):
+            offset = worker_id * self.region_size
+            for _ in range(READ_RETRIES):
+                seq, written_at, length = _REGION.unpack_from(buf, offset)
+                if seq & 1:
+                    continue
+                if seq == 0 or now - written_at > max_age:
+                    break
+                start = offset + _REGION.size
+                payload = buf[start:start + min(length, self.capacity)]
+                if _unpack_seq(buf, offset)[0] != seq:
+                    continue
+                try:
+                    values[worker_id] = pickle.loads(zlib.decompress(payload))
+                except Exception:
+                    pass
+                break
+        return values
+
+
+_SAMPLE_NAME = re.compile(r"[^{ ]+")
+
+
+def _add_label(line: str, label: str) -> str:
+    """시계열 줄의 라벨 목록 맨 앞에 라벨 추가"""
+    end = _SAMPLE_NAME.match(line).end()
+    if line[end:end + 1] != "{":
+        return f"{line[:end]}{{{label}}}{line[end:]}"
+    separator = "" if line[end + 1:end + 2] == "}" else ","
+    return f"{line[:end + 1]}{label}{separator}{line[end + 1:]}"
+
+
+def merge_worker_families(workers: Dict[int, List[Tuple[str, List[str]]]]) -> str:
+    """
+    워커별 지표 패밀리를 하나의 Prometheus 텍스트로 합침
+
+    모든 시계열에 worker 라벨을 붙이고, 패밀리마다 HELP/TYPE은 한 번만 쓴 뒤 워커들의 시계열을 모은다.
+    """
+    merged: Dict[str, Tuple[List[str], List[str]]] = {}
+    for worker_id in sorted(workers):
+        label = f'worker="{worker_id}"'
+        for name, lines in workers[worker_id]:
+            header, samples = merged.setdefault(name, ([], []))
+            if not header:
+                header.extend(line for line in lines if line.startswith("#"))
+            samples.extend(_add_label(line, label) for line in lines if not line.startswith("#"))
+    return "\n".join(line for header, samples in merged.values() for line in header + samples) + "\n"
+
+
+def snapshot_regions() -> int:
+    """
+    워커별 영역 수
+    serve.py는 앱을 임포트하기 전에 실제 워커 수를 WEB_CONCURRENCY로 넘기므로 그 값을 쓰고,
+    없으면 serve.py 기본 워커 수의 상한인 CPU 수를 쓴다.
+    """
+    value = os.getenv("WEB_CONCURRENCY")
+    if value:
+        return max(1, int(value))
+    return max(1, os.cpu_count() or 1)
+
+
+# fork 전에 만들어 모든 워커가 공유 (워커당 1MB, 익명 매핑이라 실제로 쓴 페이지만 메모리를 차지)
+worker_snapshots = WorkerSnapshots("worker_metrics", snapshot_regions())
+
+
+def current_worker_id() -> Optional[int]:
+    """serve.py 워커 번호 (단일 프로세스 실행이면 None)"""
+    value = os.getenv("SERVER_WORKER_ID")
+    return int(value) if value is not None else None
+
+
+class WorkerMetrics:
+    """워커별 지표 스냅샷 기록/합산"""
+
+    def __init__(self, snapshots: WorkerSnapshots = worker_snapshots,
+                 interval: float = WORKER_SNAPSHOT_INTERVAL):
+        self.snapshots = snapshots
+        self.interval = interval
+        self._task: Optional[asyncio.Task] = None
+        self._warned = False
+
+    async def start(self) -> None:
+        if self._task is None and current_worker_id() is not None:
+            request_metrics.peer_snapshots = self._peer_request_snapshots
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await asyncio.to_thread(self.publish)
+            except Exception as e:
+                log_manager.logger.error(f"워커 지표 스냅샷 기록 실패: {e}")
+            await asyncio.sleep(self.interval)
+
+    def publish(self) -> None:
+        """이 워커의 지표를 공유 영역에 기록"""
+        worker_id = current_worker_id()
+        if worker_id is None:
+            return
+        snapshot = {"metrics": registry.families(), "requests": request_metrics.snapshot()}
+        if self.snapshots.write(worker_id, snapshot) or self._warned:
+            return
+        # 매 주기 같은 경고가 쌓이지 않도록 워커마다 한 번만 기록
+        self._warned = True
+        if worker_id >= self.snapshots.workers:
+            log_manager.logger.warning(f"워커 {worker_id} 번호가 지표 스냅샷 영역 수({self.snapshots.workers})를 넘어 "
+                                       f"기록하지 못했습니다. 이 워커의 지표는 합산되지 않습니다.")
+        else:
+            log_manager.logger.warning(f"워커 {worker_id} 지표 스냅샷이 공유 영역보다 커서 기록하지 못했습니다.")
+
+    def _peers(self) -> Dict[int, Any]:
+        """다른 워커들의 최근 스냅샷"""
+        worker_id = current_worker_id()
+        return {peer: snapshot for peer, snapshot in self.snapshots.read_all(WORKER_SNAPSHOT_MAX_AGE).items()
+                if peer != worker_id}
+
+    def _peer_request_snapshots(self) -> List:
+        return [snapshot["requests"] for snapshot in self._peers().values()]
+
+    def exposition(self) -> str:
+        """Prometheus 텍스트 형식 (멀티 워커면 모든 워커의 시계열을 worker 라벨로 구분해 합침)"""
+        worker_id = current_worker_id()
+        if worker_id is None:
+            return registry.exposition()
+        workers = {peer: snapshot["metrics"] for peer, snapshot in self._peers().items()}
+        workers[worker_id] = registry.families()
+        return merge_worker_families(workers)
+
+
+worker_metrics = WorkerMetrics()
@@ -316,8 +316,17 @@ function startUserStatusTimer() {
     // 즉시 한 번 실행
     updateUserStatus();
 
-    // 1분(60000ms) 간격으로 반복 실행
-    setInterval(updateUserStatus, 60000);
+    // 실시간 스트림 연결 (연결 중에는 서버가 세션 확인/상태 갱신을 대신함)
+    if (window.LiveAPI) {
+      window.LiveAPI.connect();
+    }
+
+    // 1분(60000ms) 간격으로 반복 실행 (스트림이 끊겼을 때만)
+    setInterval(() => {
+      if (!(window.LiveAPI && window.LiveAPI.connected)) {
+        updateUserStatus();
+      }
+    }, 60000);
   }
 }
 
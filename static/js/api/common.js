@@ -19,6 +19,34 @@ function getAuthHeaders() {
   };
 }
 
+/**
+ * 조건부 GET 캐시 (URL → { etag, data })
+ * 서버가 보낸 ETag를 다음 요청의 If-None-Match로 보내고, 304 응답이면 저장해 둔 데이터를 그대로 사용한다.
+ * 로그인 사용자가 바뀌면 비운다.
+ */
+const ETAG_CACHE_LIMIT = 100;
+const etagCache = {
+  token: null,
+  entries: new Map(),
+
+  get(url) {
+    if (this.token !== getToken()) {
+      this.entries.clear();
+      this.token = getToken();
+    }
+    return this.entries.get(url);
+  },
+
+  set(url, etag, data) {
+    this.entries.delete(url);
+    this.entries.set(url, { etag, data });
+    if (this.entries.size > ETAG_CACHE_LIMIT) {
+      // 가장 오래 사용하지 않은 항목 제거 (Map은 삽입 순서 유지)
+      this.entries.delete(this.entries.keys().next().value);
+    }
+  },
+};
+
 /**
  * API 요청 공통 처리 함수
  * @param {string} url - 요청 URL
@@ -40,15 +68,32 @@ async function apiRequest(url, options = {}) {
     },
   };
 
+  // GET 요청은 이전 응답의 ETag로 재검증
+  const isGet = mergedOptions.method.toUpperCase() === "GET";
+  const cached = isGet ? etagCache.get(url) : undefined;
+  if (cached) {
+    mergedOptions.headers["If-None-Match"] = cached.etag;
+  }
+
   try {
     console.log(`🌐 [공통API] 요청: ${mergedOptions.method} ${url}`);
     const response = await fetch(url, mergedOptions);
 
+    if (response.status === 304 && cached) {
+      console.log(`♻️ [공통API] 변경 없음 (304): ${url}`);
+      etagCache.set(url, cached.etag, cached.data);
+      return cached.data;
+    }
+
     if (!response.ok) {
       throw new Error(`HTTP error! status: ${response.status}`);
     }
 
     const data = await response.json();
+    const etag = response.headers.get("ETag");
+    if (isGet && etag) {
+      etagCache.set(url, etag, data);
+    }
     console.log(`✅ [공통API] 응답: ${url}`, data);
     return data;
   } catch (error) {
@@ -21,8 +21,21 @@ window.HomeAPI = {
     if (window.StatsAPI) {
       window.StatsAPI.updateRealTimeData();
 
-      // 30초마다 데이터 자동 새로고침
+      // 실시간 메시지 수신 시 새로고침 (5초 내 여러 메시지는 한 번으로 묶음)
+      let refreshTimer = null;
+      if (window.LiveAPI) {
+        window.LiveAPI.on(["alert", "event", "node_status"], () => {
+          if (refreshTimer) return;
+          refreshTimer = setTimeout(() => {
+            refreshTimer = null;
+            window.StatsAPI.updateRealTimeData();
+          }, 5000);
+        });
+      }
+
+      // 30초마다 데이터 자동 새로고침 (실시간 스트림이 끊겼을 때만)
       setInterval(() => {
+        if (window.LiveAPI && window.LiveAPI.connected) return;
         console.log("🔄 홈 페이지 데이터 자동 새로고침");
         window.StatsAPI.updateRealTimeData();
       }, 30000);
@@ -285,8 +298,23 @@ window.HomeAPI = {
           window.StatsAPI.updateDashboardData();
           window.AlertsAPI.loadRecentAlerts();
 
-          // 5초마다 차트 및 데이터 업데이트
+          // 실시간 메시지 수신 시 업데이트 (5초 내 여러 메시지는 한 번으로 묶음)
+          let chartTimer = null;
+          if (window.LiveAPI) {
+            window.LiveAPI.on(["metric", "node_status"], () => {
+              if (chartTimer) return;
+              chartTimer = setTimeout(() => {
+                chartTimer = null;
+                self.updateCharts();
+                window.StatsAPI.updateDashboardData();
+              }, 5000);
+            });
+            window.LiveAPI.on("alert", () => window.AlertsAPI.loadRecentAlerts());
+          }
+
+          // 5초마다 차트 및 데이터 업데이트 (실시간 스트림이 끊겼을 때만)
           setInterval(() => {
+            if (window.LiveAPI && window.LiveAPI.connected) return;
             self.updateCharts();
             window.StatsAPI.updateDashboardData();
             window.AlertsAPI.loadRecentAlerts();
@@ -0,0 +1,75 @@
+/**
+ * 실시간 업데이트 API 모듈
+ * 서버가 푸시하는 알림/이벤트/노드 상태/메트릭을 Server-Sent Events로 수신
+ * 수신한 메시지는 window에 "live:<채널>" 이벤트로 전달된다.
+ */
+
+window.LiveAPI = {
+  // 구독 채널 목록
+  channels: ["alert", "event", "node_status", "metric"],
+  source: null,
+  connected: false,
+
+  /**
+   * 스트림 연결 (이미 연결되어 있으면 무시)
+   */
+  connect() {
+    if (this.source || typeof EventSource === "undefined") return;
+
+    const token = getToken();
+    if (!token) return;
+
+    const url = `/api/live/stream?token=${encodeURIComponent(token)}`;
+    this.source = new EventSource(url);
+
+    this.source.onopen = () => {
+      this.connected = true;
+      console.log("📡 [LiveAPI] 실시간 스트림 연결됨");
+    };
+
+    // 연결이 끊기면 브라우저가 retry 간격 후 자동 재연결
+    this.source.onerror = () => {
+      this.connected = false;
+    };
+
+    this.channels.forEach((channel) => {
+      this.source.addEventListener(channel, (e) => {
+        window.dispatchEvent(
+          new CustomEvent(`live:${channel}`, { detail: JSON.parse(e.data) })
+        );
+      });
+    });
+
+    // 세션 만료 시 로그아웃 처리
+    this.source.addEventListener("session_expired", () => {
+      console.log("토큰 만료, 로그아웃 처리");
+      this.disconnect();
+      localStorage.removeItem("access_token");
+      sessionStorage.removeItem("access_token");
+      localStorage.removeItem("rememberedUser");
+      window.location.href = "/";
+    });
+  },
+
+  /**
+   * 스트림 연결 해제
+   */
+  disconnect() {
+    if (this.source) {
+      this.source.close();
+      this.source = null;
+    }
+    this.connected = false;
+  },
+
+  /**
+   * 채널 메시지 수신 등록
+   * @param {string|Array<string>} channels - 채널 이름 (또는 배열)
+   * @param {Function} handler - 메시지 데이터를 받는 콜백
+   */
+  on(channels, handler) {
+    [].concat(channels).forEach((channel) => {
+      window.addEventListener(`live:${channel}`, (e) => handler(e.detail, channel));
+    });
+  },
+};
@@ -196,9 +196,24 @@ window.MonitoringAPI = {
   async getMetrics() {
     try {
       console.log("📈 [메트릭 수집기] 모든 메트릭 데이터 수집 시작...");
-      console.log("📈 [메트릭 수집기] 병렬로 4개 API 요청 실행 중...");
 
+      // 통합 API 한 번으로 조회 (실패 시 개별 API로 대체)
       const startTime = Date.now();
+      try {
+        const combined = await apiGet("/api/monitoring/all");
+        if (combined.success && combined.data) {
+          console.log(
+            "📈 [메트릭 수집기] 통합 API 응답 완료:",
+            Date.now() - startTime + "ms"
+          );
+          return combined.data;
+        }
+        console.warn("⚠️ [메트릭 수집기] 통합 API 실패:", combined.message);
+      } catch (error) {
+        console.warn("⚠️ [메트릭 수집기] 통합 API 요청 실패:", error);
+      }
+
+      console.log("📈 [메트릭 수집기] 병렬로 4개 API 요청 실행 중...");
       const [networkData, diskData, responseData, statusData] =
         await Promise.all([
           this.getNetworkTrafficData(),
@@ -382,9 +382,33 @@ window.MonitoringCharts = {
    * 모든 모니터링 차트 초기화
    */
   initAllCharts() {
-    this.initNetworkTrafficChart();
-    this.initDiskIoChart();
-    this.initResponseTimeChart();
-    this.initRequestStatusChart();
+    if (typeof Chart === "undefined") {
+      console.error("Chart.js가 로드되지 않았습니다.");
+      return;
+    }
+    if (!window.MonitoringAPI) return;
+
+    // 4개 차트 데이터를 통합 API 한 번으로 받아 그린다
+    window.MonitoringAPI.getMetrics().then((metrics) => {
+      const charts = [
+        ["networkTrafficChart", "networkTraffic", this.createNetworkTrafficChart],
+        ["diskIoChart", "diskIo", this.createDiskIoChart],
+        ["responseTimeChart", "responseTime", this.createResponseTimeChart],
+        ["requestStatusChart", "requestStatus", this.createRequestStatusChart],
+      ];
+
+      charts.forEach(([canvasId, key, createChart]) => {
+        const ctx = document.getElementById(canvasId);
+        if (!ctx) return;
+
+        const data = metrics && metrics[key];
+        if (data) {
+          createChart.call(this, ctx, data);
+        } else {
+          ctx.innerHTML =
+            '<div class="text-center text-muted py-4">데이터를 불러올 수 없습니다.</div>';
+        }
+      });
+    });
   },
 };